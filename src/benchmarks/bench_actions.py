@@ -0,0 +1,90 @@
+"""
+Action decoding throughput: generic per-action path (``cls.parse`` plus
+chained setters for every action) vs. the inline PlayerInput fast path, for
+a list of objects and for columnar rows. Only the action loop is timed; the
+replay is inflated and its room decoded once beforehand. Also times a whole
+parse against a chat-only one (``types={"ChatMessage"}``). Usage, from src/:
+
+    python -m benchmarks.bench_actions [actions] [repeat]
+"""
+
+import sys
+import time
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.action_table import ActionTable
+from haxmetrics.parser import Parser
+
+
+def prepared(data):
+    """Parser and the position where its actions start."""
+    parser = Parser(data)
+    reader = parser.inflate()
+    parser.parse_state(reader)
+    return parser, reader, reader.position
+
+
+def run(data, decode, repeat):
+    parser, reader, start = prepared(data)
+    best = float("inf")
+    for _ in range(repeat):
+        reader.set_position(start)
+        begin = time.perf_counter()
+        count = decode(parser, reader)
+        best = min(best, time.perf_counter() - begin)
+    return count, best
+
+
+def generic_list(parser, reader):
+    return len(list(parser._iter_actions_generic(reader)))
+
+
+def inline_list(parser, reader):
+    return len(list(parser._iter_actions_inline(reader)))
+
+
+def generic_table(parser, reader):
+    return len(ActionTable.from_actions(parser._iter_actions_generic(reader)))
+
+
+def inline_table(parser, reader):
+    table = ActionTable()
+    for action in parser._iter_actions_inline(reader, table):
+        table.append(action)
+    return len(table)
+
+
+def main(actions=200_000, repeat=5):
+    data = build_replay(actions)
+    print(f"{actions} actions, best of {repeat}")
+    print(f"  {'path':<16} {'before':>14} {'after':>14} {'speedup':>8}")
+    for name, before, after in (
+        ("list", generic_list, inline_list),
+        ("columnar", generic_table, inline_table),
+    ):
+        count, slow = run(data, before, repeat)
+        same, fast = run(data, after, repeat)
+        assert count == same
+        print(
+            f"  {name:<16} {count / slow:>10,.0f} a/s {count / fast:>10,.0f} a/s "
+            f"{slow / fast:>7.2f}x"
+        )
+
+    full, chat = (
+        min(timed(lambda: Parser(data).parse(**options)) for _ in range(repeat))
+        for options in ({}, {"types": {"ChatMessage"}})
+    )
+    print(
+        f"  {'chat only':<16} {full * 1e3:>10.1f} ms {chat * 1e3:>10.1f} ms "
+        f"{full / chat:>7.2f}x"
+    )
+
+
+def timed(function):
+    begin = time.perf_counter()
+    function()
+    return time.perf_counter() - begin
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""
+Batch simulation speed: ``games`` synthetic replays of the same stadium
+simulated one after the other with Simulator.run, then together with
+BatchSimulator.run (one shared physics step per tick).
+Usage, from src/:
+
+    python -m benchmarks.bench_batch [games] [actions] [repeat]
+"""
+
+import sys
+import time
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.parser import Parser
+from haxmetrics.sim.batch import BatchSimulator
+from haxmetrics.sim.simulator import Simulator
+
+
+def one_by_one(replays):
+    trajectories = []
+    for replay in replays:
+        simulator = Simulator.from_replay(replay)
+        simulator.start()
+        trajectories.append(simulator.run(replay["actions"], until=replay["duration"]))
+    return trajectories
+
+
+def lockstep(replays):
+    batch = BatchSimulator.from_replays(replays)
+    for simulator in batch.simulators:
+        simulator.start()
+    return batch.run(
+        [replay["actions"] for replay in replays],
+        until=[replay["duration"] for replay in replays],
+    )
+
+
+def main(games=16, actions=1000, repeat=3):
+    replays = [
+        Parser(build_replay(actions, seed=seed)).parse() for seed in range(games)
+    ]
+    ticks = sum(replay["duration"] for replay in replays)
+    print(f"{games} replays, {actions} actions each, {ticks} ticks, best of {repeat}")
+    for name, function in (("one by one", one_by_one), ("lockstep", lockstep)):
+        times = []
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            function(replays)
+            times.append(time.perf_counter() - begin)
+        elapsed = min(times)
+        print(
+            f"  {name:<10} {elapsed:6.2f} s  {ticks / elapsed:>8.0f} ticks/s  "
+            f"{ticks / 60 / elapsed:>7.1f}x realtime"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,56 @@
+"""
+Loading a replay back: re-parsing the .hbr2, reading its NDJSON export and
+loading its columnar export (.npz, plus Arrow when pyarrow is installed).
+Usage, from src/:
+
+    python -m benchmarks.bench_export [actions] [repeat]
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.io.columnar import _pyarrow, export_columns, read_tables
+from haxmetrics.io.ndjson import export_ndjson
+from haxmetrics.parser import Parser
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - begin)
+    return min(times)
+
+
+def main(actions=200_000, repeat=5):
+    data = build_replay(actions)
+    out = io.BytesIO()
+    export_ndjson(data, out)
+    ndjson = out.getvalue()
+
+    print(f"{actions} actions, best of {repeat}")
+    rows = [
+        ("parse .hbr2", lambda: Parser(data).parse(columnar=True)),
+        ("ndjson", lambda: [json.loads(line) for line in ndjson.splitlines()]),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        formats = ["npz"] + (["arrow", "parquet"] if _pyarrow(required=False) else [])
+        for format in formats:
+            path = export_columns(data, os.path.join(tmp, format), format)
+            rows.append((format, lambda path=path: read_tables(path)))
+
+        baseline = None
+        for name, function in rows:
+            elapsed = best(function, repeat)
+            baseline = baseline or elapsed
+            print(f"  {name:<12} {elapsed * 1e3:>10.1f} ms {baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
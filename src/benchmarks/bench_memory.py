@@ -0,0 +1,110 @@
+"""
+Memory per parsed model object: slotted classes vs. the same fields stored in
+a per-instance __dict__ (the layout the models used before __slots__).
+
+Both layouts are filled with the very same field values, so the difference
+is only the per-object overhead. Also compares PlayerInput objects with the
+run-length encoded input timelines. Usage, from src/:
+
+    python -m benchmarks.bench_memory [actions] [stadium_elements]
+"""
+
+import contextlib
+import io
+import sys
+import tracemalloc
+from collections import defaultdict
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.parser import Parser
+
+
+def slot_names(cls):
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in getattr(klass, "__slots__", ()):
+            if name not in names:
+                names.append(name)
+    return names
+
+
+_DICT_CLASSES = {}
+
+
+def dict_class(cls):
+    """Plain class with the same name and an instance __dict__."""
+    if cls not in _DICT_CLASSES:
+        _DICT_CLASSES[cls] = type(cls.__name__, (), {})
+    return _DICT_CLASSES[cls]
+
+
+def clone(obj, target):
+    copy = object.__new__(target)
+    for name in slot_names(type(obj)):
+        if hasattr(obj, name):
+            setattr(copy, name, getattr(obj, name))
+    return copy
+
+
+def measure(objects, as_dict):
+    """Bytes allocated to rebuild ``objects`` in the chosen layout."""
+    clones = [None] * len(objects)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i, obj in enumerate(objects):
+        clones[i] = clone(obj, dict_class(type(obj)) if as_dict else type(obj))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def report(title, groups):
+    print(title)
+    print(f"  {'class':<20} {'count':>8} {'__dict__':>10} {'slots':>10} {'saved':>7}")
+    for name, objects in sorted(groups.items(), key=lambda item: -len(item[1])):
+        measure(objects[:1], True)  # Warm-up: crea la clase y sus claves compartidas
+        as_dict = measure(objects, True) / len(objects)
+        slotted = measure(objects, False) / len(objects)
+        saved = 100 * (1 - slotted / as_dict)
+        sizes = f"{as_dict:>9.1f}B {slotted:>9.1f}B {saved:>6.1f}%"
+        print(f"  {name:<20} {len(objects):>8} {sizes}")
+    print()
+
+
+def main(actions=200_000, elements=255):
+    data = build_replay(actions, elements)
+    with contextlib.redirect_stdout(io.StringIO()):
+        replay = Parser(data).parse()
+
+    by_type = defaultdict(list)
+    for action in replay["actions"]:
+        by_type[type(action).__name__].append(action)
+    report(f"Bytes per action ({len(replay['actions'])} actions)", by_type)
+
+    inputs = by_type["PlayerInput"]
+    timelines = Parser(data).parse_input_timelines()
+    as_objects = measure(inputs, False) + 8 * len(inputs)  # + puntero en la lista
+    as_timelines = sum(t.nbytes() for t in timelines.values())
+    runs = sum(len(t) for t in timelines.values())
+    print(f"PlayerInput storage ({len(inputs)} inputs, {runs} runs)")
+    print(f"  objects   {as_objects:>12} B")
+    print(
+        f"  timelines {as_timelines:>12} B ({as_objects / as_timelines:.1f}x smaller)"
+    )
+    print()
+
+    stadium = replay["room_info"].stadium
+    elements_by_type = {
+        "Vertex": stadium.vertexes,
+        "Segment": stadium.segments,
+        "Plane": stadium.planes,
+        "Disc": stadium.discs,
+        "Joint": stadium.joints,
+    }
+    report(
+        "Bytes per stadium element", {k: v for k, v in elements_by_type.items() if v}
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
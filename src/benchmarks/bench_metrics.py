@@ -0,0 +1,40 @@
+"""
+Metric engine cost: every parse-only metric computed in one pass over the
+replay (MetricEngine.parse) against one pass per metric.
+Usage, from src/:
+
+    python -m benchmarks.bench_metrics [actions] [repeat]
+"""
+
+import sys
+import time
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.metrics import REGISTRY, MetricEngine
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - begin)
+    return min(times)
+
+
+def main(actions=100_000, repeat=3):
+    data = build_replay(actions)
+    names = [name for name in REGISTRY if not MetricEngine([name]).simulates]
+    engines = [MetricEngine([name]) for name in names]
+    together = MetricEngine(names)
+    listed = ", ".join(names)
+    print(f"{actions} actions, {len(names)} metrics ({listed}), best of {repeat}")
+
+    separate = best(lambda: [engine.parse(data) for engine in engines], repeat)
+    single = best(lambda: together.parse(data), repeat)
+    print(f"  one pass per metric  {separate * 1000:8.1f} ms")
+    print(f"  single pass          {single * 1000:8.1f} ms  ({separate / single:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
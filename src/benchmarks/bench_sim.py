@@ -0,0 +1,53 @@
+"""
+Replay simulation speed: ticks per second of Simulator.run on a synthetic
+replay, and how many times faster than the 60 ticks/s of a live game.
+``elements`` sets the stadium vertexes and segments (up to 255 each); past
+GRID_MIN_ELEMENTS the uniform grid keeps the cost per tick flat.
+
+The default run (4000 actions, 10025 ticks, 9 discs and a chain of 7
+joints) measured 52-83x realtime, best of 5 on one noisy core, with the
+contacts and joints resolved in the JS order: the joint chain runs one
+joint at a time on Python numbers, about a fifth of the step.
+
+Usage, from src/:
+
+    python -m benchmarks.bench_sim [actions] [repeat] [elements]
+"""
+
+import sys
+import time
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.parser import Parser
+from haxmetrics.sim.simulator import Simulator
+
+
+def simulate(replay):
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    return simulator.run(replay["actions"], until=replay["duration"])
+
+
+def main(actions=4000, repeat=3, elements=64):
+    replay = Parser(build_replay(actions, elements=elements)).parse()
+    simulator = Simulator.from_replay(replay)
+    print(
+        f"{actions} actions, {replay['duration']} ticks, {len(simulator.world)} discs, "
+        f"{len(simulator.world.geometry.segment_b_coef)} segments, best of {repeat}"
+    )
+
+    times = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        trajectory = simulate(replay)
+        times.append(time.perf_counter() - begin)
+    elapsed = min(times)
+    ticks = len(trajectory) - 1
+    print(
+        f"  {elapsed:.2f} s  {ticks / elapsed:>8.0f} ticks/s  "
+        f"{ticks / 60 / elapsed:>6.1f}x realtime"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,289 @@
+"""
+Synthetic .hbr2 replays for benchmarks and tests.
+
+ReplayWriter mirrors BinaryReader so that every field written here is read
+back by the same model parse() methods. build_replay() assembles a full
+replay: header, messages, room with a custom stadium, and an action stream
+dominated by PlayerInput like real matches.
+"""
+
+import random
+import struct
+import zlib
+from typing import List, Optional, Sequence, Tuple
+
+
+class ReplayWriter:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write_byte(self, value: int):
+        self.data.append(value & 0xFF)
+        return self
+
+    def write_uint16_be(self, value: int):
+        self.data += struct.pack(">H", value)
+        return self
+
+    def write_uint16(self, value: int):
+        self.data += struct.pack("<H", value)
+        return self
+
+    def write_int32(self, value: int):
+        self.data += struct.pack("<i", value)
+        return self
+
+    def write_int32_be(self, value: int):
+        self.data += struct.pack(">i", value)
+        return self
+
+    def write_uint32(self, value: int):
+        self.data += struct.pack("<I", value)
+        return self
+
+    def write_uint32_be(self, value: int):
+        self.data += struct.pack(">I", value)
+        return self
+
+    def write_float_le(self, value: float):
+        self.data += struct.pack("<f", value)
+        return self
+
+    def write_double_be(self, *values: float):
+        self.data += struct.pack(f">{len(values)}d", *values)
+        return self
+
+    def write_varint(self, value: int):
+        while True:
+            byte = value & 0x7F
+            value >>= 7
+            if value:
+                self.data.append(byte | 0x80)
+            else:
+                self.data.append(byte)
+                return self
+
+    def write_string(self, value: Optional[str]):
+        if value is None:
+            return self.write_varint(0)
+        raw = value.encode("utf-8")
+        self.write_varint(len(raw) + 1)
+        self.data += raw
+        return self
+
+    def write_nullable_string(self, value: Optional[str]):
+        if value is None:
+            return self.write_byte(0)
+        return self.write_byte(1).write_string(value)
+
+    def write_bytes(self, raw: bytes):
+        self.data += raw
+        return self
+
+
+def deflate_raw(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return compressor.compress(bytes(data)) + compressor.flush()
+
+
+def write_stadium(
+    w: ReplayWriter,
+    name: str = "Synthetic",
+    vertexes: Sequence[Tuple[float, float]] = (),
+    segments: Sequence[Tuple[int, int, float]] = (),
+    planes: Sequence[Tuple[float, float, float]] = (),
+    discs: Sequence[Tuple[float, float, float]] = (),
+    joints: Sequence[Tuple[int, int, float]] = (),
+    goals: Sequence[Tuple[float, float, float, float, int]] = (),
+    width: float = 420.0,
+    height: float = 200.0,
+    spawn_distance: float = 170.0,
+    player_physics: Sequence[float] = (0.5, 0.5, 0.96, 0.1, 0.07, 0.96, 5.0, 0.0, 0.0),
+    player_radius: float = 15.0,
+    mask: int = 63,
+    group: int = 32,
+) -> ReplayWriter:
+    """
+    Custom stadium (type 255). Vertexes are (x, y), segments (v0, v1, curve),
+    planes (normal_x, normal_y, dist), discs (x, y, radius), joints
+    (disc1, disc2, length) and goals (x0, y0, x1, y1, team byte). The ball
+    (q.rg) is written as disc 0, before ``discs``; joint indexes count
+    from the first of ``discs``. Curves
+    are degrees, stored as the game does after I.Vc: endpoints swapped for
+    negative curves and the cotangent of half the arc.
+    """
+    import math
+
+    w.write_byte(255).write_string(name)
+    # Background
+    w.write_uint32_be(1).write_double_be(width, height, 75.0, 0.0, 0.0)
+    w.write_uint32_be(0x718C5A)
+    # Width/height, spawn distance, player physics (cc.ma: 7 doubles and
+    # gravity, cGroup, radius, kickback)
+    w.write_double_be(width, height).write_double_be(spawn_distance)
+    w.write_double_be(*player_physics).write_int32_be(0)
+    w.write_double_be(player_radius, 0.0)
+    # Max view override (uint16), camera follow, can be stored, full reset
+    w.write_uint16_be(0).write_byte(1).write_byte(1).write_byte(0)
+
+    w.write_byte(len(vertexes))
+    for x, y in vertexes:
+        w.write_double_be(x, y, 1.0).write_int32_be(mask).write_int32_be(group)
+    w.write_byte(len(segments))
+    for v0, v1, curve in segments:
+        # I.ma: flags (2 curva, 4 color, 8 visible), vértices y campos
+        angle = math.radians(curve)
+        if angle < 0:
+            angle, v0, v1 = -angle, v1, v0
+        curved = 0.17435839227423353 < angle < 5.934119456780721
+        w.write_byte((2 if curved else 0) | 4 | 8).write_byte(v0).write_byte(v1)
+        if curved:
+            w.write_double_be(1 / math.tan(angle / 2))
+        w.write_uint32_be(0xFFFFFF).write_double_be(1.0)
+        w.write_int32_be(mask).write_int32_be(group)
+    w.write_byte(len(planes))
+    for normal_x, normal_y, dist in planes:
+        w.write_double_be(normal_x, normal_y, dist, 1.0)
+        w.write_int32_be(mask).write_int32_be(group)
+    w.write_byte(len(goals))
+    for x0, y0, x1, y1, team in goals:
+        w.write_double_be(x0, y0, x1, y1).write_byte(team)
+    w.write_byte(len(discs) + 1)
+    w.write_double_be(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 10.0, 0.5, 1.0, 0.99)
+    w.write_uint32_be(0xFFFFFF).write_int32_be(63).write_int32_be(193)
+    for x, y, radius in discs:
+        w.write_double_be(x, y, 0.0, 0.0, 0.0, 0.0, radius, 0.5, 1.0, 0.99)
+        w.write_uint32_be(0xFFFFFF).write_int32_be(mask).write_int32_be(1)
+    w.write_byte(len(joints))
+    for disc1, disc2, length in joints:
+        w.write_byte(disc1 + 1).write_byte(disc2 + 1)
+        w.write_double_be(length, length, float("inf")).write_int32_be(0)
+    # Spawn points (red, blue)
+    w.write_byte(0).write_byte(0)
+    return w
+
+
+def write_player(w: ReplayWriter, player_id: int, name: str, team: int) -> ReplayWriter:
+    w.write_int32(player_id).write_string(name).write_byte(0).write_byte(team)
+    w.write_byte(0).write_string("").write_int32(0).write_byte(0).write_byte(0)
+    w.write_string("es").write_int32(player_id)
+    return w
+
+
+def write_room(
+    w: ReplayWriter,
+    players: Sequence[Tuple[int, str, int]] = (),
+    **stadium,
+) -> ReplayWriter:
+    w.write_string("Synthetic room").write_byte(1)
+    w.write_uint32_be(3).write_uint32_be(3)
+    w.write_uint16_be(2).write_byte(0).write_byte(2)
+    write_stadium(w, **stadium)
+    w.write_byte(0)  # Game not active
+    w.write_byte(len(players))
+    for player_id, name, team in players:
+        write_player(w, player_id, name, team)
+    for _ in range(2):  # Team colors
+        w.write_uint32_be(0).write_uint32_be(0xFFFFFF).write_byte(1)
+        w.write_uint32_be(0xE56E56)
+    return w
+
+
+def write_action(
+    w: ReplayWriter, delta: int, sender: int, type_id: int
+) -> ReplayWriter:
+    return w.write_varint(delta).write_uint16_be(sender).write_byte(type_id)
+
+
+def stadium_geometry(elements: int) -> dict:
+    """A closed polygon field with ``elements`` vertexes/segments (max 255)."""
+    import math
+
+    vertexes = [
+        (
+            380.0 * math.cos(2 * math.pi * i / elements),
+            180.0 * math.sin(2 * math.pi * i / elements),
+        )
+        for i in range(elements)
+    ]
+    segments = [(i, (i + 1) % elements, 0.0) for i in range(elements)]
+    planes = [
+        (0.0, 1.0, -200.0),
+        (0.0, -1.0, -200.0),
+        (1.0, 0.0, -420.0),
+        (-1.0, 0.0, -420.0),
+    ]
+    # Posts on every 8th vertex, chained by joints
+    discs = [(x, y, 8.0) for x, y in vertexes[::8]]
+    joints = [(i, i + 1, 50.0) for i in range(len(discs) - 1)]
+    return {
+        "vertexes": vertexes,
+        "segments": segments,
+        "planes": planes,
+        "discs": discs,
+        "joints": joints,
+    }
+
+
+def build_actions(
+    w: ReplayWriter,
+    count: int,
+    senders: Sequence[int] = (1, 2, 3, 4),
+    seed: int = 1234,
+) -> List[Tuple[int, int, int]]:
+    """
+    Write ``count`` actions: ~95% PlayerInput, plus chat, pings and disc
+    updates. Returns the (frame, sender, type) of every action written.
+    """
+    rng = random.Random(seed)
+    written = []
+    frame = 0
+    for _ in range(count):
+        delta = rng.choice((0, 1, 1, 2, 3, 8))
+        frame += delta
+        sender = rng.choice(senders)
+        roll = rng.random()
+        if roll < 0.95:
+            write_action(w, delta, sender, 3).write_uint32(rng.randrange(32))
+            written.append((frame, sender, 3))
+        elif roll < 0.97:
+            write_action(w, delta, sender, 4).write_string(f"gg {rng.randrange(100)}")
+            written.append((frame, sender, 4))
+        elif roll < 0.99:
+            write_action(w, delta, 0, 17).write_varint(len(senders))
+            for _ in senders:
+                w.write_varint(rng.randrange(200))
+            written.append((frame, 0, 17))
+        else:
+            write_action(w, delta, 0, 23)
+            w.write_int32(rng.randrange(8)).write_byte(0).write_uint16(0b11)
+            w.write_float_le(rng.uniform(-300, 300)).write_float_le(
+                rng.uniform(-150, 150)
+            )
+            written.append((frame, 0, 23))
+    return written
+
+
+def build_replay(
+    actions: int = 10_000,
+    elements: int = 64,
+    players: Sequence[Tuple[int, str, int]] = (
+        (1, "alpha", 1),
+        (2, "beta", 1),
+        (3, "gamma", 2),
+        (4, "delta", 2),
+    ),
+    version: int = 3,
+    seed: int = 1234,
+) -> bytes:
+    """Full .hbr2 file with a custom stadium and ``actions`` actions."""
+    w = ReplayWriter()
+    w.write_uint16_be(0)  # No messages
+    write_room(w, players=players, **stadium_geometry(elements))
+    written = build_actions(
+        w, actions, senders=[p[0] for p in players] or (1,), seed=seed
+    )
+
+    duration = written[-1][0] if written else 0
+    header = b"HBR2" + struct.pack(">II", version, duration)
+    return header + deflate_raw(w.data)
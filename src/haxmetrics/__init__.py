@@ -0,0 +1,7 @@
+"""HaxMetrics: decode HaxBall .hbr2 replays and compute metrics."""
+
+from haxmetrics.batch import parse_many
+from haxmetrics.cache import ParseCache
+from haxmetrics.parser import Parser
+
+__all__ = ["ParseCache", "Parser", "parse_many"]
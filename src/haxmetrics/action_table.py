@@ -0,0 +1,218 @@
+# haxmetrics/action_table.py
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, cast
+
+from haxmetrics.models.action import Action
+from haxmetrics.models.action_types import ACTION_TYPE_IDS
+from haxmetrics.models.actions.disc_update import (
+    FIELDS_MASK,
+    FLOAT_FIELDS,
+    INT_FIELDS,
+    DiscUpdate,
+)
+from haxmetrics.models.actions.player_input import PlayerInput
+
+PLAYER_INPUT = ACTION_TYPE_IDS[PlayerInput]
+DISC_UPDATE = ACTION_TYPE_IDS[DiscUpdate]
+
+NAN = float("nan")
+
+
+class ActionTable:
+    """
+    Columnar store for the actions of a replay.
+
+    Every row has a frame (uint32), sender (uint16) and type id (uint8, index
+    in ACTION_TYPES) plus an index into the payload column of its type:
+
+    - PlayerInput: ``inputs`` (uint32)
+    - DiscUpdate: ``disc_ids`` (int32), ``disc_player`` (uint8),
+      ``disc_mask`` (uint16, null mask: bit i set when field i is present),
+      ``disc_floats`` (float32, 10 per row, NaN when absent) and
+      ``disc_ints`` (int32, 3 per row, 0 when absent)
+    - any other type: the Action object itself in ``objects`` (rare types)
+
+    Action objects are only built when a row is indexed, so the table can
+    stand in for the ``actions`` list of a parsed replay.
+    """
+
+    def __init__(self) -> None:
+        self.frames = array("I")
+        self.senders = array("H")
+        self.types = array("B")
+        self.payload = array("I")  # Fila -> índice en la columna de su tipo
+
+        self.inputs = array("I")
+
+        self.disc_ids = array("i")
+        self.disc_player = array("B")
+        self.disc_mask = array("H")
+        self.disc_floats = array("f")
+        self.disc_ints = array("i")
+
+        self.objects: List[Action] = []
+
+    @classmethod
+    def from_actions(cls, actions: Iterable[Action]) -> "ActionTable":
+        table = cls()
+        for action in actions:
+            table.append(action)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[Action]:
+        for row in range(len(self.types)):
+            yield self[row]
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self.types)))]
+        return self.build(row)
+
+    def append(self, action: Action) -> None:
+        frame, sender = action.frame, action.sender
+        if frame is None or sender is None:
+            raise ValueError(f"{type(action).__name__} without a frame or sender")
+        type_id = ACTION_TYPE_IDS[type(action)]
+        if type_id == PLAYER_INPUT:
+            self.append_input(frame, sender, cast(PlayerInput, action).input)
+        elif type_id == DISC_UPDATE:
+            self._append_row(frame, sender, type_id, len(self.disc_ids))
+            self._append_disc_update(cast(DiscUpdate, action))
+        else:
+            self._append_row(frame, sender, type_id, len(self.objects))
+            self.objects.append(action)
+
+    def append_input(self, frame: int, sender: int, input_: int) -> None:
+        """Append a PlayerInput row without an intermediate object."""
+        self._append_row(frame, sender, PLAYER_INPUT, len(self.inputs))
+        self.inputs.append(input_)
+
+    def _append_row(self, frame: int, sender: int, type_id: int, index: int) -> None:
+        self.frames.append(frame)
+        self.senders.append(sender)
+        self.types.append(type_id)
+        self.payload.append(index)
+
+    def _append_disc_update(self, action: DiscUpdate) -> None:
+        fields = action.fields()
+        self.disc_floats.extend(NAN if v is None else v for v in fields[:FLOAT_FIELDS])
+        self.disc_ints.extend(0 if v is None else int(v) for v in fields[FLOAT_FIELDS:])
+        self.disc_ids.append(action.disc_id)
+        self.disc_player.append(action.is_player_disc)
+        self.disc_mask.append(action.flags & FIELDS_MASK)
+
+    def build(self, row: int) -> Action:
+        """Build the Action object for ``row``."""
+        type_id = self.types[row]
+        index = self.payload[row]
+
+        action: Action
+        if type_id == PLAYER_INPUT:
+            action = PlayerInput()
+            action.input = self.inputs[index]
+        elif type_id == DISC_UPDATE:
+            action = self._build_disc_update(index)
+        else:
+            return self.objects[index]
+
+        action.frame = self.frames[row]
+        action.sender = self.senders[row]
+        return action
+
+    def _build_disc_update(self, index: int) -> DiscUpdate:
+        action = DiscUpdate()
+        action.disc_id = self.disc_ids[index]
+        action.is_player_disc = bool(self.disc_player[index])
+
+        mask = self.disc_mask[index]
+        fields = (
+            self.disc_floats[index * FLOAT_FIELDS : (index + 1) * FLOAT_FIELDS].tolist()
+            + self.disc_ints[index * INT_FIELDS : (index + 1) * INT_FIELDS].tolist()
+        )
+        action.flags = mask
+        action.values = tuple(v for i, v in enumerate(fields) if mask & (1 << i))
+        return action
+
+    # Tipo NumPy de cada columna (array.array guarda el mismo ancho)
+    DTYPES = {
+        "frames": "uint32",
+        "senders": "uint16",
+        "types": "uint8",
+        "payload": "uint32",
+        "inputs": "uint32",
+        "disc_ids": "int32",
+        "disc_player": "uint8",
+        "disc_mask": "uint16",
+        "disc_floats": "float32",
+        "disc_ints": "int32",
+    }
+
+    def _views(self, *names: str) -> List[Any]:
+        """
+        Zero-copy NumPy views of some columns, for use within a method: while
+        a view is alive its array.array cannot grow (append raises BufferError).
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("ActionTable.to_numpy requires numpy") from e
+        return [
+            np.frombuffer(getattr(self, name), dtype=self.DTYPES[name])
+            for name in names
+        ]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        NumPy copies of the columns, so the table can still be appended to.
+        ``disc_floats`` and ``disc_ints`` come as (rows, 10) and (rows, 3)
+        matrices.
+        """
+        columns = {
+            name: view.copy()
+            for name, view in zip(self.DTYPES, self._views(*self.DTYPES))
+        }
+        columns["disc_floats"] = columns["disc_floats"].reshape(-1, 10)
+        columns["disc_ints"] = columns["disc_ints"].reshape(-1, 3)
+        return columns
+
+    def select(
+        self, type_: Optional[Type[Action]] = None, sender: Optional[int] = None
+    ):
+        """Row indices (NumPy array) matching an action class and/or sender."""
+        import numpy as np
+
+        types, senders = self._views("types", "senders")
+        keep = np.ones(len(self), dtype=bool)
+        if type_ is not None:
+            keep &= types == ACTION_TYPE_IDS[type_]
+        if sender is not None:
+            keep &= senders == sender
+        return np.flatnonzero(keep)
+
+    def inputs_of(self, sender: int):
+        """(frames, inputs) NumPy arrays with every PlayerInput of ``sender``."""
+        frames, inputs, payload = self._views("frames", "inputs", "payload")
+        rows = self.select(PlayerInput, sender)
+        return frames[rows], inputs[payload[rows]]
+
+    def nbytes(self) -> int:
+        """Bytes used by the typed columns (rare-type objects not included)."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self.frames,
+                self.senders,
+                self.types,
+                self.payload,
+                self.inputs,
+                self.disc_ids,
+                self.disc_player,
+                self.disc_mask,
+                self.disc_floats,
+                self.disc_ints,
+            )
+        )
@@ -0,0 +1,213 @@
+# haxmetrics/batch.py
+
+import logging
+import os
+import time
+from collections import Counter
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from haxmetrics.action_table import ActionTable
+from haxmetrics.binary_reader import StringPool
+from haxmetrics.instrumentation import ParseStats
+from haxmetrics.models.action_types import ACTION_TYPES
+from haxmetrics.parser import Parser
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+
+def summarize(replay: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compact, cheap to pickle summary of a parsed replay (default reduce).
+    With an ActionTable (parse_many parses columnar for it) the actions are
+    counted from its type column, without building them.
+    """
+    room = replay["room_info"]
+    actions = replay["actions"]
+    if isinstance(actions, ActionTable):
+        counts = Counter(actions.types)
+        action_counts = {
+            ACTION_TYPES[type_id].__name__: count
+            for type_id, count in sorted(counts.items())
+        }
+    else:
+        action_counts = dict(Counter(type(action).__name__ for action in actions))
+
+    return {
+        "version": replay["version"],
+        "duration": replay["duration"],
+        "room": room.name if room else None,
+        "stadium": room.stadium.name if room and room.stadium else None,
+        "players": [(p.id, p.name, p.team) for p in replay["players"]],
+        "messages": len(replay["messages"]),
+        "actions": len(replay["actions"]),
+        "actionCounts": action_counts,
+    }
+
+
+class BatchResult:
+    """
+    Output of parse_many: one ``(path, value)`` per replay parsed, in input
+    order, ``(path, error message)`` for the ones that failed, and the
+    throughput of the whole batch.
+    """
+
+    __slots__ = ("results", "errors", "elapsed", "bytes_read", "stats")
+
+    def __init__(self):
+        self.results: List[Tuple[str, Any]] = []
+        self.errors: List[Tuple[str, str]] = []
+        self.elapsed = 0.0
+        self.bytes_read = 0
+        self.stats: Optional[ParseStats] = None
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    @property
+    def replays_per_second(self) -> float:
+        count = len(self.results) + len(self.errors)
+        return count / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.results)} replays parsed, {len(self.errors)} failed "
+            f"in {self.elapsed:.2f}s ({self.replays_per_second:.1f} replays/s, "
+            f"{self.mb_per_second:.2f} MB/s)"
+        )
+
+
+def expand_paths(
+    paths: Union[PathLike, Iterable[PathLike]], pattern: str = "*.hbr2"
+) -> List[str]:
+    """A directory expands (recursively) to the replays matching ``pattern``."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    expanded: List[str] = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            expanded.extend(str(p) for p in sorted(path.rglob(pattern)))
+        else:
+            expanded.append(str(path))
+    return expanded
+
+
+# (reduce, opciones de parse, stats, StringPool) de un lote
+Context = Tuple[
+    Callable[[Dict[str, Any]], Any], Dict[str, Any], bool, Optional[StringPool]
+]
+
+# Contexto de cada proceso del pool (lo fija _init_worker)
+_worker_context: Optional[Context] = None
+
+
+def _context(reduce, options, stats, string_pool=None) -> Context:
+    return reduce, options, stats, StringPool(string_pool) if string_pool else None
+
+
+def _init_worker(reduce, options, stats, string_pool=None) -> None:
+    global _worker_context
+    _worker_context = _context(reduce, options, stats, string_pool)
+
+
+def _parse_one(path: str, context: Optional[Context] = None):
+    """
+    Parse one replay: (path, size, value, error, stats). Without
+    ``context``, with the one _init_worker set in this pool process.
+    """
+    context = context or _worker_context
+    if context is None:
+        raise RuntimeError("No batch context: pass one or call from a parse_many pool")
+    reduce, options, collect_stats, strings = context
+    stats = ParseStats() if collect_stats else None
+    size = 0
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            replay = Parser(f, stats=stats, strings=strings).parse(**options)
+        return path, size, reduce(replay), None, stats
+    except Exception as e:
+        return path, size, None, f"{type(e).__name__}: {e}", stats
+
+
+def parse_many(
+    paths: Union[PathLike, Iterable[PathLike]],
+    jobs: Optional[int] = None,
+    reduce: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    chunksize: Optional[int] = None,
+    stats: bool = False,
+    pattern: str = "*.hbr2",
+    string_pool: Optional[int] = None,
+    **parse_options,
+) -> BatchResult:
+    """
+    Parse many replays over a process pool.
+
+    Args:
+        paths: replay files and/or directories (searched recursively for
+            ``pattern``).
+        jobs: worker processes (default: os.cpu_count()); 1 parses in this
+            process.
+        reduce: picklable function run in the worker on each parsed replay
+            dict; only its return value is sent back (default: summarize,
+            with the actions parsed into an ActionTable unless
+            ``columnar`` is given).
+        chunksize: replays handed to a worker at a time (default: enough
+            for ~4 chunks per worker).
+        stats: collect a ParseStats per replay and merge them into
+            ``result.stats``.
+        string_pool: size of a StringPool shared by the replays of each
+            worker, so names, countries and avatars are decoded once per
+            worker instead of once per replay (default: one pool per replay).
+        parse_options: forwarded to Parser.parse (default streaming=True).
+    """
+    files = expand_paths(paths, pattern)
+    if reduce is None:
+        reduce = summarize
+        parse_options.setdefault("columnar", True)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(files) or 1))
+    chunksize = chunksize or max(1, len(files) // (jobs * 4))
+    parse_options.setdefault("streaming", True)
+
+    result = BatchResult()
+    if stats:
+        result.stats = ParseStats()
+
+    start = time.perf_counter()
+    if jobs == 1:
+        # En este proceso: contexto local, sin tocar el estado del módulo
+        context = _context(reduce, parse_options, stats, string_pool)
+        _collect(result, map(partial(_parse_one, context=context), files))
+    else:
+        initargs = (reduce, parse_options, stats, string_pool)
+        with Pool(jobs, _init_worker, initargs) as pool:
+            _collect(result, pool.imap(_parse_one, files, chunksize))
+    result.elapsed = time.perf_counter() - start
+
+    logger.info("%s", result)
+    return result
+
+
+def _collect(result: BatchResult, outputs: Iterable) -> None:
+    for path, size, value, error, stats in outputs:
+        result.bytes_read += size
+        if error is not None:
+            logger.warning("Failed to parse %s: %s", path, error)
+            result.errors.append((path, error))
+        else:
+            result.results.append((path, value))
+        if result.stats is not None and stats is not None:
+            result.stats.merge(stats)
@@ -1,78 +1,135 @@
 # haxmetrics/utils/binary_reader.py
 
 import struct
-from typing import Optional, Union, Tuple
+import time
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Union, Tuple
+
+# Lectores precompilados por ancho y endianness (LE, BE)
+_UINT16 = (struct.Struct("<H"), struct.Struct(">H"))
+_INT32 = (struct.Struct("<i"), struct.Struct(">i"))
+_UINT32 = (struct.Struct("<I"), struct.Struct(">I"))
+_FLOAT32 = (struct.Struct("<f"), struct.Struct(">f"))
+_FLOAT64 = (struct.Struct("<d"), struct.Struct(">d"))
+_POSITION = (struct.Struct("<dd"), struct.Struct(">dd"))
+
+_UINT16_BE = _UINT16[1]
+_INT32_BE = _INT32[1]
+_UINT32_BE = _UINT32[1]
+_FLOAT32_LE = _FLOAT32[0]
+_FLOAT64_BE = _FLOAT64[1]
+
+
+@lru_cache(maxsize=None)
+def _doubles_be(count: int) -> struct.Struct:
+    return struct.Struct(f">{count}d")
+
+
+def decode_string(raw) -> str:
+    # Try UTF-8 decoding with error handling for corrupted/invalid strings
+    try:
+        return str(raw, "utf-8")
+    except UnicodeDecodeError:
+        # Fall back to latin-1 which accepts all byte values
+        return str(raw, "latin-1")
+
+
+class StringPool:
+    """
+    Interning table from encoded bytes to decoded ``str``: a repeated name,
+    country, avatar or chat line is decoded once and the same object is
+    returned every time.
+
+    Every reader has its own unbounded pool by default (replay-wide). A
+    pool can be shared by the parses of a batch to intern across replays;
+    give it a ``max_size`` there, the pool is emptied when it fills up.
+    """
+
+    __slots__ = ("strings", "max_size", "hits", "misses")
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.strings: Dict[bytes, str] = {}
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def decode(self, raw) -> str:
+        # Solo buffers inmutables se pueden usar como clave sin copiar
+        if type(raw) is not bytes and not getattr(raw, "readonly", False):
+            raw = bytes(raw)
+        string = self.strings.get(raw)
+        if string is not None:
+            self.hits += 1
+            return string
+
+        self.misses += 1
+        string = decode_string(raw)
+        if self.max_size is not None and len(self.strings) >= self.max_size:
+            self.strings.clear()
+        # Clave propia: no retener el buffer del replay entero
+        self.strings[bytes(raw)] = string
+        return string
 
 
 class BinaryReader:
-    def __init__(self, data):
-        self.data = data
+    """
+    Reader over a ``memoryview`` of the data: reads never slice the buffer,
+    they unpack in place with precompiled ``struct.Struct`` objects.
+    Every read goes through ``_take``, the single bounds check.
+
+    Strings are decoded through ``strings`` (a StringPool, a new one per
+    reader unless given).
+    """
+
+    def __init__(self, data, strings: Optional[StringPool] = None):
+        self.data: Union[memoryview, bytearray] = memoryview(data)
         self.position = 0
-        self.length = len(data)
+        self.length = len(self.data)
         self.little_endian = True
+        self.strings = strings if strings is not None else StringPool()
 
-    def read_byte(self) -> int:
-        if self.position >= self.length:
-            raise EOFError("Fin de datos")
+    def _take(self, size: int, what: str) -> int:
+        """Advance ``size`` bytes and return the buffer offset where they start."""
+        start = self.position
+        if start + size > self.length:
+            raise EOFError(f"No hay suficientes bytes para leer {what}")
 
-        result = self.data[self.position]
-        self.position += 1
-        return result
+        self.position = start + size
+        return start
+
+    def read_byte(self) -> int:
+        return self.data[self._take(1, "byte")]
 
     def read_bool(self) -> bool:
         return self.read_byte() != 0
 
     def read_fixed_string(self, length: int) -> str:
-        if self.position + length > self.length:
-            raise EOFError(f"No hay suficientes bytes para leer {length} bytes")
-
-        result = self.data[self.position : self.position + length].decode("utf-8")
-        self.position += length
-        return result
+        start = self._take(length, f"{length} bytes")
+        return str(self.data[start : start + length], "utf-8")
 
     def read_uint16(self) -> int:
-        if self.position + 2 > self.length:
-            raise EOFError("No hay suficientes bytes para leer uint16")
-
-        result = struct.unpack(
-            "<H" if self.little_endian else ">H",
-            self.data[self.position : self.position + 2],
+        return _UINT16[not self.little_endian].unpack_from(
+            self.data, self._take(2, "uint16")
         )[0]
-        self.position += 2
-        return result
 
     def read_int32(self) -> int:
-        if self.position + 4 > self.length:
-            raise EOFError("No hay suficientes bytes para leer int32")
-
-        result = struct.unpack(
-            "<i" if self.little_endian else ">i",
-            self.data[self.position : self.position + 4],
+        return _INT32[not self.little_endian].unpack_from(
+            self.data, self._take(4, "int32")
         )[0]
-        self.position += 4
-        return result
 
     def read_uint32(self) -> int:
-        if self.position + 4 > self.length:
-            raise EOFError("No hay suficientes bytes para leer uint32")
-
-        result = struct.unpack(
-            "<I" if self.little_endian else ">I",
-            self.data[self.position : self.position + 4],
+        return _UINT32[not self.little_endian].unpack_from(
+            self.data, self._take(4, "uint32")
         )[0]
-        self.position += 4
-        return result
 
     def read_float64(self) -> float:
-        if self.position + 8 > self.length:
-            raise EOFError("No hay suficientes bytes para leer float64")
-
-        result = struct.unpack(
-            "<d" if self.little_endian else ">d",
-            self.data[self.position : self.position + 8],
+        return _FLOAT64[not self.little_endian].unpack_from(
+            self.data, self._take(8, "float64")
         )[0]
-        self.position += 8
-        return result
 
     def read_string(self) -> Optional[str]:
         length = self.read_varint()
@@ -80,18 +137,8 @@ class BinaryReader:
             return None
         length -= 1
 
-        if self.position + length > self.length:
-            raise EOFError("No hay suficientes bytes para leer string")
-
-        # Try UTF-8 decoding with error handling for corrupted/invalid strings
-        try:
-            result = self.data[self.position : self.position + length].decode("utf-8")
-        except UnicodeDecodeError:
-            # Fall back to latin-1 which accepts all byte values
-            result = self.data[self.position : self.position + length].decode("latin-1")
-        
-        self.position += length
-        return result
+        start = self._take(length, "string")
+        return self.strings.decode(self.data[start : start + length])
 
     def read_varint(self) -> int:
         result = 0
@@ -110,17 +157,13 @@ class BinaryReader:
         return result
 
     def read_remaining(self) -> bytes:
-        result = self.data[self.position :]
+        result = bytes(self.data[self.position :])
         self.position = self.length
         return result
 
     def read_bytes(self, length: int) -> bytes:
-        if self.position + length > self.length:
-            raise EOFError(f"No hay suficientes bytes para leer {length} bytes")
-
-        result = self.data[self.position : self.position + length]
-        self.position += length
-        return result
+        start = self._take(length, f"{length} bytes")
+        return bytes(self.data[start : start + length])
 
     def read_nullable_int32(self) -> Optional[int]:
         if self.read_bool():
@@ -140,11 +183,29 @@ class BinaryReader:
 
     def peek_bytes(self, count: int) -> bytes:
         end = min(self.position + count, self.length)
-        return self.data[self.position : end]
+        return bytes(self.data[self.position : end])
 
     def skip(self, count: int) -> None:
         self.position = min(self.position + count, self.length)
 
+    def unpack(self, fmt: struct.Struct, what: str = "record") -> Tuple:
+        """Read a fixed-width record with a precompiled Struct."""
+        return fmt.unpack_from(self.data, self._take(fmt.size, what))
+
+    def skip_bytes(self, count: int) -> None:
+        """Like skip(), but raises EOFError instead of stopping at the end."""
+        self._take(count, f"{count} bytes")
+
+    def skip_string(self) -> None:
+        """Advance past a read_string() value without decoding it."""
+        length = self.read_varint()
+        if length:
+            self._take(length - 1, "string")
+
+    def skip_nullable_string(self) -> None:
+        if self.read_bool():
+            self.skip_string()
+
     def get_position(self) -> int:
         return self.position
 
@@ -161,9 +222,10 @@ class BinaryReader:
         return self.position >= self.length
 
     def read_position(self) -> Tuple[float, float]:
-        x = self.read_float64()
-        y = self.read_float64()
-        return (x, y)
+        """Read an (x, y) pair of float64 with a single unpack"""
+        return _POSITION[not self.little_endian].unpack_from(
+            self.data, self._take(16, "position")
+        )
 
     def read_player_id(self) -> int:
         return self.read_int32()
@@ -178,21 +240,15 @@ class BinaryReader:
 
     def read_uint32_be(self) -> int:
         """Read uint32 in big-endian format (for HaxBall compatibility)"""
-        if self.position + 4 > self.length:
-            raise EOFError("No hay suficientes bytes para leer uint32")
+        return _UINT32_BE.unpack_from(self.data, self._take(4, "uint32"))[0]
 
-        result = struct.unpack(">I", self.data[self.position : self.position + 4])[0]
-        self.position += 4
-        return result
+    def read_int32_be(self) -> int:
+        """Read int32 in big-endian format (for HaxBall stadium data)"""
+        return _INT32_BE.unpack_from(self.data, self._take(4, "int32"))[0]
 
     def read_uint16_be(self) -> int:
         """Read uint16 in big-endian format (for HaxBall compatibility)"""
-        if self.position + 2 > self.length:
-            raise EOFError("No hay suficientes bytes para leer uint16")
-
-        result = struct.unpack(">H", self.data[self.position : self.position + 2])[0]
-        self.position += 2
-        return result
+        return _UINT16_BE.unpack_from(self.data, self._take(2, "uint16"))[0]
 
     def read_string_auto(self) -> Optional[str]:
         """Alias for read_string() for compatibility with original scripts"""
@@ -204,22 +260,150 @@ class BinaryReader:
 
     def read_double_be(self) -> float:
         """Read double in big-endian format (for HaxBall stadium data)"""
-        if self.position + 8 > self.length:
-            raise EOFError("No hay suficientes bytes para leer float64")
+        return _FLOAT64_BE.unpack_from(self.data, self._take(8, "float64"))[0]
 
-        result = struct.unpack(">d", self.data[self.position : self.position + 8])[0]
-        self.position += 8
-        return result
+    def read_doubles_be(self, count: int) -> Tuple[float, ...]:
+        """Read ``count`` big-endian doubles with a single unpack (stadium data)"""
+        return _doubles_be(count).unpack_from(
+            self.data, self._take(8 * count, "float64")
+        )
 
     def read_float_le(self) -> float:
         """Read 32-bit float in little-endian format (for HaxBall action data)"""
-        if self.position + 4 > self.length:
-            raise EOFError("No hay suficientes bytes para leer float32")
-
-        result = struct.unpack("<f", self.data[self.position : self.position + 4])[0]
-        self.position += 4
-        return result
+        return _FLOAT32_LE.unpack_from(self.data, self._take(4, "float32"))[0]
 
     def get_input_string(self) -> bytes:
         """Alias for read_remaining() for compatibility"""
         return self.read_remaining()
+
+
+class InflateReader(BinaryReader):
+    """
+    BinaryReader over a raw-deflate stream (wbits=-15) inflated on demand.
+
+    Only a window of the decompressed data is kept in memory: bytes behind the
+    current position are dropped as new chunks are inflated, so peak memory is
+    bounded by ``chunk_size`` instead of the size of the whole replay.
+    ``position`` and ``length`` are absolute offsets in the decompressed stream;
+    ``length`` only covers what has been inflated so far.
+
+    Given a ParseStats, inflate time and sizes are added to its ``inflate``
+    phase (inflation runs inside the other phases, which include it too).
+    """
+
+    def __init__(
+        self,
+        source,
+        chunk_size: int = 64 * 1024,
+        stats=None,
+        strings: Optional[StringPool] = None,
+    ):
+        super().__init__(b"", strings)
+        self._window = bytearray()  # Lo mismo que self.data, con su tipo
+        self.data = self._window
+        self.offset = 0  # Posición absoluta de self.data[0]
+        self.chunk_size = chunk_size
+        self._inflater = zlib.decompressobj(-15)
+        self._chunks = self._iter_chunks(source, chunk_size)
+        self._exhausted = False
+        self.stats = stats
+
+    @staticmethod
+    def _iter_chunks(source, chunk_size: int) -> Iterator[Union[bytes, memoryview]]:
+        """Yield compressed chunks from a bytes-like object or a binary file."""
+        if hasattr(source, "read"):
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        else:
+            view = memoryview(source)
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size]
+
+    def _inflate_more(self) -> None:
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+
+        tail = self._inflater.unconsumed_tail
+        if tail:
+            chunk = self._inflater.decompress(tail, self.chunk_size)
+        else:
+            compressed = None if self._inflater.eof else next(self._chunks, None)
+            if compressed is None:
+                chunk = self._inflater.flush()
+                self._exhausted = True
+            else:
+                chunk = self._inflater.decompress(compressed, self.chunk_size)
+                if stats is not None:
+                    stats.compressed_bytes += len(compressed)
+
+        if stats is not None:
+            stats.add_time("inflate", time.perf_counter() - start)
+            stats.section_bytes["inflate"] += len(chunk)
+
+        # Descarta lo ya consumido antes de crecer la ventana
+        consumed = self.position - self.offset
+        if consumed >= self.chunk_size:
+            del self._window[:consumed]
+            self.offset += consumed
+
+        self._window += chunk
+        self.length = self.offset + len(self._window)
+
+    def _fill(self, size: int) -> bool:
+        """Inflate until ``size`` bytes are available at the current position."""
+        while self.position + size > self.length and not self._exhausted:
+            self._inflate_more()
+        return self.position + size <= self.length
+
+    def _take(self, size: int, what: str) -> int:
+        """Advance ``size`` bytes and return the window offset where they start."""
+        if not self._fill(size):
+            raise EOFError(f"No hay suficientes bytes para leer {what}")
+
+        start = self.position - self.offset
+        self.position += size
+        return start
+
+    def read_remaining(self) -> bytes:
+        while not self._exhausted:
+            self._inflate_more()
+        result = bytes(self.data[self.position - self.offset :])
+        self.position = self.length
+        return result
+
+    def peek_byte(self) -> int:
+        if not self._fill(1):
+            raise EOFError("Fin de datos")
+
+        return self.data[self.position - self.offset]
+
+    def peek_bytes(self, count: int) -> bytes:
+        self._fill(count)
+        start = self.position - self.offset
+        return bytes(self.data[start : start + count])
+
+    def skip(self, count: int) -> None:
+        # Avanza mientras se infla para no retener los bytes saltados
+        target = self.position + count
+        while self.length < target and not self._exhausted:
+            self.position = self.length
+            self._inflate_more()
+        self.position = min(target, self.length)
+
+    def set_position(self, position: int) -> None:
+        if position < self.offset:
+            raise ValueError("Posición ya descartada del flujo")
+
+        self.position = position
+        if not self._fill(0):
+            raise ValueError("Posición fuera de rango")
+
+    def reset(self) -> None:
+        self.set_position(0)
+
+    def eof(self) -> bool:
+        return not self._fill(1)
@@ -0,0 +1,153 @@
+# haxmetrics/cache.py
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sube este número si cambia el formato de lo que se guarda
+CACHE_FORMAT = 1
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+# Código que decide el resultado del parseo: si cambia, cambia la clave
+DECODER_SOURCES = (
+    "binary_reader.py",
+    "parser.py",
+    "action_table.py",
+    "models",
+)
+
+
+@lru_cache(maxsize=None)
+def decoder_fingerprint() -> bytes:
+    """
+    Hash of the decoder sources (binary reader, parser, action store and
+    every model, including models/action_types.py and the action classes).
+    Any edit to them yields new cache keys, so stale entries are never read.
+    """
+    digest = hashlib.sha256(f"haxmetrics-cache-{CACHE_FORMAT}".encode())
+    for name in DECODER_SOURCES:
+        path = PACKAGE_DIR / name
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            digest.update(str(file.relative_to(PACKAGE_DIR)).encode())
+            digest.update(file.read_bytes())
+    return digest.digest()
+
+
+class ParseCache:
+    """
+    Content-addressed on-disk cache of parsed replays.
+
+    Entries are keyed by a hash of the raw replay bytes, the parse options
+    that change the result and ``decoder_fingerprint()``; they are stored as
+    pickles (protocol 5). Reading an entry refreshes its mtime, and once the
+    directory grows past ``max_bytes`` the least recently used entries are
+    removed. The size of the directory is scanned once and then kept as a
+    running total of this instance's writes; the scan is only repeated to
+    evict, which also picks up what other processes wrote.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(self, directory, max_bytes: int = 1 << 30):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total: Optional[int] = None  # Bytes en el directorio, tras el primer put
+
+    def key(self, data, **options) -> str:
+        digest = hashlib.sha256(decoder_fingerprint())
+        digest.update(repr(sorted(options.items())).encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", path, e)
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        os.utime(path)  # Marca de uso para el LRU
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        if self._total is None:
+            self._total = self.size()
+        path = self.path(key)
+        # Escritura atómica: otros procesos nunca ven una entrada a medias
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=5)
+            written = os.path.getsize(tmp)
+            replaced = self._entry_size(path)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._total += written - replaced
+        if self._total > self.max_bytes:
+            self.evict()
+
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _remove(self, path: Path) -> None:
+        size = self._entry_size(path)
+        path.unlink(missing_ok=True)
+        if self._total is not None:
+            self._total -= size
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.glob(f"*{self.SUFFIX}"))
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total = total
+
+    def clear(self) -> None:
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            path.unlink(missing_ok=True)
+        self._total = 0
@@ -0,0 +1,153 @@
+# haxmetrics/input_timeline.py
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Bits de PlayerInput.input (d.W en el paso de física del JS original)
+UP = 1
+DOWN = 2
+LEFT = 4
+RIGHT = 8
+KICK = 16
+
+
+# Bits de la entrada en cada run empaquetado; si alguna no cabe, 32
+INPUT_BITS = 5
+
+
+class InputTimeline:
+    """
+    Input state of one player over time, run-length encoded: run ``i``
+    starts at the frame where the player switched to input ``i``, and the
+    state holds until the next run. Before the first run the state is 0.
+
+    Each run is packed into one integer, ``frame << shift | input``, in the
+    ``packed`` memoryview: uint32 with ``shift`` = INPUT_BITS (the key
+    bits), or uint64 with ``shift`` = 32 if some input or frame does not
+    fit. Runs are sorted by frame, so state_at is a single bisect over
+    ``packed`` and between() slices share its buffer. ``frames`` and
+    ``inputs`` decode the runs.
+    """
+
+    __slots__ = ("packed", "shift")
+
+    def __init__(self, packed, shift: int = INPUT_BITS):
+        self.packed = memoryview(packed)
+        self.shift = shift
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    @property
+    def frames(self) -> List[int]:
+        shift = self.shift
+        return [run >> shift for run in self.packed]
+
+    @property
+    def inputs(self) -> List[int]:
+        mask = (1 << self.shift) - 1
+        return [run & mask for run in self.packed]
+
+    def _index(self, frame: int) -> int:
+        """Index of the run in effect at ``frame``, -1 before the first one."""
+        return bisect_left(self.packed, (frame + 1) << self.shift) - 1
+
+    def state_at(self, frame: int) -> int:
+        """Input bits held at ``frame`` (O(log n))."""
+        i = self._index(frame)
+        return self.packed[i] & ((1 << self.shift) - 1) if i >= 0 else 0
+
+    def is_pressed(self, frame: int, key: int) -> bool:
+        return bool(self.state_at(frame) & key)
+
+    def between(self, start: int, stop: int) -> "InputTimeline":
+        """
+        Runs in effect during [start, stop), including the one already
+        held at ``start``. Zero-copy.
+        """
+        i = max(self._index(start), 0)
+        j = bisect_left(self.packed, stop << self.shift)
+        return InputTimeline(self.packed[i:j], self.shift)
+
+    def runs(
+        self, end: Optional[int] = None
+    ) -> Iterator[Tuple[int, Optional[int], int]]:
+        """(start, stop, input) per run; the last one stops at ``end``."""
+        frames, inputs = self.frames, self.inputs
+        for i in range(len(frames)):
+            stop = frames[i + 1] if i + 1 < len(frames) else end
+            yield frames[i], stop, inputs[i]
+
+    def held_frames(self, key: int, end: int) -> int:
+        """Frames before ``end`` during which ``key`` was held."""
+        return sum(
+            min(end if stop is None else stop, end) - start
+            for start, stop, input_ in self.runs(end)
+            if input_ & key and start < end
+        )
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """(frames, inputs) as NumPy arrays (uint32), decoded from ``packed``."""
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("InputTimeline.to_numpy requires numpy") from e
+
+        packed = np.asarray(self.packed)
+        frames = (packed >> self.shift).astype(np.uint32)
+        inputs = (packed & ((1 << self.shift) - 1)).astype(np.uint32)
+        return frames, inputs
+
+    def nbytes(self) -> int:
+        return self.packed.nbytes
+
+    def json_serialize(self) -> Dict[str, Any]:
+        return {"frames": self.frames, "inputs": self.inputs}
+
+
+class InputTimelineBuilder:
+    """
+    Collects PlayerInput rows (``append_input``, the same sink interface as
+    ActionTable, so the parser can feed it without building objects) into
+    one InputTimeline per sender. Frames must come in non-decreasing order,
+    as they do in a replay.
+    """
+
+    def __init__(self):
+        self._frames: Dict[int, array] = {}
+        self._inputs: Dict[int, array] = {}
+
+    def append_input(self, frame: int, sender: int, input_: int) -> None:
+        frames = self._frames.get(sender)
+        if frames is None:
+            frames = self._frames[sender] = array("I")
+            inputs = self._inputs[sender] = array("I")
+        else:
+            inputs = self._inputs[sender]
+
+        if frames and frames[-1] == frame:
+            # Varias entradas en el mismo frame: vale la última
+            inputs[-1] = input_
+            if (inputs[-2] if len(inputs) > 1 else 0) == input_:
+                frames.pop()
+                inputs.pop()
+        elif (inputs[-1] if inputs else 0) != input_:
+            frames.append(frame)
+            inputs.append(input_)
+
+    def build(self) -> Dict[int, InputTimeline]:
+        timelines = {}
+        for sender, frames in self._frames.items():
+            inputs = self._inputs[sender]
+            shift, typecode = INPUT_BITS, "I"
+            if inputs and (
+                max(inputs) >> INPUT_BITS or frames[-1] >> (32 - INPUT_BITS)
+            ):
+                shift, typecode = 32, "Q"
+            packed = array(
+                typecode,
+                [frame << shift | input_ for frame, input_ in zip(frames, inputs)],
+            )
+            timelines[sender] = InputTimeline(packed, shift)
+        return timelines
@@ -0,0 +1,143 @@
+# haxmetrics/instrumentation.py
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+# Fases del parseo, en orden
+PHASES = ("inflate", "messages", "room", "stadium", "actions")
+
+
+class ParseStats:
+    """
+    Counters and timers collected while parsing, enabled by passing an
+    instance to ``Parser(data, stats=...)``. When no instance is given the
+    parser does not touch the clock nor count anything.
+
+    - ``timings``: seconds spent per phase (``PHASES``). ``room`` includes
+      its nested ``stadium``; ``actions`` only counts decoding time, not the
+      time a consumer of ``iter_parse`` spends between actions.
+    - ``section_bytes``: decompressed bytes consumed per phase (for
+      ``inflate``: bytes produced by the inflater).
+    - ``compressed_bytes``: size of the compressed block fed to the inflater.
+    - ``action_counts`` / ``action_bytes``: per action class name, bytes
+      include the frame/sender/type header of each action.
+    - ``skipped_bytes``: bytes of the actions skipped by a ``types`` filter
+      (counted in ``section_bytes["actions"]``, not in ``action_bytes``).
+
+    An instance can be reused across replays to aggregate them (``replays``
+    counts how many were parsed), or combined with ``merge``.
+    """
+
+    __slots__ = (
+        "replays",
+        "timings",
+        "section_bytes",
+        "compressed_bytes",
+        "action_counts",
+        "action_bytes",
+        "skipped_bytes",
+        "_skipped",
+    )
+
+    def __init__(self):
+        self.replays = 0
+        self.timings: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.section_bytes: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.compressed_bytes = 0
+        self.action_counts: Dict[str, int] = {}
+        self.action_bytes: Dict[str, int] = {}
+        self.skipped_bytes = 0
+        self._skipped = 0  # Saltados desde la última acción contada
+
+    @contextmanager
+    def phase(self, name: str, reader=None) -> Iterator[None]:
+        """Time a phase and, given a reader, count the bytes it consumed."""
+        start_position = reader.position if reader is not None else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+            if reader is not None:
+                self.section_bytes[name] += reader.position - start_position
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timings[name] += seconds
+
+    def count_action(self, name: str, size: int) -> None:
+        self.action_counts[name] = self.action_counts.get(name, 0) + 1
+        self.action_bytes[name] = self.action_bytes.get(name, 0) + size
+
+    def skip_action(self, size: int) -> None:
+        """Record an action skipped by the parser (see count_actions)."""
+        self.skipped_bytes += size
+        self._skipped += size
+
+    def count_actions(self, actions, reader) -> Iterator[Any]:
+        """
+        Wrap an action iterator, counting time and bytes per action type.
+        The iterator must report the actions it skips with skip_action, so
+        their bytes are not credited to the next action it yields.
+        """
+        perf_counter = time.perf_counter
+        position = reader.position
+        self._skipped = 0
+        start = perf_counter()
+        for action in actions:
+            self.timings["actions"] += perf_counter() - start
+            end = reader.position
+            self.count_action(type(action).__name__, end - position - self._skipped)
+            self.section_bytes["actions"] += end - position
+            self._skipped = 0
+            position = end
+            yield action
+            start = perf_counter()
+        # Acciones saltadas después de la última devuelta
+        self.timings["actions"] += perf_counter() - start
+        self.section_bytes["actions"] += reader.position - position
+        self._skipped = 0
+
+    def merge(self, other: "ParseStats") -> "ParseStats":
+        self.replays += other.replays
+        self.compressed_bytes += other.compressed_bytes
+        self.skipped_bytes += other.skipped_bytes
+        for name in PHASES:
+            self.timings[name] += other.timings[name]
+            self.section_bytes[name] += other.section_bytes[name]
+        for name, count in other.action_counts.items():
+            self.action_counts[name] = self.action_counts.get(name, 0) + count
+            self.action_bytes[name] = (
+                self.action_bytes.get(name, 0) + other.action_bytes[name]
+            )
+        return self
+
+    def total_time(self) -> float:
+        # El estadio va anidado dentro de la sala
+        return sum(t for name, t in self.timings.items() if name != "stadium")
+
+    def json_serialize(self) -> Dict[str, Any]:
+        return {
+            "replays": self.replays,
+            "compressedBytes": self.compressed_bytes,
+            "timings": dict(self.timings),
+            "sectionBytes": dict(self.section_bytes),
+            "actionCounts": dict(self.action_counts),
+            "actionBytes": dict(self.action_bytes),
+            "skippedBytes": self.skipped_bytes,
+        }
+
+    def __str__(self) -> str:
+        lines = [f"ParseStats: {self.replays} replay(s), {self.total_time():.4f}s"]
+        for name in PHASES:
+            lines.append(
+                f"  {name:<10} {self.timings[name]:>10.4f}s "
+                f"{self.section_bytes[name]:>12} bytes"
+            )
+        for name, count in sorted(self.action_counts.items(), key=lambda i: -i[1]):
+            lines.append(
+                f"  {name:<20} {count:>10} actions {self.action_bytes[name]:>12} bytes"
+            )
+        if self.skipped_bytes:
+            lines.append(f"  {'(skipped)':<20} {'':>18} {self.skipped_bytes:>12} bytes")
+        return "\n".join(lines)
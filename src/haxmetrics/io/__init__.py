@@ -0,0 +1 @@
+"""Replay I/O helpers: fast probes and exporters."""
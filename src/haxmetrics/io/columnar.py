@@ -0,0 +1,395 @@
+# haxmetrics/io/columnar.py
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Union
+
+from haxmetrics.action_table import ActionTable
+from haxmetrics.io.ndjson import to_json
+from haxmetrics.models.action_types import ACTION_TYPES
+from haxmetrics.models.actions.disc_update import FIELD_NAMES, FLOAT_FIELDS
+from haxmetrics.models.stadium.stadium import Stadium
+from haxmetrics.parser import Parser
+
+FORMATS = ("arrow", "parquet", "npz")
+
+# Extensión de cada tabla en los formatos de directorio
+SUFFIXES = {"arrow": ".arrow", "parquet": ".parquet"}
+
+Tables = Dict[str, Dict[str, Any]]
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("Columnar export requires numpy") from e
+    return np
+
+
+def _pyarrow(required: bool = True):
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        if required:
+            raise ImportError("Arrow and Parquet output require pyarrow") from e
+        return None
+    return pyarrow
+
+
+def _color(value) -> int:
+    # Los modelos guardan los colores como hexadecimal
+    return int(value, 16) if value else 0
+
+
+def _columns(rows: List[tuple], spec) -> Dict[str, Any]:
+    """Typed columns from row tuples; ``spec`` is a list of (name, dtype)."""
+    np = _numpy()
+    columns = list(zip(*rows)) if rows else [()] * len(spec)
+    return {
+        name: np.array(values, dtype=dtype)
+        for (name, dtype), values in zip(spec, columns)
+    }
+
+
+def action_tables(actions) -> Tables:
+    """
+    Action tables: ``actions`` (frame, sender, type, payload) and the payload
+    tables its ``payload`` column indexes into, chosen by the type:
+    ``inputs`` for PlayerInput, ``disc_updates`` for DiscUpdate and
+    ``events`` (type name and JSON data) for every other type.
+    ``action_types`` maps type ids to names.
+    """
+    np = _numpy()
+    table = (
+        actions
+        if isinstance(actions, ActionTable)
+        else ActionTable.from_actions(actions)
+    )
+    columns = table.to_numpy()
+
+    disc_updates = {
+        "disc_id": columns["disc_ids"],
+        "is_player_disc": columns["disc_player"].astype(bool),
+        "mask": columns["disc_mask"],
+    }
+    for i, name in enumerate(FIELD_NAMES[:FLOAT_FIELDS]):
+        disc_updates[name] = np.ascontiguousarray(columns["disc_floats"][:, i])
+    for i, name in enumerate(FIELD_NAMES[FLOAT_FIELDS:]):
+        disc_updates[name] = np.ascontiguousarray(columns["disc_ints"][:, i])
+
+    return {
+        "actions": {
+            name: columns[name] for name in ("frames", "senders", "types", "payload")
+        },
+        "action_types": _columns(
+            [(i, cls.__name__) for i, cls in enumerate(ACTION_TYPES)],
+            [("id", np.uint8), ("name", str)],
+        ),
+        "inputs": {"input": columns["inputs"]},
+        "disc_updates": disc_updates,
+        "events": _columns(
+            [
+                (action.type, json.dumps(action.get_data(), default=to_json))
+                for action in table.objects
+            ],
+            [("type", str), ("data", str)],
+        ),
+    }
+
+
+def stadium_tables(stadium: Optional[Stadium]) -> Tables:
+    """Geometry of a custom stadium (empty tables for built-in ones)."""
+    np = _numpy()
+    custom = stadium if stadium is not None and stadium.is_custom() else None
+    mask = Stadium.mask_value
+    return {
+        "vertexes": _columns(
+            [
+                (v.x, v.y, v.b_coef, mask(v.c_mask), mask(v.c_group))
+                for v in (custom.vertexes if custom else ())
+            ],
+            [
+                ("x", np.float64),
+                ("y", np.float64),
+                ("b_coef", np.float64),
+                ("c_mask", np.uint32),
+                ("c_group", np.uint32),
+            ],
+        ),
+        "segments": _columns(
+            [
+                (
+                    int(s.v0),
+                    int(s.v1),
+                    s.b_coef,
+                    mask(s.c_mask),
+                    mask(s.c_group),
+                    s.curve,
+                    s.vis,
+                    _color(s.color),
+                )
+                for s in (custom.segments if custom else ())
+            ],
+            [
+                ("v0", np.uint8),
+                ("v1", np.uint8),
+                ("b_coef", np.float64),
+                ("c_mask", np.uint32),
+                ("c_group", np.uint32),
+                ("curve", np.float64),
+                ("vis", bool),
+                ("color", np.uint32),
+            ],
+        ),
+        "planes": _columns(
+            [
+                (
+                    p.normal_x,
+                    p.normal_y,
+                    p.dist,
+                    p.b_coef,
+                    mask(p.c_mask),
+                    mask(p.c_group),
+                )
+                for p in (custom.planes if custom else ())
+            ],
+            [
+                ("normal_x", np.float64),
+                ("normal_y", np.float64),
+                ("dist", np.float64),
+                ("b_coef", np.float64),
+                ("c_mask", np.uint32),
+                ("c_group", np.uint32),
+            ],
+        ),
+        "goals": _columns(
+            [
+                (*g.pos_start, *g.pos_end, g.team)
+                for g in (custom.goals if custom else ())
+            ],
+            [
+                ("x0", np.float64),
+                ("y0", np.float64),
+                ("x1", np.float64),
+                ("y1", np.float64),
+                ("team", str),
+            ],
+        ),
+        "discs": _columns(
+            [
+                (
+                    d.pos_x,
+                    d.pos_y,
+                    d.velocity_x,
+                    d.velocity_y,
+                    d.radius,
+                    d.b_coef,
+                    d.inv_mass,
+                    d.damping,
+                    _color(d.color),
+                    mask(d.c_mask),
+                    mask(d.c_group),
+                )
+                for d in (custom.discs if custom else ())
+            ],
+            [
+                ("x", np.float64),
+                ("y", np.float64),
+                ("vx", np.float64),
+                ("vy", np.float64),
+                ("radius", np.float64),
+                ("b_coef", np.float64),
+                ("inv_mass", np.float64),
+                ("damping", np.float64),
+                ("color", np.uint32),
+                ("c_mask", np.uint32),
+                ("c_group", np.uint32),
+            ],
+        ),
+    }
+
+
+def replay_tables(replay: Dict[str, Any]) -> Tables:
+    """
+    Every table of a parsed replay (``Parser.parse`` output), as
+    ``{table: {column: 1-D NumPy array}}``: one ``replay`` row with the
+    header, ``players``, ``messages``, the action tables (see action_tables)
+    and the stadium geometry (see stadium_tables).
+    """
+    np = _numpy()
+    room = replay["room_info"]
+    stadium = room.stadium if room is not None else None
+
+    tables = {
+        "replay": _columns(
+            [
+                (
+                    replay["version"],
+                    replay["duration"],
+                    room.name if room is not None and room.name else "",
+                    stadium.name if stadium is not None and stadium.name else "",
+                )
+            ],
+            [
+                ("version", np.uint32),
+                ("duration", np.uint32),
+                ("room", str),
+                ("stadium", str),
+            ],
+        ),
+        "players": _columns(
+            [
+                (
+                    p.id,
+                    p.name or "",
+                    p.admin,
+                    p.team,
+                    p.number,
+                    p.avatar or "",
+                    p.input,
+                    p.kicking,
+                    p.desynced,
+                    p.country or "",
+                    -1 if p.handicap is None else p.handicap,
+                    -1 if p.disc_id is None else p.disc_id,
+                )
+                for p in replay["players"]
+            ],
+            # handicap: -1 en versiones < 11 (no se guarda); disc_id: -1 sin disco
+            # y "" en los textos ausentes, para no guardar "None"
+            [
+                ("id", np.int32),
+                ("name", str),
+                ("admin", bool),
+                ("team", str),
+                ("number", np.uint8),
+                ("avatar", str),
+                ("input", np.int32),
+                ("kicking", bool),
+                ("desynced", bool),
+                ("country", str),
+                ("handicap", np.int32),
+                ("disc_id", np.int32),
+            ],
+        ),
+        "messages": _columns(
+            [(m.index, m.delta_time, m.type) for m in replay["messages"]],
+            [("index", np.uint32), ("delta_time", np.uint32), ("type", np.uint8)],
+        ),
+    }
+    tables.update(action_tables(replay["actions"]))
+    tables.update(stadium_tables(stadium))
+    return tables
+
+
+def _resolve_format(path: str, format: Optional[str]) -> str:
+    if format is None:
+        if path.endswith(".npz"):
+            return "npz"
+        return "arrow" if _pyarrow(required=False) is not None else "npz"
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format!r}, expected one of {FORMATS}")
+    return format
+
+
+def write_tables(
+    tables: Tables, path: str, format: Optional[str] = None, compress: bool = False
+) -> str:
+    """
+    Write ``tables`` to ``path``. ``arrow`` (IPC file format) and ``parquet``
+    write a directory with one file per table; ``npz`` writes a single
+    archive with ``table.column`` keys. Without a format, ``.npz`` paths and
+    installs without pyarrow get npz, anything else Arrow.
+
+    Returns the path written (``.npz`` is appended to archives if missing).
+    """
+    path = os.fspath(path)
+    format = _resolve_format(path, format)
+
+    if format == "npz":
+        np = _numpy()
+        if not path.endswith(".npz"):
+            path += ".npz"
+        arrays = {
+            f"{table}.{column}": values
+            for table, columns in tables.items()
+            for column, values in columns.items()
+        }
+        (np.savez_compressed if compress else np.savez)(path, **arrays)
+        return path
+
+    pa = _pyarrow()
+    os.makedirs(path, exist_ok=True)
+    for name, columns in tables.items():
+        table = pa.table(
+            {column: pa.array(values) for column, values in columns.items()}
+        )
+        target = os.path.join(path, name + SUFFIXES[format])
+        if format == "parquet":
+            pa.parquet.write_table(
+                table, target, compression="zstd" if compress else "none"
+            )
+        else:
+            with (
+                pa.OSFile(target, "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table)
+    return path
+
+
+def read_tables(path: Union[str, os.PathLike]) -> Tables:
+    """
+    Load tables written by write_tables as ``{table: {column: array}}``.
+    Arrow files are memory-mapped.
+    """
+    path = os.fspath(path)
+    if os.path.isfile(path):
+        np = _numpy()
+        tables: Tables = {}
+        with np.load(path, allow_pickle=False) as archive:
+            for key in archive.files:
+                table, column = key.split(".", 1)
+                tables.setdefault(table, {})[column] = archive[key]
+        return tables
+
+    pa = _pyarrow()
+    tables = {}
+    for entry in sorted(os.listdir(path)):
+        name, suffix = os.path.splitext(entry)
+        target = os.path.join(path, entry)
+        if suffix == SUFFIXES["parquet"]:
+            table = pa.parquet.read_table(target)
+        elif suffix == SUFFIXES["arrow"]:
+            table = pa.ipc.open_file(pa.memory_map(target)).read_all()
+        else:
+            continue
+        tables[name] = {
+            column: table.column(column).to_numpy() for column in table.column_names
+        }
+    return tables
+
+
+def export_columns(
+    source: Union[str, os.PathLike, bytes, Parser, Dict[str, Any]],
+    path: Union[str, os.PathLike],
+    format: Optional[str] = None,
+    compress: bool = False,
+) -> str:
+    """
+    Export a replay as typed columns (see replay_tables and write_tables).
+    ``source`` is a .hbr2 path, its bytes, a Parser or an already parsed
+    replay. Returns the path written.
+    """
+    if isinstance(source, dict):
+        replay = source
+    else:
+        if isinstance(source, (str, os.PathLike)):
+            source = Parser.from_path(source)
+        elif not isinstance(source, Parser):
+            source = Parser(source)
+        replay = source.parse(columnar=True)
+    return write_tables(replay_tables(replay), os.fspath(path), format, compress)
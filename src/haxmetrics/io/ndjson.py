@@ -0,0 +1,175 @@
+# haxmetrics/io/ndjson.py
+
+import io
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Union
+
+from haxmetrics.models.action import Action
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.parser import Parser
+
+# Líneas acumuladas antes de cada write (memoria acotada)
+FLUSH_LINES = 4096
+
+
+def to_json(obj: Any) -> Any:
+    """``default`` hook for json: model objects, dataclasses and bytes."""
+    if hasattr(obj, "json_serialize"):
+        return obj.json_serialize()
+    if hasattr(obj, "to_json"):
+        return obj.to_json()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).hex()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_encode = json.JSONEncoder(default=to_json, separators=(",", ":")).encode
+
+
+def encode_record(record: str, fields: Dict[str, Any]) -> str:
+    return _encode({"record": record, **fields}) + "\n"
+
+
+def _input_encoder(prefix: str) -> Callable[[Action], str]:
+    def encode(action):
+        frame = action.frame
+        return (
+            f'{prefix}{frame},"replayTime":{round(frame / 60, 2)!r},'
+            f'"sender":{action.sender},"info":{{"input":{action.input}}}}}\n'
+        )
+
+    return encode
+
+
+def _generic_encoder(prefix: str) -> Callable[[Action], str]:
+    def encode(action):
+        frame = action.frame
+        return (
+            f'{prefix}{frame},"replayTime":{round(frame / 60, 2)!r},'
+            f'"sender":{action.sender},"info":{_encode(action.get_data())}}}\n'
+        )
+
+    return encode
+
+
+class ActionEncoder:
+    """
+    Per-class NDJSON encoders for actions, with the same fields as
+    Action.json_serialize. The constant part of each line is formatted once
+    per class; PlayerInput lines are built without an intermediate dict.
+    """
+
+    __slots__ = ("encoders",)
+
+    def __init__(self):
+        self.encoders: Dict[type, Callable[[Action], str]] = {}
+
+    def __call__(self, action: Action) -> str:
+        encoder = self.encoders.get(type(action))
+        if encoder is None:
+            encoder = self.encoders[type(action)] = self.compile(action)
+        return encoder(action)
+
+    @staticmethod
+    def compile(action: Action) -> Callable[[Action], str]:
+        # El tipo es constante por clase (lo fija su __init__)
+        prefix = f'{{"record":"action","type":{_encode(action.type)},"frame":'
+        if type(action) is PlayerInput:
+            return _input_encoder(prefix)
+        return _generic_encoder(prefix)
+
+
+def iter_records(parser: Parser, actions: Iterable[Action]) -> Iterable[str]:
+    """
+    NDJSON lines of a replay: header, messages, room, players, then one per
+    action. ``actions`` must come from ``parser.iter_parse`` so that the
+    state records are ready before the first action is pulled.
+    """
+    actions = iter(actions)
+    first = next(actions, None)  # Decodifica mensajes y sala
+
+    replay = parser.replay
+    yield encode_record(
+        "header", {"version": replay["version"], "duration": replay["duration"]}
+    )
+    for message in replay["messages"]:
+        yield encode_record(
+            "message",
+            {
+                "index": message.index,
+                "deltaTime": message.delta_time,
+                "type": message.type,
+                "data": message.data,
+            },
+        )
+    if replay["room_info"] is not None:
+        yield encode_record("room", replay["room_info"].json_serialize())
+    for player in replay["players"]:
+        yield encode_record("player", player.json_serialize())
+
+    if first is None:
+        return
+    encode = ActionEncoder()
+    yield encode(first)
+    for action in actions:
+        yield encode(action)
+
+
+def export_ndjson(
+    source: Union[str, os.PathLike, bytes, Parser],
+    out: Union[str, os.PathLike, IO],
+    types: Optional[Iterable] = None,
+    streaming: bool = True,
+    chunk_size: int = 64 * 1024,
+) -> int:
+    """
+    Write a replay as NDJSON in constant memory: actions are encoded as
+    they are decoded and written in batches of FLUSH_LINES lines.
+
+    Args:
+        source: path, bytes of a .hbr2 or a Parser (not parsed yet).
+        out: output path, or a binary or text file object (for a socket,
+            ``sock.makefile("wb")``).
+        types: only export these action types (see Parser.parse).
+        streaming: inflate on demand (default) instead of in one go.
+
+    Returns the number of records written.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        # El fichero comprimido también se lee por trozos
+        with open(source, "rb") as f:
+            return export_ndjson(Parser(f), out, types, streaming, chunk_size)
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "wb") as f:
+            return export_ndjson(source, f, types, streaming, chunk_size)
+
+    parser = source if isinstance(source, Parser) else Parser(source)
+
+    binary = not isinstance(out, io.TextIOBase)
+    records = iter_records(
+        parser, parser.iter_parse(streaming, chunk_size, types=types)
+    )
+    count = 0
+    batch = []
+    for line in records:
+        batch.append(line)
+        if len(batch) >= FLUSH_LINES:
+            count += _write(out, batch, binary)
+    count += _write(out, batch, binary)
+    if hasattr(out, "flush"):
+        out.flush()
+    return count
+
+
+def _write(out: IO, batch: list, binary: bool) -> int:
+    if not batch:
+        return 0
+    text = "".join(batch)
+    out.write(text.encode() if binary else text)
+    written = len(batch)
+    batch.clear()
+    return written
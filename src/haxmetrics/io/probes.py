@@ -0,0 +1,131 @@
+# haxmetrics/io/probes.py
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from haxmetrics.batch import expand_paths
+from haxmetrics.binary_reader import InflateReader
+from haxmetrics.parser import Parser
+
+# Trozos pequeños: la sala y el estadio suelen caber en los primeros KB
+PROBE_CHUNK_SIZE = 4096
+
+
+class ReplayProbe:
+    """
+    Header-level view of a replay: header fields, messages and room state,
+    decoded without touching the action stream.
+    """
+
+    __slots__ = (
+        "path",
+        "version",
+        "duration",
+        "room",
+        "stadium",
+        "custom_stadium",
+        "players",
+        "messages",
+        "compressed_size",
+        "inflated_bytes",
+    )
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self.version: Optional[int] = None
+        self.duration: Optional[int] = None
+        self.room: Optional[str] = None
+        self.stadium: Optional[str] = None
+        self.custom_stadium = False
+        self.players: List[Tuple[int, str, str]] = []
+        self.messages = 0
+        self.compressed_size = 0
+        self.inflated_bytes = 0  # Bytes descomprimidos para llegar a la sala
+
+    def get_replay_time(self) -> Optional[float]:
+        # 60 ticks/frames per second (standard for Haxball)
+        return round(self.duration / 60, 2) if self.duration is not None else None
+
+    def json_serialize(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "version": self.version,
+            "duration": self.duration,
+            "replayTime": self.get_replay_time(),
+            "room": self.room,
+            "stadium": self.stadium,
+            "customStadium": self.custom_stadium,
+            "players": [
+                {"id": id_, "name": name, "team": team}
+                for id_, name, team in self.players
+            ],
+            "messages": self.messages,
+            "compressedSize": self.compressed_size,
+            "inflatedBytes": self.inflated_bytes,
+        }
+
+
+def probe(path: str, chunk_size: int = PROBE_CHUNK_SIZE) -> ReplayProbe:
+    """
+    Read the header and inflate only what is needed (``chunk_size`` bytes at
+    a time) to decode messages and room: name, stadium and player list.
+    """
+    result = ReplayProbe()
+    result.path = str(path)
+    result.compressed_size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        parser = Parser(f)
+        result.version = parser.version
+        result.duration = parser.duration
+
+        reader = InflateReader(f, chunk_size)
+        replay = parser.parse_state(reader)
+        result.inflated_bytes = reader.length
+
+    room = replay["room_info"]
+    result.messages = len(replay["messages"])
+    result.room = room.name
+    if room.stadium is not None:
+        result.stadium = room.stadium.name
+        result.custom_stadium = room.stadium.custom
+    result.players = [(p.id, p.name, p.team) for p in replay["players"]]
+    return result
+
+
+@click.command()
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--json", "as_json", is_flag=True, help="One JSON object per replay.")
+@click.option(
+    "--pattern",
+    default="*.hbr2",
+    show_default=True,
+    help="Files to probe inside directories.",
+)
+def main_cli(paths, as_json, pattern):
+    """Print header, room and players of HaxBall replays without parsing actions."""
+    failed = 0
+    for path in expand_paths(paths, pattern):
+        try:
+            info = probe(path)
+        except Exception as e:
+            failed += 1
+            click.echo(f"{path}: error: {type(e).__name__}: {e}", err=True)
+            continue
+
+        if as_json:
+            click.echo(json.dumps(info.json_serialize(), ensure_ascii=False))
+        else:
+            players = ", ".join(name or "?" for _, name, _ in info.players)
+            click.echo(
+                f"{path}\tv{info.version}\t{info.get_replay_time()}s\t"
+                f"{info.room}\t{info.stadium}\t[{players}]"
+            )
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main_cli()
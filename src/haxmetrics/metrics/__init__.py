@@ -0,0 +1,16 @@
+"""
+Streaming metrics: Metric subclasses declare their inputs and register by
+name; MetricEngine runs any set of them over a replay in one pass.
+"""
+
+# Importar los módulos registra sus métricas
+from haxmetrics.metrics import builtin  # noqa: F401
+from haxmetrics.metrics.base import REGISTRY, Metric, get_metric, register
+from haxmetrics.metrics.engine import MetricEngine
+
+try:
+    from haxmetrics.metrics import heatmap
+except ImportError:  # Sin numpy no hay mapas de calor
+    heatmap = None  # type: ignore[assignment]
+
+__all__ = ["REGISTRY", "Metric", "MetricEngine", "get_metric", "register"]
@@ -0,0 +1,80 @@
+# haxmetrics/metrics/base.py
+
+from typing import Any, Dict, Tuple, Type
+
+from haxmetrics.models.action_types import ACTION_TYPES
+
+
+class Metric:
+    """
+    A metric computed while a replay streams past (see MetricEngine).
+
+    Subclasses declare the inputs they consume as class attributes and
+    only get those:
+
+    - ``actions``: action classes from ACTION_TYPES, passed to on_action()
+      in replay order
+    - ``messages``: ReplayMessage types (MessageType), passed to
+      on_message() before the first action
+    - ``frames``: True to get on_frame() with the Simulator after every
+      simulated tick (requires numpy)
+    - ``events``: True to get on_events() with the touch and kick rows
+      (EVENT_DTYPE) of every tick that produced some
+
+    The state is kept in the instance: start() resets it for a replay,
+    finish() closes it at the last frame and result() returns the value
+    reported under ``name``.
+    """
+
+    name: str = ""
+    actions: Tuple[type, ...] = ()
+    messages: Tuple[int, ...] = ()
+    frames = False
+    events = False
+
+    __slots__ = ()
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        pass
+
+    def on_action(self, action) -> None:
+        pass
+
+    def on_message(self, message) -> None:
+        pass
+
+    def on_frame(self, simulator) -> None:
+        pass
+
+    def on_events(self, events) -> None:
+        pass
+
+    def finish(self, frame: int) -> None:
+        pass
+
+    def result(self) -> Any:
+        raise NotImplementedError
+
+
+# Métricas disponibles por nombre (ver register)
+REGISTRY: Dict[str, Type[Metric]] = {}
+
+
+def register(cls: Type[Metric]) -> Type[Metric]:
+    """Class decorator: make a Metric available by its ``name``."""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} has no name")
+    if REGISTRY.get(cls.name, cls) is not cls:
+        raise ValueError(f"Metric {cls.name!r} is already registered")
+    unknown = [action.__name__ for action in cls.actions if action not in ACTION_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown action types: {', '.join(unknown)}")
+    REGISTRY[cls.name] = cls
+    return cls
+
+
+def get_metric(name: str) -> Type[Metric]:
+    try:
+        return REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"Unknown metric: {name}") from None
@@ -0,0 +1,233 @@
+# haxmetrics/metrics/builtin.py
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from haxmetrics.input_timeline import KICK
+from haxmetrics.metrics.base import Metric, register
+from haxmetrics.models.actions.change_paused import ChangePaused
+from haxmetrics.models.actions.chat_message import ChatMessage
+from haxmetrics.models.actions.match_start import MatchStart
+from haxmetrics.models.actions.match_stopped import MatchStopped
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.models.actions.player_joined import PlayerJoined
+from haxmetrics.models.actions.player_left import PlayerLeft
+from haxmetrics.models.actions.player_team_change import PlayerTeamChange
+from haxmetrics.models.stadium.stadium import Stadium
+
+FRAMES_PER_SECOND = 60
+RED, BLUE = 1, 2
+
+
+def _team(team) -> int:
+    # Room.parse guarda el equipo como nombre; las acciones, como número
+    if isinstance(team, str):
+        return Stadium.TEAMS.index(team) if team in Stadium.TEAMS else 0
+    return int(team or 0)
+
+
+class _RosterMetric(Metric):
+    """
+    Frames every player spent on each team while a game was running and
+    not paused, from the roster and match actions.
+    """
+
+    actions = (
+        PlayerJoined,
+        PlayerLeft,
+        PlayerTeamChange,
+        MatchStart,
+        MatchStopped,
+        ChangePaused,
+    )
+
+    __slots__ = ("team", "frames_on", "running", "paused", "since")
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        room = replay["room_info"]
+        self.team: Dict[int, int] = {p.id: _team(p.team) for p in room.players or []}
+        self.frames_on: Dict[int, List[int]] = {}
+        self.running = bool(room.in_progress)
+        self.paused = bool(
+            room.in_progress and room.game is not None and room.game.pause_timer
+        )
+        self.since = (
+            (room.game.frame or 0) if room.in_progress and room.game is not None else 0
+        )
+
+    def _credit(self, frame: int) -> None:
+        """Add the frames since the last change to everyone on a team."""
+        if self.running and not self.paused and frame > self.since:
+            elapsed = frame - self.since
+            for player_id, team in self.team.items():
+                if team in (RED, BLUE):
+                    self.frames_on.setdefault(player_id, [0, 0, 0])[team] += elapsed
+        self.since = max(self.since, frame)
+
+    def on_action(self, action) -> None:
+        self._credit(action.frame)
+        kind = type(action)
+        if kind is PlayerTeamChange:
+            self.team[action.player_id] = action.team
+        elif kind is PlayerJoined:
+            self.team.setdefault(action.player_id, 0)
+        elif kind is PlayerLeft:
+            self.team.pop(action.player_id, None)
+        elif kind is MatchStart:
+            self.running, self.paused = True, False
+        elif kind is MatchStopped:
+            self.running = False
+        elif kind is ChangePaused:
+            self.paused = bool(action.paused)
+
+    def finish(self, frame: int) -> None:
+        self._credit(frame)
+
+
+@register
+class MinutesPlayed(_RosterMetric):
+    """Minutes each player spent on red or blue during a game."""
+
+    name = "minutes_played"
+
+    __slots__ = ()
+
+    def result(self) -> Dict[int, float]:
+        return {
+            player_id: round((frames[RED] + frames[BLUE]) / FRAMES_PER_SECOND / 60, 2)
+            for player_id, frames in self.frames_on.items()
+        }
+
+
+@register
+class TeamTime(_RosterMetric):
+    """Seconds each player spent on each team during a game."""
+
+    name = "team_time"
+
+    __slots__ = ()
+
+    def result(self) -> Dict[int, Dict[str, float]]:
+        return {
+            player_id: {
+                Stadium.TEAMS[team]: round(frames[team] / FRAMES_PER_SECOND, 2)
+                for team in (RED, BLUE)
+            }
+            for player_id, frames in self.frames_on.items()
+        }
+
+
+@register
+class KickPresses(Metric):
+    """Times each player pressed the kick key (PlayerInput bit 16 going down)."""
+
+    name = "kick_presses"
+    actions = (PlayerInput,)
+
+    __slots__ = ("inputs", "presses")
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        room = replay["room_info"]
+        self.inputs: Dict[int, int] = {p.id: p.input or 0 for p in room.players or []}
+        self.presses: Dict[int, int] = {}
+
+    def on_action(self, action) -> None:
+        sender, input_ = action.sender, action.input
+        if input_ & KICK and not self.inputs.get(sender, 0) & KICK:
+            self.presses[sender] = self.presses.get(sender, 0) + 1
+        self.inputs[sender] = input_
+
+    def result(self) -> Dict[int, int]:
+        return dict(self.presses)
+
+
+@register
+class ChatMessages(Metric):
+    """Chat messages sent by each player."""
+
+    name = "chat_messages"
+    actions = (ChatMessage,)
+
+    __slots__ = ("counts",)
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        self.counts: Dict[int, int] = {}
+
+    def on_action(self, action) -> None:
+        self.counts[action.sender] = self.counts.get(action.sender, 0) + 1
+
+    def result(self) -> Dict[int, int]:
+        return dict(self.counts)
+
+
+@register
+class Goals(Metric):
+    """Goals scored in the simulation: final score and (frame, team) of each."""
+
+    name = "goals"
+    frames = True
+
+    __slots__ = ("score", "goals")
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        self.score: Optional[Tuple[int, int]] = None
+        self.goals: List[Dict[str, Any]] = []
+
+    def on_frame(self, simulator) -> None:
+        score = (simulator.score_red, simulator.score_blue)
+        previous = self.score or score
+        self.score = score
+        # Un reinicio de partida pone el marcador a 0 sin que haya gol
+        for team, before, after in (
+            (RED, previous[0], score[0]),
+            (BLUE, previous[1], score[1]),
+        ):
+            if after > before:
+                self.goals.append(
+                    {"frame": simulator.frame, "team": Stadium.TEAMS[team]}
+                )
+
+    def result(self) -> Dict[str, Any]:
+        red, blue = self.score or (0, 0)
+        return {"red": red, "blue": blue, "goals": self.goals}
+
+
+@register
+class BallContacts(Metric):
+    """
+    Simulated contacts of each player with the ball: touches (ticks where
+    a touch starts, so a dribble counts once) and kicks that hit it.
+    """
+
+    name = "ball_contacts"
+    events = True
+
+    __slots__ = ("touches", "kicks", "touching")
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        self.touches: Dict[int, int] = {}
+        self.kicks: Dict[int, int] = {}
+        self.touching: Dict[int, int] = {}  # Último frame con contacto, por jugador
+
+    def on_events(self, events) -> None:
+        from haxmetrics.sim.events import KICK as KICK_EVENT
+
+        events = events[events["target"] == 0]
+        for frame, kind, player in zip(
+            events["frame"].tolist(), events["kind"].tolist(), events["player"].tolist()
+        ):
+            if kind == KICK_EVENT:
+                self.kicks[player] = self.kicks.get(player, 0) + 1
+                continue
+            if self.touching.get(player) != frame - 1:
+                self.touches[player] = self.touches.get(player, 0) + 1
+            self.touching[player] = frame
+
+    def result(self) -> Dict[int, Dict[str, int]]:
+        players = sorted(set(self.touches) | set(self.kicks))
+        return {
+            player: {
+                "touches": self.touches.get(player, 0),
+                "kicks": self.kicks.get(player, 0),
+            }
+            for player in players
+        }
@@ -0,0 +1,143 @@
+# haxmetrics/metrics/engine.py
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Type, Union
+
+from haxmetrics.binary_reader import InflateReader
+from haxmetrics.metrics.base import REGISTRY, Metric, get_metric
+from haxmetrics.parser import Parser
+
+
+class MetricEngine:
+    """
+    Runs many metrics over a replay in a single pass: every message, action
+    and (when some metric asks for them) simulated tick is read once and
+    handed to the metrics that declared it as an input.
+
+    ``metrics`` are registered names, Metric classes or instances (default:
+    every registered metric). The dispatch tables are built once here, so
+    an engine can be reused for any number of replays.
+    """
+
+    __slots__ = ("metrics", "_on_action", "_on_message", "_on_frame", "_on_events")
+
+    def __init__(self, metrics: Optional[Iterable[Union[str, type, Metric]]] = None):
+        chosen = REGISTRY.values() if metrics is None else metrics
+        self.metrics: List[Metric] = [self._instance(metric) for metric in chosen]
+        names = [metric.name for metric in self.metrics]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate metric names")
+
+        self._on_action: Dict[type, list] = {}
+        self._on_message: Dict[int, list] = {}
+        for metric in self.metrics:
+            for action in metric.actions:
+                self._on_action.setdefault(action, []).append(metric.on_action)
+            for message in metric.messages:
+                self._on_message.setdefault(message, []).append(metric.on_message)
+        self._on_frame = [metric.on_frame for metric in self.metrics if metric.frames]
+        self._on_events = [metric.on_events for metric in self.metrics if metric.events]
+
+    @staticmethod
+    def _instance(metric: Union[str, Type[Metric], Metric]) -> Metric:
+        if isinstance(metric, str):
+            metric = get_metric(metric)
+        return metric() if isinstance(metric, type) else metric
+
+    @property
+    def simulates(self) -> bool:
+        """True when some metric needs the simulation (frames or events)."""
+        return bool(self._on_frame or self._on_events)
+
+    @property
+    def action_types(self) -> Set[type]:
+        """Action classes the metrics (and the simulation, if any) consume."""
+        types = set(self._on_action)
+        if self.simulates:
+            from haxmetrics.sim.simulator import Simulator
+
+            types.update(Simulator.ACTIONS)
+        return types
+
+    def run(self, replay: Dict[str, Any]) -> Dict[str, Any]:
+        """Results by metric name for a replay from Parser.parse."""
+        return self._run(replay, replay["actions"])
+
+    def parse(
+        self, replay_data, streaming: bool = True, chunk_size: int = 64 * 1024
+    ) -> Dict[str, Any]:
+        """
+        Parse and compute in the same pass: only the actions in
+        ``action_types`` are decoded (see Parser.parse ``types``), and they
+        go to the metrics as they come out of the decoder without being
+        stored.
+        """
+        parser = Parser(replay_data)
+        reader = (
+            InflateReader(parser.source, chunk_size, None, parser.strings)
+            if streaming
+            else parser.inflate()
+        )
+        replay = parser.parse_state(reader)
+        return self._run(replay, parser.iter_actions(reader, types=self.action_types))
+
+    def _run(self, replay: Dict[str, Any], actions: Iterable) -> Dict[str, Any]:
+        for metric in self.metrics:
+            metric.start(replay)
+
+        if self._on_message:
+            on_message = self._on_message
+            for message in replay["messages"] or ():
+                for handler in on_message.get(message.type, ()):
+                    handler(message)
+
+        on_action = self._on_action
+        if not self.simulates:
+            for action in actions:
+                handlers = on_action.get(type(action))
+                if handlers is not None:
+                    for handler in handlers:
+                        handler(action)
+        else:
+            self._simulate(replay, actions)
+
+        end = replay["duration"]
+        for metric in self.metrics:
+            metric.finish(end)
+        return {metric.name: metric.result() for metric in self.metrics}
+
+    def _simulate(self, replay: Dict[str, Any], actions: Iterable) -> None:
+        """The action loop of Simulator.run, with the metrics fed after every tick."""
+        from haxmetrics.sim.simulator import Simulator
+
+        simulator = Simulator.from_replay(replay)
+        on_action, on_frame, on_events = (
+            self._on_action,
+            self._on_frame,
+            self._on_events,
+        )
+        log = simulator.events
+        seen = 0
+
+        def tick():
+            nonlocal seen
+            simulator.tick()
+            for handler in on_frame:
+                handler(simulator)
+            if len(log) > seen:
+                events = log.events[seen:]
+                seen = len(log)
+                for handler in on_events:
+                    handler(events)
+
+        for handler in on_frame:
+            handler(simulator)
+        for action in actions:
+            while simulator.frame < action.frame:
+                tick()
+            simulator.apply(action)
+            handlers = on_action.get(type(action))
+            if handlers is not None:
+                for handler in handlers:
+                    handler(action)
+        while simulator.frame < replay["duration"]:
+            tick()
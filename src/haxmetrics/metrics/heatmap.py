@@ -0,0 +1,304 @@
+# haxmetrics/metrics/heatmap.py
+
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("haxmetrics.metrics.heatmap requires numpy") from e
+
+from haxmetrics.metrics.base import Metric, register
+from haxmetrics.models.actions.player_joined import PlayerJoined
+from haxmetrics.models.stadium.stadium import Stadium
+
+# Medio ancho y medio alto del estadio clásico, para estadios sin dimensiones
+DEFAULT_HALF_SIZE = (420.0, 200.0)
+DEFAULT_CELL_SIZE = 10.0
+
+BALL = "ball"
+
+
+def team_key(team: int) -> str:
+    return "team:" + Stadium.TEAMS[team]
+
+
+def player_key(name) -> str:
+    return f"player:{name}"
+
+
+class Heatmaps:
+    """
+    Position histograms over one fixed grid, one per key (``"ball"``,
+    ``"team:Red"``, ``"player:<name>"``...).
+
+    ``extent`` is (x0, y0, x1, y1) in stadium units and ``shape`` the
+    number of (columns, rows); ``counts`` is (keys, rows, columns) int64,
+    row 0 at ``y0``. Positions outside the extent count in the nearest
+    edge cell; NaN positions are ignored.
+
+    Heatmaps with the same grid merge by adding their counts (merge,
+    merged), so maps computed per replay, or per worker of parse_many,
+    add up without simulating again. save() writes an .npz with the
+    counts in the smallest unsigned type that holds them.
+    """
+
+    __slots__ = ("extent", "shape", "keys", "counts", "_index")
+
+    def __init__(
+        self, extent: Tuple[float, float, float, float], shape: Tuple[int, int]
+    ):
+        x0, y0, x1, y1 = (float(value) for value in extent)
+        if not (x1 > x0 and y1 > y0):
+            raise ValueError(f"Empty heatmap extent: {extent}")
+        self.extent = (x0, y0, x1, y1)
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.keys: List[str] = []
+        self.counts = np.zeros((0, self.shape[1], self.shape[0]), dtype=np.int64)
+        self._index: Dict[str, int] = {}
+
+    @classmethod
+    def for_stadium(
+        cls, stadium: Optional[Stadium], cell_size: float = DEFAULT_CELL_SIZE
+    ) -> "Heatmaps":
+        """
+        Grid centred on the stadium, wide enough for its width and height,
+        its background and its vertexes (goals and walls often lie outside
+        the background); DEFAULT_HALF_SIZE when none of them is known.
+        """
+        sizes: List[Tuple[Optional[float], Optional[float]]] = []
+        if stadium is not None:
+            sizes.append((stadium.width, stadium.height))
+            if stadium.background is not None:
+                sizes.append((stadium.background.width, stadium.background.height))
+            if stadium.vertexes:
+                sizes.append(
+                    (
+                        max(abs(v.x) for v in stadium.vertexes),
+                        max(abs(v.y) for v in stadium.vertexes),
+                    )
+                )
+        known = [
+            (width, height)
+            for width, height in sizes
+            if width and height and width > 0 and height > 0
+        ]
+        width, height = (
+            (max(w for w, _ in known), max(h for _, h in known))
+            if known
+            else DEFAULT_HALF_SIZE
+        )
+        shape = (
+            max(1, int(np.ceil(2 * width / cell_size))),
+            max(1, int(np.ceil(2 * height / cell_size))),
+        )
+        return cls((-width, -height, width, height), shape)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __getitem__(self, key: str):
+        """(rows, columns) counts of ``key``."""
+        return self.counts[self._index[key]]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Heatmaps):
+            return NotImplemented
+        return (
+            self.extent == other.extent
+            and self.shape == other.shape
+            and self.keys == other.keys
+            and np.array_equal(self.counts, other.counts)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def nbytes(self) -> int:
+        return self.counts.nbytes
+
+    def index(self, key: str) -> int:
+        """Position of ``key`` in ``counts``, adding an empty map if new."""
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.keys)
+            self.keys.append(key)
+            self.counts = np.concatenate(
+                (self.counts, np.zeros((1, *self.counts.shape[1:]), dtype=np.int64))
+            )
+        return index
+
+    def cells(self, x, y):
+        """Flat cell (row * columns + column) of every position."""
+        x0, y0, x1, y1 = self.extent
+        columns, rows = self.shape
+        column = np.clip(
+            np.floor((x - x0) * (columns / (x1 - x0))), 0, columns - 1
+        ).astype(np.intp)
+        row = np.clip(np.floor((y - y0) * (rows / (y1 - y0))), 0, rows - 1).astype(
+            np.intp
+        )
+        return row * columns + column
+
+    def add(self, key: str, x, y) -> None:
+        """Count positions (arrays ``x`` and ``y``) for one key."""
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        self.add_indexed(np.full(len(x), self.index(key), dtype=np.intp), x, y)
+
+    def add_indexed(self, keys, x, y) -> None:
+        """Count positions for several keys at once: ``keys[i]`` is an index()."""
+        keep = np.isfinite(x) & np.isfinite(y)
+        if not keep.all():
+            keys, x, y = keys[keep], x[keep], y[keep]
+        if not len(keys):
+            return
+        size = self.shape[0] * self.shape[1]
+        flat = keys * size + self.cells(x, y)
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(
+            self.counts.shape
+        )
+
+    def compatible(self, other: "Heatmaps") -> bool:
+        return self.extent == other.extent and self.shape == other.shape
+
+    def merge(self, other: "Heatmaps") -> "Heatmaps":
+        """Add the counts of ``other`` (same grid) into these; returns self."""
+        if not self.compatible(other):
+            raise ValueError("Heatmaps with different grids cannot be merged")
+        for key, counts in zip(other.keys, other.counts):
+            index = self.index(key)  # Puede ampliar self.counts
+            self.counts[index] += counts
+        return self
+
+    @classmethod
+    def merged(cls, parts: Iterable["Heatmaps"]) -> Optional["Heatmaps"]:
+        """Sum of ``parts`` in a new Heatmaps (None when there are none)."""
+        total = None
+        for part in parts:
+            if total is None:
+                total = cls(part.extent, part.shape)
+            total.merge(part)
+        return total
+
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> str:
+        """Write an .npz (appended to ``path`` if missing); returns the path."""
+        path = os.fspath(path)
+        if not path.endswith(".npz"):
+            path += ".npz"
+        peak = int(self.counts.max()) if self.counts.size else 0
+        dtype = next(
+            t
+            for t in (np.uint8, np.uint16, np.uint32, np.uint64)
+            if peak <= np.iinfo(t).max
+        )
+        np.savez_compressed(
+            path,
+            extent=np.array(self.extent),
+            shape=np.array(self.shape),
+            keys=np.array(self.keys, dtype=str),
+            counts=self.counts.astype(dtype),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path) -> "Heatmaps":
+        with np.load(os.fspath(path)) as data:
+            heatmaps = cls(
+                tuple(data["extent"].tolist()), tuple(data["shape"].tolist())
+            )
+            for key in data["keys"].tolist():
+                heatmaps.index(key)
+            heatmaps.counts[:] = data["counts"]
+        return heatmaps
+
+
+@register
+class PositionHeatmaps(Metric):
+    """
+    Heatmaps of the simulated ball, teams and players (by name) on the
+    grid of the stadium, counting every frame of a running, unpaused game.
+    Positions are buffered and binned every FLUSH_FRAMES frames.
+    """
+
+    name = "heatmaps"
+    actions = (PlayerJoined,)
+    frames = True
+
+    FLUSH_FRAMES = 1024
+
+    __slots__ = ("heatmaps", "names", "_ball", "_positions", "_owners", "_teams")
+
+    def start(self, replay: Dict[str, Any]) -> None:
+        room = replay["room_info"]
+        self.heatmaps = Heatmaps.for_stadium(room.stadium)
+        self.names: Dict[int, str] = {p.id: p.name for p in room.players or []}
+        self._ball: List[complex] = []
+        self._positions: List[Any] = []
+        self._owners: List[Any] = []
+        self._teams: List[Any] = []
+
+    def on_action(self, action) -> None:
+        self.names[action.player_id] = action.name
+
+    def on_frame(self, simulator) -> None:
+        if not simulator.running or simulator.pause_timer:
+            return
+        position = simulator.world.position
+        slot, team = simulator.player_slot, simulator.player_team
+        on = (slot >= 0) & (team != 0)
+        self._ball.append(position[simulator.slots[0]])
+        self._positions.append(position[slot[on]])
+        self._owners.append(simulator.player_ids[on])
+        self._teams.append(team[on])
+        if len(self._ball) >= self.FLUSH_FRAMES:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._ball:
+            return
+        ball = np.array(self._ball)
+        position = np.concatenate(self._positions)
+        owners = np.concatenate(self._owners)
+        teams = np.concatenate(self._teams)
+        self._ball, self._positions, self._owners, self._teams = [], [], [], []
+
+        heatmaps = self.heatmaps
+        # Cada jugador cuenta en su mapa y en el de su equipo
+        players, rows = np.unique(owners, return_inverse=True)
+        player_keys = np.array(
+            [
+                heatmaps.index(player_key(self.names.get(player) or player))
+                for player in players.tolist()
+            ],
+            dtype=np.intp,
+        )
+        team_keys = np.zeros(len(Stadium.TEAMS), dtype=np.intp)
+        for team in np.unique(teams).tolist():
+            team_keys[team] = heatmaps.index(team_key(team))
+        keys = np.concatenate(
+            (
+                np.full(len(ball), heatmaps.index(BALL), dtype=np.intp),
+                player_keys[rows.reshape(-1)],
+                team_keys[teams],
+            )
+        )
+        x = np.concatenate((ball.real, position.real, position.real))
+        y = np.concatenate((ball.imag, position.imag, position.imag))
+        heatmaps.add_indexed(keys, x, y)
+
+    def finish(self, frame: int) -> None:
+        self._flush()
+
+    def result(self) -> Heatmaps:
+        return self.heatmaps
+
+
+def replay_heatmaps(replay: Dict[str, Any]) -> Heatmaps:
+    """Heatmaps of a parsed replay; picklable ``reduce`` for parse_many."""
+    from haxmetrics.metrics.engine import MetricEngine
+
+    heatmaps: Heatmaps = MetricEngine([PositionHeatmaps]).run(replay)["heatmaps"]
+    return heatmaps
@@ -2,6 +2,8 @@ from typing import Any, Dict, Optional
 
 
 class Action:
+    __slots__ = ("type", "frame", "sender")
+
     def __init__(self):
         self.type: Optional[str] = None
         self.frame: Optional[int] = None
@@ -12,6 +14,15 @@ class Action:
         # In actual subclasses, override with real parsing logic
         return cls()
 
+    @classmethod
+    def skip(cls, reader):
+        """
+        Advance the reader past the payload without building the action.
+        Subclasses override it with a cheaper routine; unlike parse() it
+        does not validate the payload.
+        """
+        cls.parse(reader)
+
     def json_serialize(self) -> Dict[str, Any]:
         return {
             "type": self.type,
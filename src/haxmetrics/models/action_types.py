@@ -52,3 +52,6 @@ ACTION_TYPES = [
     PlayerAvatarSet,        # 22 (Gb) - Player avatar set
     DiscUpdate,             # 23 (Hb) - Disc/physics update
 ]
+
+# Reverse mapping: action class -> type id in the replay stream
+ACTION_TYPE_IDS = {cls: type_id for type_id, cls in enumerate(ACTION_TYPES)}
@@ -7,6 +7,8 @@ class AutoTeamBalance(Action):
     Auto team balance - no data fields
     xa(): (empty)
     """
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.type = "AutoTeamBalance"
@@ -17,5 +19,9 @@ class AutoTeamBalance(Action):
         # No fields to parse
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        pass  # No fields to skip
+
     def get_data(self):
         return {}
@@ -7,6 +7,8 @@ class AvatarChange(Action):
     Avatar change
     xa(): nullable string ac (max 2 chars)
     """
+    __slots__ = ("avatar",)
+
     def __init__(self):
         super().__init__()
         self.type = "AvatarChange"
@@ -20,5 +22,9 @@ class AvatarChange(Action):
             obj.avatar = obj.avatar[:2]  # Truncate to 2 chars
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_nullable_string()
+
     def get_data(self):
         return {"avatar": self.avatar}
@@ -7,6 +7,8 @@ class BroadcastPings(Action):
     Pings update - array of player pings
     xa(): array of pings (varint count, then each ping as varint)
     """
+    __slots__ = ("pings",)
+
     def __init__(self):
         super().__init__()
         self.type = "BroadcastPings"
@@ -21,5 +23,11 @@ class BroadcastPings(Action):
             obj.pings.append(ping)
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        count = reader.read_varint()
+        for _ in range(count):
+            reader.read_varint()
+
     def get_data(self):
         return {"pings": self.pings}
@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class ChangeColors(Action):
+    __slots__ = ("team", "colors")
+
     def __init__(self):
         super().__init__()
         self.team = None
@@ -7,6 +7,8 @@ class ChangeGameSetting(Action):
     Game settings change
     xa(): int Gj (setting type), int newValue
     """
+    __slots__ = ("setting", "value")
+
     def __init__(self):
         super().__init__()
         self.type = "ChangeGameSetting"
@@ -20,5 +22,9 @@ class ChangeGameSetting(Action):
         obj.value = reader.read_int32()  # N() - int32
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(8)  # 2 x int32
+
     def get_data(self):
         return {"setting": self.setting, "value": self.value}
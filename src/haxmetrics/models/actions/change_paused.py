@@ -7,6 +7,8 @@ class ChangePaused(Action):
     Pause toggle
     xa(): bool Pf (paused state)
     """
+    __slots__ = ("paused",)
+
     def __init__(self):
         super().__init__()
         self.type = "ChangePaused"
@@ -18,5 +20,9 @@ class ChangePaused(Action):
         obj.paused = reader.read_uint8()
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(1)
+
     def get_data(self):
         return {"paused": self.paused}
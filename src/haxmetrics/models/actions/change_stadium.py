@@ -1,5 +1,5 @@
 from ..action import Action
-import zlib
+from ..stadium.handle import StadiumHandle
 
 
 class ChangeStadium(Action):
@@ -7,19 +7,36 @@ class ChangeStadium(Action):
     Action index 2 (cb in original JS)
     Stadium change - loads stadium from compressed bytes
     xa(): bytes dh (stadium data, length-prefixed)
+
+    The bytes are kept in a StadiumHandle, decoded only by get_stadium().
     """
+    __slots__ = ("handle",)
+
     def __init__(self):
         super().__init__()
         self.type = "ChangeStadium"
-        self.stadium = None
+        self.handle = None
 
     @classmethod
     def parse(cls, reader):
         obj = cls()
         # Read length as varint, then read that many bytes
         length = reader.read_varint()  # Bb()
-        obj.stadium = reader.read_bytes(length)  # bm()
+        obj.handle = StadiumHandle.read(reader, length)  # bm()
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        # Sin copiar los bytes del estadio
+        reader.skip_bytes(reader.read_varint())
+
+    @property
+    def stadium(self):
+        """Raw (compressed) stadium bytes."""
+        return self.handle.raw if self.handle is not None else None
+
+    def get_stadium(self):
+        return self.handle.stadium if self.handle is not None else None
+
     def get_data(self):
         return {"stadium_data_size": len(self.stadium) if self.stadium else 0}
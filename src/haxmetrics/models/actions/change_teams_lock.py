@@ -7,6 +7,8 @@ class ChangeTeamsLock(Action):
     Lock teams
     xa(): bool newValue
     """
+    __slots__ = ("teams_locked",)
+
     def __init__(self):
         super().__init__()
         self.type = "ChangeTeamsLock"
@@ -18,5 +20,9 @@ class ChangeTeamsLock(Action):
         obj.teams_locked = reader.read_uint8()
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(1)
+
     def get_data(self):
         return {"teams_locked": self.teams_locked}
@@ -7,6 +7,8 @@ class ChatMessage(Action):
     Chat message from player
     xa(): string $c (max 140)
     """
+    __slots__ = ("message",)
+
     def __init__(self):
         super().__init__()
         self.type = "ChatMessage"
@@ -20,5 +22,9 @@ class ChatMessage(Action):
             raise ValueError("message too long")
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_string()
+
     def get_data(self):
         return {"message": self.message}
@@ -7,6 +7,8 @@ class Desynced(Action):
     Desync notification
     xa(): bool kh
     """
+    __slots__ = ("flag",)
+
     def __init__(self):
         super().__init__()
         self.type = "Desynced"
@@ -18,5 +20,9 @@ class Desynced(Action):
         obj.flag = reader.read_uint8()  # F() - byte
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(1)
+
     def get_data(self):
         return {"flag": self.flag}
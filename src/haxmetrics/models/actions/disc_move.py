@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class DiscMove(Action):
+    __slots__ = ("disc_id", "x", "y", "xspeed", "yspeed", "radius")
+
     def __init__(self):
         super().__init__()
         self.disc_id = None
@@ -1,48 +1,135 @@
+import struct
+from typing import Dict, List, Optional, Tuple, cast
+
 from ..action import Action
 
+FLOAT_FIELDS = 10  # Ma: x, y, vx, vy, ax, ay, radius, bcoeff, invMass, damping
+INT_FIELDS = 3  # Yc: color, cMask, cGroup
+FIELDS_MASK = (1 << (FLOAT_FIELDS + INT_FIELDS)) - 1
+FIELD_NAMES = (
+    "x", "y", "vx", "vy", "ax", "ay", "radius", "b_coef", "inv_mass", "damping",
+    "color", "c_mask", "c_group",
+)
+
+_HEADER = struct.Struct("<iBH")  # disc_id, is_player_disc, flags
+
+# Por máscara de presencia: registro completo (cabecera + bytes de los
+# campos presentes) y formato de esos campos
+_RECORDS: Dict[int, struct.Struct] = {}
+_FIELDS: Dict[int, struct.Struct] = {}
+
+
+def fields_struct(flags: int) -> struct.Struct:
+    """Struct of the present fields (float32 then int32) for ``flags``."""
+    mask = flags & FIELDS_MASK
+    fields = _FIELDS.get(mask)
+    if fields is None:
+        floats = bin(mask & ((1 << FLOAT_FIELDS) - 1)).count("1")
+        ints = bin(mask >> FLOAT_FIELDS).count("1")
+        fields = _FIELDS[mask] = struct.Struct(f"<{floats}f{ints}i")
+    return fields
+
+
+def record_struct(flags: int) -> struct.Struct:
+    """Struct of a whole update for ``flags``: header, then the field bytes."""
+    mask = flags & FIELDS_MASK
+    record = _RECORDS.get(mask)
+    if record is None:
+        record = _RECORDS[mask] = struct.Struct(f"<iBH{fields_struct(mask).size}s")
+    return record
+
 
 class DiscUpdate(Action):
     """
     Action index 23 (Hb in original JS)
     Disc/physics update with nullable fields
-    xa(): int Ke (disc_id), bool sn (is_player_disc), 
+    xa(): int Ke (disc_id), bool sn (is_player_disc),
           10 nullable floats in Ma array (x, y, vx, vy, ax, ay, radius, bcoeff, invMass, damping),
           3 nullable ints in Yc array (color, cMask, cGroup)
+
+    Stored as a compact record: ``flags`` (presence bitmask, bit i for field
+    i) and ``record``, the replay bytes of the present fields (float32 and
+    int32, little endian, in bit order). ``values`` decodes them as a
+    tuple, and ``ma`` and ``yc`` expand them to the 10/3 nullable fields:
+    they are rebuilt on every access, so they are changed by assigning a
+    whole sequence (``update.ma = [...]``), never item by item. Floats
+    keep float32 precision, as in the replay.
     """
+    __slots__ = ("disc_id", "is_player_disc", "flags", "record")
+
     def __init__(self):
         super().__init__()
         self.type = "DiscUpdate"
         self.disc_id = None
         self.is_player_disc = False
-        self.ma = [None] * 10  # Float array
-        self.yc = [None] * 3   # Int array
+        self.flags = 0
+        self.record = b""
 
     @classmethod
     def parse(cls, reader):
         obj = cls()
-        obj.disc_id = reader.read_int32()  # N() - int32
-        obj.is_player_disc = reader.read_byte() != 0  # F() - byte as bool
-        flags = reader.read_uint16()  # Sb() - uint16 flags
-        
-        # Parse Ma array (10 nullable floats)
-        bit = 1
-        for i in range(10):
-            if (flags & bit) != 0:
-                obj.ma[i] = reader.read_float_le()  # Ci() - float32
-            bit <<= 1
-        
-        # Parse Yc array (3 nullable ints)
-        for i in range(3):
-            if (flags & bit) != 0:
-                obj.yc[i] = reader.read_int32()  # N() - int32
-            bit <<= 1
-        
+        # La máscara (tras int32 + byte) decide el formato: un solo unpack
+        header = reader.peek_bytes(_HEADER.size)
+        flags = int.from_bytes(header[5:7], "little")
+        record = reader.unpack(record_struct(flags), "DiscUpdate")
+        obj.disc_id = record[0]  # N() - int32
+        obj.is_player_disc = record[1] != 0  # F() - byte as bool
+        obj.flags = record[2]  # Sb() - uint16 flags
+        obj.record = record[3]  # Ci() float32 x Ma, then N() int32 x Yc
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(5)  # int32 id + byte
+        flags = reader.read_uint16()
+        # 4 bytes por campo presente (10 floats + 3 ints)
+        reader.skip_bytes(4 * bin(flags & FIELDS_MASK).count("1"))
+
+    @property
+    def values(self) -> Tuple[float, ...]:
+        """The present fields, in bit order."""
+        return fields_struct(self.flags).unpack(self.record)
+
+    @values.setter
+    def values(self, values) -> None:
+        self.record = fields_struct(self.flags).pack(*values)
+
+    def fields(self) -> List[Optional[float]]:
+        """The 13 nullable fields (Ma then Yc), None where absent."""
+        values = iter(self.values)
+        flags = self.flags
+        return [
+            next(values) if flags & (1 << i) else None
+            for i in range(FLOAT_FIELDS + INT_FIELDS)
+        ]
+
+    def _store(self, ma, yc) -> None:
+        fields = list(ma) + list(yc)
+        self.flags = sum(1 << i for i, value in enumerate(fields) if value is not None)
+        self.values = [value for value in fields if value is not None]
+
+    @property
+    def ma(self) -> Tuple[Optional[float], ...]:
+        return tuple(self.fields()[:FLOAT_FIELDS])
+
+    @ma.setter
+    def ma(self, values) -> None:
+        self._store(values, self.yc)
+
+    @property
+    def yc(self) -> Tuple[Optional[int], ...]:
+        # Los campos Yc salen del struct como int
+        return cast(Tuple[Optional[int], ...], tuple(self.fields()[FLOAT_FIELDS:]))
+
+    @yc.setter
+    def yc(self, values) -> None:
+        self._store(self.ma, values)
+
     def get_data(self):
+        fields = self.fields()
         return {
             "disc_id": self.disc_id,
             "is_player_disc": self.is_player_disc,
-            "ma": obj.ma,
-            "yc": self.yc,
+            "ma": fields[:FLOAT_FIELDS],
+            "yc": fields[FLOAT_FIELDS:],
         }
@@ -7,6 +7,8 @@ class KickRateLimit(Action):
     Kick rate limit
     xa(): int min, int rate, int sj (burst)
     """
+    __slots__ = ("min", "rate", "burst")
+
     def __init__(self):
         super().__init__()
         self.type = "KickRateLimit"
@@ -22,5 +24,9 @@ class KickRateLimit(Action):
         obj.burst = reader.read_int32()  # N() - int32
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(12)  # 3 x int32
+
     def get_data(self):
         return {"min": self.min, "rate": self.rate, "burst": self.burst}
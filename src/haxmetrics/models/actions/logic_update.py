@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class LogicUpdate(Action):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.frame = None
@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class MatchStart(Action):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -9,5 +11,9 @@ class MatchStart(Action):
     def parse(cls, reader):
         return cls()
 
+    @classmethod
+    def skip(cls, reader):
+        pass
+
     def get_data(self):
         return {}
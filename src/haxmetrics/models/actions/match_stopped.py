@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class MatchStopped(Action):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -9,5 +11,9 @@ class MatchStopped(Action):
     def parse(cls, reader):
         return cls()
 
+    @classmethod
+    def skip(cls, reader):
+        pass
+
     def get_data(self):
         return {}
@@ -7,6 +7,8 @@ class Message(Action):
     Message/notification with color and style
     xa(): string $c (max 1000), int color, byte style, byte Jn
     """
+    __slots__ = ("message", "color", "style", "flag")
+
     def __init__(self):
         super().__init__()
         self.type = "Message"
@@ -26,6 +28,11 @@ class Message(Action):
         obj.flag = reader.read_byte()  # F() - byte
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_string()
+        reader.skip_bytes(6)  # int32 color + 2 bytes
+
     def get_data(self):
         return {
             "message": self.message,
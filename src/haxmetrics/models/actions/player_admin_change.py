@@ -7,6 +7,8 @@ class PlayerAdminChange(Action):
     Admin change
     xa(): int Ud (player_id), bool jh (is_admin)
     """
+    __slots__ = ("player_id", "is_admin")
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerAdminChange"
@@ -20,5 +22,9 @@ class PlayerAdminChange(Action):
         obj.is_admin = reader.read_uint8()  # F() - byte
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(5)  # int32 + byte
+
     def get_data(self):
         return {"player_id": self.player_id, "is_admin": self.is_admin}
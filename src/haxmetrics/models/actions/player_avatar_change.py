@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class PlayerAvatarChange(Action):
+    __slots__ = ("player_id", "avatar")
+
     def __init__(self):
         super().__init__()
         self.player_id = None
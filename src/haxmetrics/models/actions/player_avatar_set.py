@@ -7,6 +7,8 @@ class PlayerAvatarSet(Action):
     Player avatar set
     xa(): nullable string ac (max 2 chars), int Ke (player_id)
     """
+    __slots__ = ("avatar", "player_id")
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerAvatarSet"
@@ -22,5 +24,10 @@ class PlayerAvatarSet(Action):
         obj.player_id = reader.read_int32()  # N() - int32
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_nullable_string()
+        reader.skip_bytes(4)
+
     def get_data(self):
         return {"avatar": self.avatar, "player_id": self.player_id}
@@ -2,6 +2,8 @@ from ..action import Action
 
 
 class PlayerHandicapChange(Action):
+    __slots__ = ("player_id", "handicap")
+
     def __init__(self):
         super().__init__()
         self.player_id = None
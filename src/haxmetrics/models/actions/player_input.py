@@ -7,6 +7,8 @@ class PlayerInput(Action):
     Player input (movement, kick)
     xa(): uint32 input
     """
+    __slots__ = ("input",)
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerInput"
@@ -18,5 +20,9 @@ class PlayerInput(Action):
         obj.input = reader.read_uint32()  # jb() - uint32
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(4)
+
     def get_data(self):
         return {"input": self.input}
@@ -7,6 +7,8 @@ class PlayerJoined(Action):
     Player joins room
     xa(): int Z (player_id), string name, string uj (country), string Zb (avatar)
     """
+    __slots__ = ("player_id", "name", "country", "avatar")
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerJoined"
@@ -24,6 +26,12 @@ class PlayerJoined(Action):
         obj.avatar = reader.read_nullable_string()  # Ab() - nullable string
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(4)
+        for _ in range(3):  # name, country, avatar
+            reader.skip_nullable_string()
+
     def get_data(self):
         return {
             "player_id": self.player_id,
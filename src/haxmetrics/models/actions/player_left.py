@@ -7,6 +7,8 @@ class PlayerLeft(Action):
     Player leaves/kicked
     xa(): int Z (player_id), string qd (reason), bool ah (kicked flag)
     """
+    __slots__ = ("player_id", "reason", "kicked")
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerLeft"
@@ -24,6 +26,12 @@ class PlayerLeft(Action):
         obj.kicked = reader.read_byte() != 0  # F() - byte as bool
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(4)
+        reader.skip_nullable_string()
+        reader.skip_bytes(1)
+
     def get_data(self):
         return {
             "player_id": self.player_id,
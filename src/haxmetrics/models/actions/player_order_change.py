@@ -7,6 +7,8 @@ class PlayerOrderChange(Action):
     Player order change - reorders player list
     xa(): bool An (append/prepend flag), byte count, then count player_ids
     """
+    __slots__ = ("append_mode", "player_ids")
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerOrderChange"
@@ -23,5 +25,10 @@ class PlayerOrderChange(Action):
             obj.player_ids.append(player_id)
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(1)
+        reader.skip_bytes(4 * reader.read_byte())
+
     def get_data(self):
         return {"append_mode": self.append_mode, "player_ids": self.player_ids}
@@ -7,6 +7,8 @@ class PlayerTeamChange(Action):
     Player team change
     xa(): int Ud (player_id), byte team (1=red, 2=blue, 0=spec)
     """
+    __slots__ = ("player_id", "team")
+
     def __init__(self):
         super().__init__()
         self.type = "PlayerTeamChange"
@@ -20,5 +22,9 @@ class PlayerTeamChange(Action):
         obj.team = reader.read_uint8()  # zf() or F() - byte
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(5)  # int32 + byte
+
     def get_data(self):
         return {"player_id": self.player_id, "team": self.team}
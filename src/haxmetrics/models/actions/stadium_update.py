@@ -1,5 +1,5 @@
 from ..action import Action
-import zlib
+from ..stadium.handle import StadiumHandle
 
 
 class StadiumUpdate(Action):
@@ -7,25 +7,38 @@ class StadiumUpdate(Action):
     Action index 11 (Ea in original JS)
     Stadium data update (compressed)
     xa(): compressed bytes (inflateRaw), then Stadium.parse()
+
+    The bytes are kept in a StadiumHandle and only inflated/decoded when
+    ``stadium_data`` or ``get_stadium()`` are used.
     """
+    __slots__ = ("handle",)
+
     def __init__(self):
         super().__init__()
         self.type = "StadiumUpdate"
-        self.stadium_data = None
+        self.handle = None
 
     @classmethod
     def parse(cls, reader):
         obj = cls()
         # Read length using varint, then read compressed bytes
         length = reader.read_varint()  # Bb()
-        compressed_data = reader.read_bytes(length)  # sb()
-        # Decompress using inflateRaw (same as zlib with negative wbits)
-        try:
-            obj.stadium_data = zlib.decompress(compressed_data, wbits=-15)
-        except Exception as e:
-            obj.stadium_data = compressed_data  # Store raw if decompression fails
+        obj.handle = StadiumHandle.read(reader, length)  # sb()
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        # Sin descomprimir
+        reader.skip_bytes(reader.read_varint())
+
+    @property
+    def stadium_data(self):
+        """Inflated stadium bytes (raw bytes if they do not inflate)."""
+        return self.handle.data if self.handle is not None else None
+
+    def get_stadium(self):
+        return self.handle.stadium if self.handle is not None else None
+
     def get_data(self):
         return {
             "stadium_data_size": len(self.stadium_data) if self.stadium_data else 0
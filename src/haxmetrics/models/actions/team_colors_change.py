@@ -3,6 +3,8 @@ from ..action import Action
 
 class TeamColorsChange(Action):
     """Action 19 (bb): Team colors change"""
+    __slots__ = ("team", "angle", "text_color", "colors")
+
     def __init__(self):
         super().__init__()
         self.team = None
@@ -29,6 +31,11 @@ class TeamColorsChange(Action):
         
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(9)  # team + angle + text color
+        reader.skip_bytes(4 * reader.read_uint8())
+
     def get_data(self):
         return {
             "team": self.team,
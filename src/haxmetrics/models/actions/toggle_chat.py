@@ -7,6 +7,8 @@ class ToggleChat(Action):
     Toggle chat indicator
     xa(): byte Hj
     """
+    __slots__ = ("flag",)
+
     def __init__(self):
         super().__init__()
         self.type = "ToggleChat"
@@ -18,5 +20,9 @@ class ToggleChat(Action):
         obj.flag = reader.read_byte()  # F() - byte
         return obj
 
+    @classmethod
+    def skip(cls, reader):
+        reader.skip_bytes(1)
+
     def get_data(self):
         return {"flag": self.flag}
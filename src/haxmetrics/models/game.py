@@ -4,6 +4,20 @@ from typing import List, Optional, Any, Dict
 class Game:
     """Represents the state of an active game in a HaxBall replay."""
 
+    __slots__ = (
+        "frame",
+        "score_red",
+        "score_blue",
+        "match_time",
+        "pause_timer",
+        "kick_off_team",
+        "kick_off_taken",
+        "rules_timer",
+        "ball_x",
+        "ball_y",
+        "discs",
+    )
+
     def __init__(self):
         self.frame: Optional[int] = None
         self.score_red: int = 0
@@ -54,20 +68,16 @@ class Game:
             game.rules_timer = reader.read_float64()
         
         # Parse ball position (2 float64s)
-        game.ball_x = reader.read_float64()
-        game.ball_y = reader.read_float64()
+        game.ball_x, game.ball_y = reader.read_position()
         
         # Parse disc count and states
         disc_count = reader.read_uint8()
         for _ in range(disc_count):
             # For each disc, parse its state
             # Position (x, y), velocity (vx, vy) - all float64
-            disc_state = {
-                'x': reader.read_float64(),
-                'y': reader.read_float64(),
-                'vx': reader.read_float64(),
-                'vy': reader.read_float64(),
-            }
+            x, y = reader.read_position()
+            vx, vy = reader.read_position()
+            disc_state = {'x': x, 'y': y, 'vx': vx, 'vy': vy}
             game.discs.append(disc_state)
         
         return game
@@ -2,6 +2,21 @@ from typing import Optional, Any, Dict
 
 
 class Player:
+    __slots__ = (
+        "id",
+        "name",
+        "admin",
+        "team",
+        "number",
+        "avatar",
+        "input",
+        "kicking",
+        "desynced",
+        "country",
+        "handicap",
+        "disc_id",
+    )
+
     def __init__(self):
         self.id: Optional[int] = None
         self.name: Optional[str] = None
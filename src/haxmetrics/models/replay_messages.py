@@ -1,11 +1,14 @@
 # haxmetrics/models/replay_messages.py
 
+import logging
 import struct
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class ReplayMessage:
     """Representa un mensaje dentro del replay de HaxBall"""
 
@@ -66,6 +69,8 @@ class ReplayMessages:
     después de la cabecera y la descompresión.
     """
 
+    __slots__ = ("count", "messages", "end_position")
+
     def __init__(self):
         self.count: int = 0
         self.messages: List[ReplayMessage] = []
@@ -119,11 +124,13 @@ class ReplayMessages:
         # Guardar la posición actual para saber dónde termina la sección de mensajes
         messages.end_position = data.position
 
-        print(f"Parsed {messages.count} messages")
-        print(f"End position after messages: {messages.end_position}")
-        print(f"Message details:")
-        for msg in messages.messages:
-            print(f" - Message {msg.index}: {MessageType.get_name(msg.type)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed %d messages, end position %d: %s",
+                messages.count,
+                messages.end_position,
+                ", ".join(MessageType.get_name(msg.type) for msg in messages.messages),
+            )
 
         return messages
 
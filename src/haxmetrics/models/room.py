@@ -1,9 +1,41 @@
+import logging
+from contextlib import nullcontext
 from typing import Any, Dict, Optional, List
 from haxmetrics.models.stadium.stadium import Stadium
 from haxmetrics.models.game import Game
 
+logger = logging.getLogger(__name__)
+
 
 class Room:
+    __slots__ = (
+        "version",
+        "kick_timeout",
+        "kick_rate_limit",
+        "kick_rate_limit_burst",
+        "score_limit",
+        "time_limit",
+        "teams_locked",
+        "team_colors",
+        "name",
+        "game",
+        "in_progress",
+        "players",
+        "stadium",
+        "locked",
+        # Set only through their setters
+        "frame",
+        "rules_timer",
+        "kick_off_taken",
+        "kick_off_team",
+        "ball_x",
+        "ball_y",
+        "score_red",
+        "score_blue",
+        "match_time",
+        "pause_timer",
+    )
+
     def __init__(self, version: int):
         self.version = version
 
@@ -15,22 +47,23 @@ class Room:
         self.time_limit = None
 
         self.teams_locked = None
-        self.team_colors = None
+        self.team_colors: Optional[Dict[str, Any]] = None
 
         self.name = None
 
-        self.game = None
+        self.game: Optional[Game] = None
         self.in_progress = False
 
-        self.players = None
-        self.stadium = None
+        self.players: Optional[List[Any]] = None
+        self.stadium: Optional[Stadium] = None
 
     @classmethod
-    def parse(cls, reader, version):
+    def parse(cls, reader, version, stats=None):
         """
         Parse room info from binary data according to HaxBall original scripts.
         The structure follows the ma(a) method from the original code.
         This includes players and team colors as they're part of the state.
+        ``stats`` (ParseStats, optional) gets the stadium phase.
         """
         room = cls(version)
 
@@ -56,7 +89,8 @@ class Room:
         room.kick_timeout = reader.read_byte()
         
         # 8. Stadium
-        room.set_stadium(Stadium.parse(reader))
+        with stats.phase("stadium", reader) if stats is not None else nullcontext():
+            room.set_stadium(Stadium.parse(reader))
         
         # 9. Game active flag (1 byte)
         game_active = reader.read_byte() != 0
@@ -65,7 +99,9 @@ class Room:
         if game_active:
             room.set_in_progress(True)
             room.game = Game.parse(reader, room)
-            print(f"Game is active - parsed game state at frame {room.game.frame}")
+            logger.debug(
+                "Game is active - parsed game state at frame %d", room.game.frame
+            )
         else:
             room.set_in_progress(False)
 
@@ -74,13 +110,14 @@ class Room:
         from haxmetrics.models.player import Player
         room.players = []
         player_count = reader.read_byte()
-        print(f"Player count: {player_count}")
         for i in range(player_count):
             try:
                 player = Player.parse(reader, version)
                 room.players.append(player)
             except Exception as e:
-                print(f"Warning: Failed to parse player {i+1}/{player_count}: {e}")
+                logger.warning(
+                    "Failed to parse player %d/%d: %s", i + 1, player_count, e
+                )
                 break
         
         # 12. Parse team colors (red and blue)
@@ -91,32 +128,38 @@ class Room:
             "blue": TeamColor.parse(reader)
         }
 
-        print(f"Parsed Room Name: {room.name}")
-        print(f"Is Locked: {room.locked}")
-        print(f"Score Limit: {room.score_limit}")
-        print(f"Time Limit: {room.time_limit}")
-        print(f"Game Active: {game_active}")
-        print(f"Players: {len(room.players)}")
-        print(f"Position after Room.parse: {reader.position}")
+        logger.debug(
+            "Parsed room %r (locked=%s, score limit=%d, time limit=%d, "
+            "game active=%s, players=%d), position after room: %d",
+            room.name,
+            room.locked,
+            room.score_limit,
+            room.time_limit,
+            game_active,
+            len(room.players),
+            reader.position,
+        )
 
         return room
 
     def json_serialize(self) -> Dict[str, Any]:
+        # El estado de la partida (frame, marcador, balón...) vive en game
         return {
-            "frame": self.frame,
+            "version": self.version,
             "name": self.name,
             "locked": bool(self.locked),
             "scoreLimit": self.score_limit,
             "timeLimit": self.time_limit,
-            "rulesTimer": self.rules_timer,
-            "kickOffTaken": bool(self.kick_off_taken),
-            "kickOffTeam": self.kick_off_team,
-            "ball": {"x": self.ball_x, "y": self.ball_y},
-            "score": {"red": self.score_red, "blue": self.score_blue},
-            "matchTime": self.match_time,
-            "pauseTimer": self.pause_timer,
-            "stadium": self.stadium,  # Should be serialized if implemented
+            "kickTimeout": self.kick_timeout,
+            "kickRateLimit": self.kick_rate_limit,
+            "kickRateLimitBurst": self.kick_rate_limit_burst,
+            "stadium": self.stadium.json_serialize() if self.stadium else None,
             "inProgress": bool(self.in_progress),
+            "game": self.game.json_serialize() if self.game else None,
+            "teamColors": {
+                team: color.json_serialize() if color else None
+                for team, color in (self.team_colors or {}).items()
+            },
         }
 
     # Setters and Getters
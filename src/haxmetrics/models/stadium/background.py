@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Background:
     type: str
     width: float
@@ -22,11 +22,13 @@ class Background:
             bg_type = "grass"
         else:
             bg_type = "none"
-        width = reader.read_double_be()
-        height = reader.read_double_be()
-        kick_off_radius = reader.read_double_be()
-        corner_radius = reader.read_double_be()
-        goal_line = reader.read_double_be()
+        (
+            width,
+            height,
+            kick_off_radius,
+            corner_radius,
+            goal_line,
+        ) = reader.read_doubles_be(5)
         if goal_line != goal_line:  # NaN check
             goal_line = 0.0
         color = format(reader.read_uint32_be(), "x")
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class BallPhysics:
     radius: float = 0.0
     b_coef: float = 0.0
@@ -14,10 +14,7 @@ class BallPhysics:
 
     @staticmethod
     def parse(reader, stadium_cls):
-        radius = reader.read_double_be()
-        b_coef = reader.read_double_be()
-        inv_mass = reader.read_double_be()
-        damping = reader.read_double_be()
+        radius, b_coef, inv_mass, damping = reader.read_doubles_be(4)
         color = format(reader.read_uint32(), "x")
         c_mask = stadium_cls.parse_mask(reader.read_uint32())
         c_group = stadium_cls.parse_mask(reader.read_uint32())
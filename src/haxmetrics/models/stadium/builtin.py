@@ -0,0 +1,255 @@
+"""
+Geometry of the built-in stadiums (q.Vh in game-min.js)
+
+Replays only store the index of a built-in stadium, so its elements are
+rebuilt here with the same recipes as the game: q.jd for the grass fields,
+q.jl for the hockey ones, and their goal (q.sg), kickoff (q.kl) and corner
+(q.il) pieces. Elements are appended in the game's order, which is the
+order the physics resolves contacts in.
+"""
+
+from .background import Background
+from .disc import Disc
+from .goal import Goal
+from .plane import Plane
+from .player_physics import PlayerPhysics
+from .segment import Segment
+from .vertex import Vertex
+
+# (receta, ancho, alto, ancho del fondo, alto del fondo, medio arco,
+#  y el radio de saque y la esquina, o la línea de gol y la esquina)
+RECIPES = [
+    ("field", 420, 200, 370, 170, 64, 75, 0),
+    ("field", 420, 200, 370, 170, 90, 75, 0),
+    ("field", 420, 200, 320, 130, 55, 70, 0),
+    ("field", 600, 270, 550, 240, 80, 80, 0),
+    ("field", 420, 200, 370, 170, 64, 75, 75),
+    ("hockey", 420, 204, 398, 182, 68, 120, 100),
+    ("hockey", 600, 270, 550, 240, 90, 160, 150),
+    ("field", 600, 270, 550, 240, 95, 80, 0),
+    ("field", 600, 270, 550, 240, 80, 75, 100),
+    ("field", 750, 350, 700, 320, 100, 80, 0),
+]
+
+GRASS_COLOR = "718c5a"  # 7441498
+RED_POST_COLOR = "ffcccc"  # 16764108
+BLUE_POST_COLOR = "ccccff"  # 13421823
+
+
+def build(stadium, index: int):
+    """Fill ``stadium`` (already named) with built-in stadium ``index``."""
+    recipe, width, height, bg_width, bg_height, goal, a, b = RECIPES[index]
+    stadium.set_width(width).set_height(height)
+    stadium.set_player_physics(PlayerPhysics())
+    stadium.set_vertexes([]).set_segments([]).set_planes([])
+    stadium.set_goals([]).set_discs([_ball(stadium)]).set_joints([])
+    if recipe == "field":
+        _field(stadium, width, height, bg_width, bg_height, goal, a, b)
+    else:
+        _hockey(stadium, width, height, bg_width, bg_height, goal, a, b)
+    return stadium
+
+
+def _ball(stadium) -> Disc:
+    # q.rg
+    return Disc(
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+        10.0,
+        0.5,
+        1.0,
+        0.99,
+        "ffffff",
+        stadium.parse_mask(63),
+        stadium.parse_mask(193),
+    )
+
+
+def _vertex(stadium, x, y, c_mask=63, c_group=32, b_coef=1.0) -> int:
+    stadium.vertexes.append(
+        Vertex(
+            float(x),
+            float(y),
+            b_coef,
+            stadium.parse_mask(c_mask),
+            stadium.parse_mask(c_group),
+        )
+    )
+    return len(stadium.vertexes) - 1
+
+
+def _segment(
+    stadium, v0, v1, c_mask=63, c_group=32, b_coef=1.0, curve=0.0, vis=True
+) -> None:
+    stadium.segments.append(
+        Segment(
+            float(v0),
+            float(v1),
+            b_coef,
+            stadium.parse_mask(c_mask),
+            stadium.parse_mask(c_group),
+            curve=float(curve),
+            vis=vis,
+        )
+    )
+
+
+def _plane(stadium, normal_x, normal_y, dist, c_mask=63, b_coef=1.0) -> None:
+    stadium.planes.append(
+        Plane(
+            float(normal_x),
+            float(normal_y),
+            float(dist),
+            b_coef,
+            stadium.parse_mask(c_mask),
+            stadium.parse_mask(32),
+        )
+    )
+
+
+def _outer_planes(stadium, width, height) -> None:
+    # Límites del campo, sin rebote
+    for normal_x, normal_y, dist in (
+        (0, 1, -height),
+        (0, -1, -height),
+        (1, 0, -width),
+        (-1, 0, -width),
+    ):
+        _plane(stadium, normal_x, normal_y, dist, b_coef=0.0)
+
+
+def _spawn_distance(stadium, distance) -> None:
+    stadium.set_spawn_distance(min(0.75 * distance, 400.0))
+
+
+def _field(stadium, width, height, bg_width, bg_height, goal, kickoff, corner) -> None:
+    """Grass field (q.jd)."""
+    stadium.set_background(
+        Background("grass", bg_width, bg_height, kickoff, corner, 0.0, GRASS_COLOR)
+    )
+    _spawn_distance(stadium, bg_width)
+    _outer_planes(stadium, width, height)
+    _goal_net(stadium, bg_width, 1, goal, BLUE_POST_COLOR, "Blue")
+    _goal_net(stadium, -bg_width, -1, goal, RED_POST_COLOR, "Red")
+    _kickoff_line(stadium, kickoff, height)
+    # Bandas superior e inferior y líneas de fondo fuera de las porterías
+    _plane(stadium, 0, 1, -bg_height, c_mask=1)
+    _plane(stadium, 0, -1, -bg_height, c_mask=1)
+    x, y = bg_width, bg_height
+    first = len(stadium.vertexes)
+    for vx, vy in (
+        (-x, -y),
+        (x, -y),
+        (x, -goal),
+        (x, goal),
+        (x, y),
+        (-x, y),
+        (-x, goal),
+        (-x, -goal),
+    ):
+        _vertex(stadium, vx, vy, c_mask=0)
+    for v0, v1 in ((1, 2), (3, 4), (5, 6), (7, 0)):
+        _segment(stadium, first + v0, first + v1, c_mask=1, vis=False)
+    _corners(stadium, bg_width, bg_height, corner)
+
+
+def _hockey(
+    stadium, width, height, bg_width, bg_height, goal, goal_line, corner
+) -> None:
+    """Hockey field (q.jl): goals inside the background, behind a goal line."""
+    stadium.set_background(
+        Background("hockey", bg_width, bg_height, 75.0, corner, goal_line, "0")
+    )
+    _spawn_distance(stadium, bg_width - goal_line)
+    _outer_planes(stadium, width, height)
+    _goal_net(
+        stadium, bg_width - goal_line, 1, goal, BLUE_POST_COLOR, "Blue", c_mask=63
+    )
+    _goal_net(
+        stadium, -bg_width + goal_line, -1, goal, RED_POST_COLOR, "Red", c_mask=63
+    )
+    _kickoff_line(stadium, 75, height)
+    for normal_x, normal_y, dist in (
+        (0, 1, -bg_height),
+        (0, -1, -bg_height),
+        (1, 0, -bg_width),
+        (-1, 0, -bg_width),
+    ):
+        _plane(stadium, normal_x, normal_y, dist, c_mask=1)
+    _corners(stadium, bg_width, bg_height, corner)
+
+
+def _goal_net(stadium, x, side, half, color, team, c_mask=1) -> None:
+    """Goal line, its two posts and the net behind it (q.sg)."""
+    top = _vertex(stadium, x + 8 * side, -half, c_mask, b_coef=0.1)
+    bottom = _vertex(stadium, x + 8 * side, half, c_mask, b_coef=0.1)
+    back_top = _vertex(stadium, x + 30 * side, -half + 22, c_mask, b_coef=0.1)
+    back_bottom = _vertex(stadium, x + 30 * side, half - 22, c_mask, b_coef=0.1)
+    _segment(stadium, top, back_top, c_mask, b_coef=0.1, curve=90 * side)
+    _segment(stadium, back_bottom, back_top, c_mask, b_coef=0.1)
+    _segment(stadium, back_bottom, bottom, c_mask, b_coef=0.1, curve=90 * side)
+    for y in (-half, half):
+        stadium.discs.append(
+            Disc(
+                float(x),
+                float(y),
+                0.0,
+                0.0,
+                8.0,
+                0.5,
+                0.0,
+                0.99,
+                color,
+                stadium.parse_mask(63),
+                stadium.parse_mask(63),
+            )
+        )
+    stadium.goals.append(Goal([float(x), float(-half)], [float(x), float(half)], team))
+
+
+def _kickoff_line(stadium, radius, height) -> None:
+    """
+    Midfield barrier of the kickoff (q.kl): straight for both kickoff
+    groups, plus a half circle around the centre for each side.
+    """
+    top = _vertex(stadium, 0, -height, c_mask=6, c_group=24, b_coef=0.1)
+    upper = _vertex(stadium, 0, -radius, c_mask=6, c_group=24, b_coef=0.1)
+    lower = _vertex(stadium, 0, radius, c_mask=6, c_group=24, b_coef=0.1)
+    bottom = _vertex(stadium, 0, height, c_mask=6, c_group=24, b_coef=0.1)
+    _segment(stadium, top, upper, c_mask=6, c_group=24, b_coef=0.1, vis=False)
+    _segment(stadium, lower, bottom, c_mask=6, c_group=24, b_coef=0.1, vis=False)
+    _segment(
+        stadium, upper, lower, c_mask=6, c_group=8, b_coef=0.1, curve=180, vis=False
+    )
+    _segment(
+        stadium, lower, upper, c_mask=6, c_group=16, b_coef=0.1, curve=180, vis=False
+    )
+
+
+def _corners(stadium, width, height, corner) -> None:
+    """Rounded corners for the ball (q.il), only when ``corner`` > 0."""
+    if corner <= 0:
+        return
+    first = len(stadium.vertexes)
+    for x, y in (
+        (-width + corner, -height),
+        (-width, -height + corner),
+        (-width + corner, height),
+        (-width, height - corner),
+        (width - corner, height),
+        (width, height - corner),
+        (width - corner, -height),
+        (width, -height + corner),
+    ):
+        _vertex(stadium, x, y, c_mask=0)
+    for pair, curve in zip(range(4), (-90, 90, -90, 90)):
+        _segment(
+            stadium,
+            first + 2 * pair,
+            first + 2 * pair + 1,
+            c_mask=1,
+            curve=curve,
+            vis=False,
+        )
@@ -0,0 +1,354 @@
+"""Stadium geometry precomputed as NumPy arrays (see Stadium.compile)"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("Stadium.compile requires numpy") from e
+
+# Curvas fuera de este rango (en radianes) se tratan como rectas (I.On / I.Nn)
+MIN_CURVE = 0.17435839227423353
+MAX_CURVE = 5.934119456780721
+
+# Extremos de una circunferencia en cada eje, para acotar los arcos
+_AXES = np.array([(1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0)])
+
+
+class CompiledStadium:
+    """
+    Stadium elements as contiguous arrays, one row per element in stadium
+    order. Masks are integer bitmasks (int64), points are (n, 2) float64.
+
+    - vertexes: ``vertex_pos``, ``vertex_b_coef``, ``vertex_c_mask``,
+      ``vertex_c_group``
+    - segments (I.Vc / I.qe in game-min.js): vertex indexes
+      ``segment_v0``/``segment_v1``, endpoints ``segment_a``/``segment_b``
+      (swapped for negative curves), ``segment_normal`` for straight ones;
+      ``segment_center``, ``segment_radius`` and the arc tangents
+      ``segment_t0``/``segment_t1`` for curved ones (``segment_curved``),
+      ``segment_cot`` (vb, 1/tan of half the arc angle), ``segment_bias``,
+      and the bounds: ``segment_min``/``segment_max`` (tight box around the
+      segment or arc) and ``segment_bound_center``/``segment_bound_radius``
+      (a circle around it). Plus ``segment_b_coef`` and masks.
+    - planes: ``plane_normal``, ``plane_dist``, ``plane_b_coef`` and masks
+    - discs: ``disc_pos``, ``disc_velocity``, ``disc_gravity``,
+      ``disc_radius``, ``disc_b_coef``, ``disc_inv_mass``, ``disc_damping``
+      and masks; the ball is disc 0
+    - joints: ``joint_a``/``joint_b`` (disc indexes), ``joint_min``,
+      ``joint_max``, ``joint_stiffness``
+    - goals: ``goal_start``, ``goal_end``, ``goal_team`` (1 red, 2 blue)
+    """
+
+    __slots__ = (
+        "vertex_pos",
+        "vertex_b_coef",
+        "vertex_c_mask",
+        "vertex_c_group",
+        "segment_v0",
+        "segment_v1",
+        "segment_a",
+        "segment_b",
+        "segment_normal",
+        "segment_curved",
+        "segment_center",
+        "segment_radius",
+        "segment_t0",
+        "segment_t1",
+        "segment_cot",
+        "segment_bias",
+        "segment_min",
+        "segment_max",
+        "segment_bound_center",
+        "segment_bound_radius",
+        "segment_b_coef",
+        "segment_c_mask",
+        "segment_c_group",
+        "plane_normal",
+        "plane_dist",
+        "plane_b_coef",
+        "plane_c_mask",
+        "plane_c_group",
+        "disc_pos",
+        "disc_velocity",
+        "disc_gravity",
+        "disc_radius",
+        "disc_b_coef",
+        "disc_inv_mass",
+        "disc_damping",
+        "disc_c_mask",
+        "disc_c_group",
+        "joint_a",
+        "joint_b",
+        "joint_min",
+        "joint_max",
+        "joint_stiffness",
+        "goal_start",
+        "goal_end",
+        "goal_team",
+    )
+
+    def __init__(self):
+        points, floats = np.zeros((0, 2)), np.zeros(0)
+        masks, indexes = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.intp)
+
+        self.vertex_pos = points
+        self.vertex_b_coef = floats
+        self.vertex_c_mask = masks
+        self.vertex_c_group = masks
+
+        self.segment_v0 = indexes
+        self.segment_v1 = indexes
+        self.segment_a = points
+        self.segment_b = points
+        self.segment_normal = points
+        self.segment_curved = np.zeros(0, dtype=bool)
+        self.segment_center = points
+        self.segment_radius = floats
+        self.segment_t0 = points
+        self.segment_t1 = points
+        self.segment_cot = floats
+        self.segment_bias = floats
+        self.segment_min = points
+        self.segment_max = points
+        self.segment_bound_center = points
+        self.segment_bound_radius = floats
+        self.segment_b_coef = floats
+        self.segment_c_mask = masks
+        self.segment_c_group = masks
+
+        self.plane_normal = points
+        self.plane_dist = floats
+        self.plane_b_coef = floats
+        self.plane_c_mask = masks
+        self.plane_c_group = masks
+
+        self.disc_pos = points
+        self.disc_velocity = points
+        self.disc_gravity = points
+        self.disc_radius = floats
+        self.disc_b_coef = floats
+        self.disc_inv_mass = floats
+        self.disc_damping = floats
+        self.disc_c_mask = masks
+        self.disc_c_group = masks
+
+        self.joint_a = indexes
+        self.joint_b = indexes
+        self.joint_min = floats
+        self.joint_max = floats
+        self.joint_stiffness = floats
+
+        self.goal_start = points
+        self.goal_end = points
+        self.goal_team = np.zeros(0, dtype=np.int8)
+
+    @classmethod
+    def from_stadium(cls, stadium) -> "CompiledStadium":
+        compiled = cls()
+        if stadium is None:
+            return compiled
+        mask = stadium.mask_value
+
+        compiled._fill(
+            "vertex",
+            [
+                ((v.x, v.y), v.b_coef, mask(v.c_mask), mask(v.c_group))
+                for v in stadium.vertexes
+            ],
+            ("pos", "b_coef", "c_mask", "c_group"),
+        )
+
+        compiled._fill(
+            "plane",
+            [
+                (
+                    (p.normal_x, p.normal_y),
+                    p.dist,
+                    p.b_coef,
+                    mask(p.c_mask),
+                    mask(p.c_group),
+                )
+                for p in stadium.planes
+            ],
+            ("normal", "dist", "b_coef", "c_mask", "c_group"),
+        )
+
+        vertexes = len(stadium.vertexes)
+        compiled._fill(
+            "segment",
+            [
+                cls._segment(stadium, segment)
+                for segment in stadium.segments
+                if max(int(segment.v0), int(segment.v1)) < vertexes
+            ],
+            (
+                "v0",
+                "v1",
+                "a",
+                "b",
+                "normal",
+                "curved",
+                "center",
+                "radius",
+                "t0",
+                "t1",
+                "cot",
+                "bias",
+                "bound_center",
+                "bound_radius",
+                "b_coef",
+                "c_mask",
+                "c_group",
+            ),
+        )
+        compiled._arc_bounds()
+
+        compiled._fill(
+            "disc",
+            [
+                (
+                    (d.pos_x, d.pos_y),
+                    (d.velocity_x, d.velocity_y),
+                    (d.gravity_x, d.gravity_y),
+                    d.radius,
+                    d.b_coef,
+                    d.inv_mass,
+                    d.damping,
+                    mask(d.c_mask),
+                    mask(d.c_group),
+                )
+                for d in stadium.discs
+            ],
+            (
+                "pos",
+                "velocity",
+                "gravity",
+                "radius",
+                "b_coef",
+                "inv_mass",
+                "damping",
+                "c_mask",
+                "c_group",
+            ),
+        )
+
+        discs = len(stadium.discs)
+        compiled._fill(
+            "joint",
+            [
+                (
+                    j.disc1_index,
+                    j.disc2_index,
+                    j.min_distance,
+                    j.max_distance,
+                    j.stiffness,
+                )
+                for j in stadium.joints
+                if max(j.disc1_index, j.disc2_index) < discs
+            ],
+            ("a", "b", "min", "max", "stiffness"),
+        )
+
+        teams = stadium.TEAMS
+        compiled._fill(
+            "goal",
+            [
+                (
+                    tuple(g.pos_start),
+                    tuple(g.pos_end),
+                    teams.index(g.team) if g.team in teams else 0,
+                )
+                for g in stadium.goals
+            ],
+            ("start", "end", "team"),
+        )
+        return compiled
+
+    def _fill(self, kind: str, rows, columns) -> None:
+        """Set the ``kind_column`` arrays from row tuples, keeping their dtypes."""
+        if not rows:
+            return
+        for column, values in zip(columns, zip(*rows)):
+            name = f"{kind}_{column}"
+            setattr(self, name, np.array(values, dtype=getattr(self, name).dtype))
+
+    @staticmethod
+    def _segment(stadium, segment) -> tuple:
+        """One row of the segment arrays (I.Vc and I.qe in game-min.js)."""
+        v0, v1 = int(segment.v0), int(segment.v1)
+        bias = segment.bias or 0.0
+        cot = math.inf
+        if segment.curve_f is not None:
+            # curveF (vb tal cual, como lo guarda el formato binario)
+            if math.isfinite(segment.curve_f):
+                cot = segment.curve_f
+        else:
+            angle = math.radians(segment.curve or 0.0)
+            if angle < 0:
+                angle = -angle
+                v0, v1 = v1, v0
+                bias = -bias
+            if MIN_CURVE < angle < MAX_CURVE:
+                cot = 1 / math.tan(angle / 2)
+
+        a = (stadium.vertexes[v0].x, stadium.vertexes[v0].y)
+        b = (stadium.vertexes[v1].x, stadium.vertexes[v1].y)
+        normal = center = t0 = t1 = (0.0, 0.0)
+        radius = 0.0
+        if math.isfinite(cot):
+            half_x, half_y = 0.5 * (b[0] - a[0]), 0.5 * (b[1] - a[1])
+            center = (a[0] + half_x - half_y * cot, a[1] + half_y + half_x * cot)
+            radius = math.hypot(a[0] - center[0], a[1] - center[1])
+            t0 = (-(a[1] - center[1]), a[0] - center[0])
+            t1 = (-(center[1] - b[1]), center[0] - b[0])
+            if cot <= 0:
+                t0 = (-t0[0], -t0[1])
+                t1 = (-t1[0], -t1[1])
+            bound_center, bound_radius = center, radius
+        else:
+            length = math.hypot(a[0] - b[0], a[1] - b[1]) or 1.0
+            normal = ((b[1] - a[1]) / length, (a[0] - b[0]) / length)
+            bound_center = (0.5 * (a[0] + b[0]), 0.5 * (a[1] + b[1]))
+            bound_radius = 0.5 * length
+
+        return (
+            v0,
+            v1,
+            a,
+            b,
+            normal,
+            math.isfinite(cot),
+            center,
+            radius,
+            t0,
+            t1,
+            cot,
+            bias,
+            bound_center,
+            bound_radius,
+            segment.b_coef,
+            stadium.mask_value(segment.c_mask),
+            stadium.mask_value(segment.c_group),
+        )
+
+    def _arc_bounds(self) -> None:
+        """Boxes around segments: endpoints, plus the circle extremes in each arc."""
+        low = np.minimum(self.segment_a, self.segment_b)
+        high = np.maximum(self.segment_a, self.segment_b)
+        curved = np.flatnonzero(self.segment_curved)
+        if len(curved):
+            # (arcos, 4 extremos, 2)
+            w = self.segment_radius[curved, None, None] * _AXES[None, :, :]
+            extremes = self.segment_center[curved, None, :] + w
+            inside = (np.einsum("ik,ijk->ij", self.segment_t0[curved], w) > 0) & (
+                np.einsum("ik,ijk->ij", self.segment_t1[curved], w) > 0
+            )
+            on_arc = inside != (self.segment_cot[curved] <= 0)[:, None]
+            low[curved] = np.minimum(
+                low[curved], np.where(on_arc[..., None], extremes, np.inf).min(axis=1)
+            )
+            high[curved] = np.maximum(
+                high[curved], np.where(on_arc[..., None], extremes, -np.inf).max(axis=1)
+            )
+        self.segment_min, self.segment_max = low, high
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Disc:
     pos_x: float
     pos_y: float
@@ -15,20 +15,26 @@ class Disc:
     color: str
     c_mask: Any = field(default=None)
     c_group: Any = field(default=None)
+    gravity_x: float = 0.0
+    gravity_y: float = 0.0
 
     @staticmethod
     def parse(reader, stadium_cls):
-        pos_x = float(reader.read_double_be())
-        pos_y = float(reader.read_double_be())
-        velocity_x = float(reader.read_double_be())
-        velocity_y = float(reader.read_double_be())
-        radius = float(reader.read_double_be())
-        b_coef = float(reader.read_double_be())
-        inv_mass = float(reader.read_double_be())
-        damping = float(reader.read_double_be())
-        color = format(reader.read_uint32(), "x")
-        c_mask = stadium_cls.parse_mask(reader.read_uint32())
-        c_group = stadium_cls.parse_mask(reader.read_uint32())
+        (
+            pos_x,
+            pos_y,
+            velocity_x,
+            velocity_y,
+            gravity_x,
+            gravity_y,
+            radius,
+            b_coef,
+            inv_mass,
+            damping,
+        ) = reader.read_doubles_be(10)
+        color = format(reader.read_uint32_be(), "x")
+        c_mask = stadium_cls.parse_mask(reader.read_int32_be())
+        c_group = stadium_cls.parse_mask(reader.read_int32_be())
         return Disc(
             pos_x=pos_x,
             pos_y=pos_y,
@@ -41,12 +47,15 @@ class Disc:
             color=color,
             c_mask=c_mask,
             c_group=c_group,
+            gravity_x=gravity_x,
+            gravity_y=gravity_y,
         )
 
     def to_json(self):
         return {
             "pos": {"x": self.pos_x, "y": self.pos_y},
             "velocity": {"x": self.velocity_x, "y": self.velocity_y},
+            "gravity": {"x": self.gravity_x, "y": self.gravity_y},
             "radius": self.radius,
             "bCeof": self.b_coef,
             "invMass": self.inv_mass,
@@ -2,7 +2,7 @@ from dataclasses import dataclass, asdict
 from typing import List, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     pos_start: List[float]
     pos_end: List[float]
@@ -10,12 +10,14 @@ class Goal:
 
     @staticmethod
     def parse(reader, stadium_cls):
-        # reader: debe tener métodos read_double_be() y read_uint8()
+        # reader: debe tener métodos read_double_be() y read_byte()
         # stadium_cls: clase Stadium con método parse_team
-        pos_start = [reader.read_double_be(), reader.read_double_be()]
-        pos_end = [reader.read_double_be(), reader.read_double_be()]
-        team_val = reader.read_uint8()
-        team = stadium_cls.parse_team(1 if team_val else 2)
+        x0, y0, x1, y1 = reader.read_doubles_be(4)
+        pos_start = [x0, y0]
+        pos_end = [x1, y1]
+        # Kb.ma: int8, 1 rojo, 2 azul y cualquier otro valor espectadores
+        team_val = reader.read_byte()
+        team = stadium_cls.parse_team(team_val if team_val in (1, 2) else 0)
         return Goal(pos_start=pos_start, pos_end=pos_end, team=team)
 
     def to_json(self):
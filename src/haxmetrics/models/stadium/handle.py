@@ -0,0 +1,112 @@
+"""Lazy, process-wide deduplicated handle to a compressed stadium"""
+
+import hashlib
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from haxmetrics.binary_reader import BinaryReader
+
+from .stadium import Stadium
+
+# Estadios distintos que se recuerdan por proceso (las ligas usan pocos)
+CACHE_SIZE = 64
+
+
+class _Entry:
+    __slots__ = ("raw", "data", "stadium")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self.data: Optional[bytes] = None
+        self.stadium: Optional[Stadium] = None
+
+
+_entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+_counters = {"hits": 0, "misses": 0, "inflated": 0, "decoded": 0}
+
+
+def _entry(digest: bytes, raw: bytes) -> _Entry:
+    entry = _entries.get(digest)
+    if entry is None:
+        _counters["misses"] += 1
+        entry = _entries[digest] = _Entry(raw)
+        if len(_entries) > CACHE_SIZE:
+            _entries.popitem(last=False)
+    else:
+        _counters["hits"] += 1
+        _entries.move_to_end(digest)
+    return entry
+
+
+def stadium_cache_info() -> Dict[str, Any]:
+    return {"entries": len(_entries), **_counters}
+
+
+def clear_stadium_cache() -> None:
+    _entries.clear()
+    for name in _counters:
+        _counters[name] = 0
+
+
+class StadiumHandle:
+    """
+    Compressed stadium bytes (inflateRaw + Stadium.parse, as in Ea.xa()) that
+    are only inflated and decoded when ``data`` / ``stadium`` are accessed.
+
+    Results are memoized per process, keyed by a hash of the compressed
+    bytes: a map that shows up many times in a replay (or across the replays
+    parsed by a worker) is decoded once, and every handle to it shares the
+    same raw bytes and the same Stadium object, which must not be mutated.
+    Creating a handle neither hashes nor touches the memo: both happen on
+    the first access.
+    """
+
+    __slots__ = ("raw", "_digest")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._digest: Optional[bytes] = None
+
+    @property
+    def digest(self) -> bytes:
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self.raw, digest_size=16).digest()
+        return self._digest
+
+    def _resolve(self) -> _Entry:
+        entry = _entry(self.digest, self.raw)
+        # Reutiliza los bytes de una aparición anterior del mismo mapa
+        self.raw = entry.raw
+        return entry
+
+    @classmethod
+    def read(cls, reader, length: int) -> "StadiumHandle":
+        return cls(reader.read_bytes(length))
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @property
+    def data(self) -> bytes:
+        """Inflated bytes (the raw bytes when they are not raw deflate)."""
+        entry = self._resolve()
+        if entry.data is None:
+            _counters["inflated"] += 1
+            try:
+                entry.data = zlib.decompress(self.raw, wbits=-15)
+            except zlib.error:
+                entry.data = self.raw  # Store raw if decompression fails
+        return entry.data
+
+    @property
+    def stadium(self) -> Stadium:
+        """Decoded Stadium (shared by every handle to the same bytes)."""
+        entry = self._resolve()
+        if entry.stadium is None:
+            _counters["decoded"] += 1
+            entry.stadium = Stadium.parse(BinaryReader(self.data))
+        return entry.stadium
+
+    def json_serialize(self) -> Dict[str, Any]:
+        return {"digest": self.digest.hex(), "size": len(self.raw)}
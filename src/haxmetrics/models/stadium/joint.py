@@ -6,6 +6,15 @@ class Joint:
     Joint (ob class in original JS)
     Connects two discs with distance constraints
     """
+    __slots__ = (
+        "disc1_index",
+        "disc2_index",
+        "min_distance",
+        "max_distance",
+        "stiffness",
+        "color",
+    )
+
     def __init__(self):
         self.disc1_index = 0
         self.disc2_index = 0
@@ -19,10 +28,13 @@ class Joint:
         joint = cls()
         joint.disc1_index = reader.read_uint8()  # F() - byte
         joint.disc2_index = reader.read_uint8()  # F() - byte
-        joint.min_distance = reader.read_double_be()  # w() - double
-        joint.max_distance = reader.read_double_be()  # w() - double
-        joint.stiffness = reader.read_double_be()  # w() - double
-        joint.color = reader.read_int32()  # N() - int32
+        # w() x3 - min_distance, max_distance, stiffness (doubles)
+        (
+            joint.min_distance,
+            joint.max_distance,
+            joint.stiffness,
+        ) = reader.read_doubles_be(3)
+        joint.color = reader.read_int32_be()  # N() - int32
         return joint
 
     def json_serialize(self):
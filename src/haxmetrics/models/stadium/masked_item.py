@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, List
 
 
-@dataclass
+@dataclass(slots=True)
 class MaskedItem:
     c_mask: Any = field(default=None)
     c_group: Any = field(default=None)
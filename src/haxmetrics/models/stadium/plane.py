@@ -2,7 +2,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Plane:
     normal_x: float
     normal_y: float
@@ -13,12 +13,9 @@ class Plane:
 
     @staticmethod
     def parse(reader, stadium_cls):
-        normal_x = float(reader.read_double_be())
-        normal_y = float(reader.read_double_be())
-        dist = float(reader.read_double_be())
-        b_coef = float(reader.read_double_be())
-        c_mask = stadium_cls.parse_mask(reader.read_uint32())
-        c_group = stadium_cls.parse_mask(reader.read_uint32())
+        normal_x, normal_y, dist, b_coef = reader.read_doubles_be(4)
+        c_mask = stadium_cls.parse_mask(reader.read_int32_be())
+        c_group = stadium_cls.parse_mask(reader.read_int32_be())
         return Plane(
             normal_x=normal_x,
             normal_y=normal_y,
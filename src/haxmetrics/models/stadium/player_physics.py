@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field, asdict
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerPhysics:
     b_coef: float = 0.5
     inv_mass: float = 0.5
@@ -10,6 +11,11 @@ class PlayerPhysics:
     kicking_acceleration: float = 0.07
     kicking_damping: float = 0.96
     kick_strength: float = 5
+    gravity_x: float = 0.0
+    gravity_y: float = 0.0
+    c_group: Any = field(default_factory=list)
+    radius: float = 15
+    kickback: float = 0
 
     defaults = {
         "b_coef": 0.5,
@@ -19,19 +25,21 @@ class PlayerPhysics:
         "kicking_acceleration": 0.07,
         "kicking_damping": 0.96,
         "kick_strength": 5,
+        "gravity_x": 0.0,
+        "gravity_y": 0.0,
+        "c_group": [],
+        "radius": 15,
+        "kickback": 0,
     }
 
     @staticmethod
-    def parse(reader):
-        return PlayerPhysics(
-            b_coef=reader.read_double_be(),
-            inv_mass=reader.read_double_be(),
-            damping=reader.read_double_be(),
-            acceleration=reader.read_double_be(),
-            kicking_acceleration=reader.read_double_be(),
-            kicking_damping=reader.read_double_be(),
-            kick_strength=reader.read_double_be(),
-        )
+    def parse(reader, stadium_cls):
+        # cc.ma: 7 doubles, gravedad (x, y), cGroup int32, radio y kickback
+        physics = PlayerPhysics(*reader.read_doubles_be(7))
+        physics.gravity_x, physics.gravity_y = reader.read_doubles_be(2)
+        physics.c_group = stadium_cls.parse_mask(reader.read_int32_be())
+        physics.radius, physics.kickback = reader.read_doubles_be(2)
+        return physics
 
     def to_json(self):
         # Solo incluye los campos que son diferentes del default
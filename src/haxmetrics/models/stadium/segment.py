@@ -1,8 +1,9 @@
+import math
 from dataclasses import dataclass, field, asdict
-from typing import Any
+from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     v0: float
     v1: float
@@ -12,20 +13,29 @@ class Segment:
     curve: float = 0.0
     vis: bool = False
     color: str = ""
+    # "bias" y "curveF" de los .hbs (I.Hc e I.vb): curve_f es la cotangente
+    # de medio arco y, si está, manda sobre curve (q.Up)
+    bias: float = 0.0
+    curve_f: Optional[float] = None
 
     @staticmethod
     def parse(reader, stadium_cls):
-        # reader: debe tener métodos read_uint8(), read_double_be(), read_uint32()
+        # I.ma: byte de flags (1 bias, 2 curva, 4 color, 8 visible) y después
+        # los índices de los vértices y los campos marcados
+        flags = reader.read_uint8()
         v0 = float(reader.read_uint8())
         v1 = float(reader.read_uint8())
-        b_coef = float(reader.read_double_be())
-        c_mask = stadium_cls.parse_mask(reader.read_uint32())
-        c_group = stadium_cls.parse_mask(reader.read_uint32())
-        curve = reader.read_double_be()
-        if curve != curve:  # NaN check
-            curve = 0.0
-        vis = bool(reader.read_uint8())
-        color = format(reader.read_uint32(), "x")  # hexadecimal string
+        bias = reader.read_double_be() if flags & 1 else 0.0
+        curve_f = reader.read_double_be() if flags & 2 else None
+        color = format(reader.read_uint32_be(), "x") if flags & 4 else ""
+        vis = bool(flags & 8)
+        b_coef = reader.read_double_be()
+        c_mask = stadium_cls.parse_mask(reader.read_int32_be())
+        c_group = stadium_cls.parse_mask(reader.read_int32_be())
+        # Ángulo en grados (I.ip), solo informativo: la forma la da curve_f
+        curve = 0.0
+        if curve_f is not None and math.isfinite(curve_f):
+            curve = 114.59155902616465 * math.atan(1 / curve_f)
         return Segment(
             v0=v0,
             v1=v1,
@@ -35,6 +45,8 @@ class Segment:
             curve=curve,
             vis=vis,
             color=color,
+            bias=bias,
+            curve_f=curve_f,
         )
 
     def to_json(self):
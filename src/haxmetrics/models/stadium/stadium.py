@@ -9,6 +9,7 @@ from .player_physics import PlayerPhysics
 from .ball_physics import BallPhysics
 from .background import Background
 from .masked_item import MaskedItem
+from . import builtin
 
 
 class Stadium:
@@ -25,9 +26,41 @@ class Stadium:
         "Big Rounded",
         "Huge",
     ]
-    MASKS = {1: "ball", 2: "red", 4: "blue", 8: "redKO", 16: "blueKO", 32: "wall"}
+    MASKS = {
+        1: "ball",
+        2: "red",
+        4: "blue",
+        8: "redKO",
+        16: "blueKO",
+        32: "wall",
+        64: "kick",
+        128: "score",
+        1 << 28: "c0",
+        1 << 29: "c1",
+        1 << 30: "c2",
+        1 << 31: "c3",
+    }
+    ALL_MASK = 63  # "all" en los .hbs (q.Kc)
     TEAMS = ["Spectators", "Red", "Blue"]
 
+    __slots__ = (
+        "type",
+        "name",
+        "custom",
+        "width",
+        "height",
+        "spawn_distance",
+        "background",
+        "player_physics",
+        "ball_physics",
+        "vertexes",
+        "segments",
+        "planes",
+        "goals",
+        "discs",
+        "joints",
+    )
+
     def __init__(self):
         self.type: Optional[int] = None
         self.name: Optional[str] = None
@@ -49,18 +82,19 @@ class Stadium:
     def parse(cls, reader):
         """
         Parse stadium from binary data according to HaxBall original scripts.
-        If type < 255, it's a predefined stadium. If type == 255, it's custom.
+        If type < 255, it's a predefined stadium, rebuilt from its recipe (see
+        builtin.py). If type == 255, it's custom.
         """
         stadium = cls()
 
         # Read stadium type (1 byte)
         stadium.type = reader.read_byte()
 
-        # If it's a predefined stadium (< 255), just set the name and return
+        # If it's a predefined stadium (< 255), the replay only has its index
         if stadium.type < len(cls.STADIUMS):
             stadium.set_name(cls.STADIUMS[stadium.type])
             stadium.set_custom(False)
-            return stadium
+            return builtin.build(stadium, stadium.type)
 
         # Custom stadium (type == 255)
         stadium.set_custom(True)
@@ -69,19 +103,20 @@ class Stadium:
         # Parse custom stadium properties
         stadium.set_background(Background.parse(reader))
         
-        # Max view width and height (not the same as background width/height)
-        max_view_width = reader.read_double_be()
-        max_view_height = reader.read_double_be()
+        # Width and height (bc/sc: camera bounds and kickoff reset area)
+        width, height = reader.read_doubles_be(2)
+        stadium.set_width(width)
+        stadium.set_height(height)
         
         # Spawn distance
         stadium.set_spawn_distance(reader.read_double_be())
         
         # Player physics
-        stadium.set_player_physics(PlayerPhysics.parse(reader))
+        stadium.set_player_physics(PlayerPhysics.parse(reader, cls))
         
         # Additional fields from ws() method
-        # max_view_width_override (nullable int32 using Sb() method)
-        max_view_width_override = reader.read_nullable_int32()
+        # max_view_width_override (uint16, Sb() method), not used
+        reader.read_uint16_be()
         
         # Camera follow (uint8/bool)
         camera_follow = reader.read_uint8()
@@ -111,17 +146,13 @@ class Stadium:
         red_spawn_count = reader.read_uint8()
         red_spawns = []
         for _ in range(red_spawn_count):
-            x = reader.read_double_be()
-            y = reader.read_double_be()
-            red_spawns.append((x, y))
+            red_spawns.append(reader.read_doubles_be(2))
         
         # Spawn points - blue team
         blue_spawn_count = reader.read_uint8()
         blue_spawns = []
         for _ in range(blue_spawn_count):
-            x = reader.read_double_be()
-            y = reader.read_double_be()
-            blue_spawns.append((x, y))
+            blue_spawns.append(reader.read_doubles_be(2))
 
         return stadium
 
@@ -143,6 +174,28 @@ class Stadium:
                 masks.append(cls.MASKS[key])
         return masks
 
+    @classmethod
+    def mask_value(cls, masks: Optional[List[str]]) -> int:
+        """Inverse of parse_mask: the integer mask for a list of names."""
+        if not masks:
+            return 0
+        names = {name: key for key, name in cls.MASKS.items()}
+        names["all"] = cls.ALL_MASK
+        value = 0
+        for name in masks:
+            value |= names[name]
+        return value
+
+    def compile(self):
+        """
+        Collision geometry, discs, joints and goals as NumPy arrays (see
+        CompiledStadium). Built from the current elements on every call:
+        compile once and keep the result. Requires numpy.
+        """
+        from .compiled import CompiledStadium
+
+        return CompiledStadium.from_stadium(self)
+
     @classmethod
     def parse_team(cls, team: int) -> str:
         return cls.TEAMS[team] if team < len(cls.TEAMS) else cls.TEAMS[0]
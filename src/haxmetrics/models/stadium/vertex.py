@@ -2,7 +2,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Vertex:
     x: float
     y: float
@@ -12,13 +12,11 @@ class Vertex:
 
     @staticmethod
     def parse(reader, stadium_cls):
-        # reader: debe tener métodos read_double_be() y read_uint32()
+        # reader: debe tener métodos read_double_be() y read_int32_be()
         # stadium_cls: clase Stadium con método parse_mask
-        x = reader.read_double_be()
-        y = reader.read_double_be()
-        b_coef = reader.read_double_be()
-        c_mask = stadium_cls.parse_mask(reader.read_uint32())
-        c_group = stadium_cls.parse_mask(reader.read_uint32())
+        x, y, b_coef = reader.read_doubles_be(3)
+        c_mask = stadium_cls.parse_mask(reader.read_int32_be())
+        c_group = stadium_cls.parse_mask(reader.read_int32_be())
         return Vertex(x=x, y=y, b_coef=b_coef, c_mask=c_mask, c_group=c_group)
 
     def to_json(self):
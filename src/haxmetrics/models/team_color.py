@@ -2,6 +2,8 @@ from typing import List, Dict, Any, Optional
 
 
 class TeamColor:
+    __slots__ = ("angle", "text_color", "stripes")
+
     def __init__(self):
         self.angle: Optional[int] = None
         self.text_color: Optional[str] = None
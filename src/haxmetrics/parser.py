@@ -5,15 +5,67 @@ from haxmetrics.models.team_color import TeamColor
 from haxmetrics.models.action import Action
 from haxmetrics.models.action_types import ACTION_TYPES
 from haxmetrics.models.stadium.disc import Disc
-from haxmetrics.binary_reader import BinaryReader
+from haxmetrics.binary_reader import BinaryReader, InflateReader, StringPool
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.action_table import ActionTable, PLAYER_INPUT
+from haxmetrics.input_timeline import InputTimeline, InputTimelineBuilder
+from haxmetrics.instrumentation import ParseStats
+from haxmetrics.cache import ParseCache
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, Optional, Protocol, Tuple
+import logging
+import struct
 import zlib
 
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 12  # 'HBR2' + version + duration
+
+_ACTION_HEADER = struct.Struct(">HB")  # sender (uint16 BE) + tipo (byte)
+_SHORT_ACTION_HEADER = struct.Struct(">BHB")  # con delta varint de un byte
+_INPUT = struct.Struct("<I")  # PlayerInput: jb() - uint32
+
+
+class InputSink(Protocol):
+    """Where iter_actions writes PlayerInput rows: ActionTable, InputTimelineBuilder."""
+
+    def append_input(self, frame: int, sender: int, input_: int) -> None: ...
+
 
 class Parser:
     ACTION_TYPES = ACTION_TYPES
 
-    def __init__(self, replay_data: bytes):
-        self.reader = BinaryReader(replay_data)
+    def __init__(
+        self,
+        replay_data,
+        stats: Optional[ParseStats] = None,
+        cache: Optional[ParseCache] = None,
+        strings: Optional[StringPool] = None,
+    ):
+        """
+        Args:
+            replay_data: contenido del .hbr2 (bytes-like) o un fichero binario
+                abierto; en este caso solo se lee la cabecera hasta parse().
+            stats: ParseStats donde acumular tiempos y bytes por fase y por
+                tipo de acción. Sin él no se mide nada.
+            cache: ParseCache donde buscar/guardar el resultado de parse().
+                La clave es el hash del fichero entero, así que con caché un
+                fichero abierto se lee completo.
+            strings: StringPool con el que decodificar los strings. Por
+                defecto uno nuevo por replay; compartir uno (acotado) entre
+                replays de un lote reutiliza nombres, países y avatares.
+        """
+        self.stats = stats
+        self.cache = cache
+        self.strings = strings if strings is not None else StringPool()
+        if cache is not None and hasattr(replay_data, "read"):
+            replay_data = replay_data.read()
+        if hasattr(replay_data, "read"):
+            self.reader = BinaryReader(replay_data.read(HEADER_SIZE), self.strings)
+            self.source = replay_data
+        else:
+            self.reader = BinaryReader(replay_data, self.strings)
+            self.source = memoryview(replay_data)[HEADER_SIZE:]
 
         # Header fields are big-endian according to HaxBall format
         self.header = self.reader.read_fixed_string(4)
@@ -23,7 +75,7 @@ class Parser:
         if self.header != "HBR2":
             raise Exception("Not a valid haxball replay!")
 
-        self.replay = {
+        self.replay: Dict[str, Any] = {
             "version": self.version,
             "duration": self.duration,
             "room_info": None,
@@ -34,21 +86,125 @@ class Parser:
             "actions": [],
         }
 
-    def parse(self):
+    @classmethod
+    def from_path(
+        cls,
+        path,
+        cache=None,
+        stats: Optional[ParseStats] = None,
+        strings: Optional[StringPool] = None,
+    ) -> "Parser":
+        """
+        Parser for the replay at ``path``. ``cache`` is a ParseCache or the
+        directory of one; parse() then returns the cached result when the
+        same bytes were already parsed by the same decoders.
+        """
+        if cache is not None and not isinstance(cache, ParseCache):
+            cache = ParseCache(cache)
+        with open(path, "rb") as f:
+            return cls(f.read(), stats=stats, cache=cache, strings=strings)
+
+    def parse(
+        self,
+        streaming: bool = False,
+        chunk_size: int = 64 * 1024,
+        columnar: bool = False,
+        types: Optional[Iterable] = None,
+    ):
         """
         Parse the replay file according to HaxBall original scripts structure.
         Order: messages -> room (includes players and team colors) -> actions
+
+        With ``streaming=True`` the compressed block is inflated on demand in
+        ``chunk_size`` pieces while messages, room and actions are decoded, so
+        only a bounded window of the decompressed replay is held in memory.
+
+        With ``columnar=True`` the actions are stored in an ActionTable
+        (typed columns, objects built on indexing) instead of a list.
+
+        With ``types`` (action classes or their names, e.g. ``{"ChatMessage"}``)
+        only those actions are decoded and kept; the payload of every other
+        action is skipped with its ``skip()`` routine, without building
+        objects nor inflating stadiums.
+
+        With a ``cache`` the result is loaded from it when present (stats are
+        then left untouched) and stored in it after parsing otherwise.
         """
-        # 1. Descomprime el bloque principal
-        decompressed_data = zlib.decompress(self.reader.get_input_string(), wbits=-15)
-        print(f"First 500 bytes: {decompressed_data[:500].hex()}")
-        reader = BinaryReader(decompressed_data)
+        if self.cache is not None:
+            key = self.cache.key(
+                self.reader.data, columnar=columnar, types=self._skip_mask(types)
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.replay = cached
+                return cached
 
-        # 2. Parse messages (must be done before room)
-        self.replay["messages"] = ReplayMessages.parse(reader)
+        if columnar:
+            table = ActionTable()
+            # Con stats cada acción tiene que pasar por count_actions
+            rows = table if self.stats is None else None
+            for action in self.iter_parse(streaming, chunk_size, rows, types):
+                table.append(action)
+            self.replay["actions"] = table
+        else:
+            self.replay["actions"] = list(
+                self.iter_parse(streaming, chunk_size, types=types)
+            )
+
+        if self.cache is not None:
+            self.cache.put(key, self.replay)
+        return self.replay
+
+    def iter_parse(
+        self,
+        streaming: bool = False,
+        chunk_size: int = 64 * 1024,
+        table: Optional[InputSink] = None,
+        types: Optional[Iterable] = None,
+    ):
+        """
+        Same as parse(), but yields the actions as they are decoded instead of
+        collecting them: ``self.replay`` holds messages, room, players, team
+        colors and discs by the time the first action is yielded, and
+        ``self.replay["actions"]`` is left untouched.
+
+        ``table`` and ``types`` are forwarded to iter_actions.
+        """
+        if self.stats is not None:
+            self.stats.replays += 1
+
+        # 1. Descomprime el bloque principal (de golpe o por trozos)
+        reader: BinaryReader
+        if streaming:
+            reader = InflateReader(self.source, chunk_size, self.stats, self.strings)
+        else:
+            reader = self.inflate()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First 500 bytes: %s", reader.peek_bytes(500).hex())
+
+        # 2-3. Messages and room state
+        self.parse_state(reader)
+
+        # 4. Actions (immediately after room state)
+        actions = self.iter_actions(reader, table, types, self.stats)
+        if self.stats is not None:
+            actions = self.stats.count_actions(actions, reader)
+        yield from actions
+
+    def _phase(self, name: str, reader=None):
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.phase(name, reader)
 
-        # 3. Parse room info (includes stadium, game state, players, and team colors)
-        self.replay["room_info"] = Room.parse(reader, self.version)
+    def parse_state(self, reader):
+        """Parse messages and room state (everything before the actions)."""
+        # Parse messages (must be done before room)
+        with self._phase("messages", reader):
+            self.replay["messages"] = ReplayMessages.parse(reader)
+
+        # Parse room info (includes stadium, game state, players, and team colors)
+        with self._phase("room", reader):
+            self.replay["room_info"] = Room.parse(reader, self.version, self.stats)
         
         # Extract players and team colors from room for backward compatibility
         self.replay["players"] = self.replay["room_info"].players if self.replay["room_info"].players else []
@@ -60,11 +216,44 @@ class Parser:
         else:
             self.replay["discs"] = []
 
-        # 4. Parse actions (immediately after room state)
-        self.replay["actions"] = self.parse_actions(reader)
-
         return self.replay
 
+    def parse_input_timelines(
+        self, streaming: bool = False, chunk_size: int = 64 * 1024
+    ) -> Dict[int, InputTimeline]:
+        """
+        Per-sender InputTimeline built from the PlayerInput actions, without
+        building Action objects (every other action is skipped). The result
+        is also stored in ``self.replay["input_timelines"]``;
+        ``self.replay["actions"]`` is left untouched.
+        """
+        builder = InputTimelineBuilder()
+        if self.stats is None:
+            for _ in self.iter_parse(streaming, chunk_size, builder, {"PlayerInput"}):
+                pass
+        else:
+            # Con stats cada acción tiene que pasar por count_actions
+            for action in self.iter_parse(streaming, chunk_size, types={"PlayerInput"}):
+                builder.append_input(action.frame, action.sender, action.input)
+
+        timelines = builder.build()
+        self.replay["input_timelines"] = timelines
+        return timelines
+
+    def inflate(self) -> BinaryReader:
+        """Inflate the whole compressed block and return a reader over it."""
+        if hasattr(self.source, "read"):
+            compressed = self.source.read()
+        else:
+            compressed = self.source
+
+        with self._phase("inflate"):
+            data = zlib.decompress(compressed, wbits=-15)
+        if self.stats is not None:
+            self.stats.compressed_bytes += len(compressed)
+            self.stats.section_bytes["inflate"] += len(data)
+        return BinaryReader(data, self.strings)
+
     def parse_discs(self, reader):
         """Parse discs from the replay. Count is a single byte (F() in original)."""
         discs = []
@@ -86,7 +275,7 @@ class Parser:
             try:
                 players.append(Player.parse(reader, self.version))
             except Exception as e:
-                print(f"Warning: Failed to parse player {i+1}/{num}: {e}")
+                logger.warning("Failed to parse player %d/%d: %s", i + 1, num, e)
                 # Player parsing failed - this may indicate a structural difference
                 # in how players are stored for certain replay types
                 break
@@ -99,48 +288,200 @@ class Parser:
         try:
             return {"red": TeamColor.parse(reader), "blue": TeamColor.parse(reader)}
         except Exception as e:
-            print(f"Warning: Failed to parse team colors: {e}")
-            print(f"  This often indicates issues with prior parsing steps")
+            logger.warning(
+                "Failed to parse team colors: %s "
+                "(this often indicates issues with prior parsing steps)",
+                e,
+            )
             # Return default team colors
             return {"red": None, "blue": None}
 
     def parse_actions(self, reader):
+        """Parse all remaining actions into a list (see iter_actions)."""
+        return list(self.iter_actions(reader))
+
+    def iter_actions(
+        self,
+        reader,
+        table: Optional[InputSink] = None,
+        types: Optional[Iterable] = None,
+        stats: Optional[ParseStats] = None,
+    ):
         """
-        Parse actions from the replay according to HaxBall original scripts.
+        Yield actions from the replay according to HaxBall original scripts,
+        one at a time with their absolute frame and sender already set.
         According to $b.cm() method:
         - Frame delta is a varint (Bb())
         - Sender ID is a uint16 big-endian (Sb())
         - Action type is a byte (F())
         - Then action-specific data is parsed by the action class
+
+        With ``table`` (an ActionTable, or any sink with its ``append_input``
+        such as InputTimelineBuilder), PlayerInput actions are appended to it
+        as rows and not yielded (no object is built for them); the caller
+        must append every yielded action to the same table, in order.
+
+        With ``types`` (action classes or names) any other action is skipped,
+        and reported to ``stats`` (see ParseStats.count_actions) if given.
         """
-        actions = []
-        frame = 0
-        print(f"Starting action parsing at position: {reader.position}")
-        
+        logger.debug("Starting action parsing at position: %d", reader.position)
+        skip = self._skip_mask(types)
+
+        # Buffer completo en memoria: PlayerInput se decodifica en línea
+        if (
+            type(reader) is BinaryReader
+            and reader.little_endian
+            and self.ACTION_TYPES[PLAYER_INPUT] is PlayerInput
+        ):
+            yield from self._iter_actions_inline(reader, table, skip, stats)
+        else:
+            yield from self._iter_actions_generic(reader, table, skip, stats)
+
+    def _skip_mask(self, types: Optional[Iterable]) -> Optional[Tuple[bool, ...]]:
+        """Per type id, True when its actions are skipped (None: keep all)."""
+        if types is None:
+            return None
+        if isinstance(types, (str, type)):
+            types = (types,)
+        wanted = {t if isinstance(t, str) else t.__name__ for t in types}
+        unknown = wanted - {cls.__name__ for cls in self.ACTION_TYPES}
+        if unknown:
+            raise ValueError(f"Unknown action types: {', '.join(sorted(unknown))}")
+        return tuple(cls.__name__ not in wanted for cls in self.ACTION_TYPES)
+
+    def _iter_actions_generic(
+        self, reader, table=None, skip=None, stats=None, frame: int = 0
+    ):
         while not reader.eof():
+            start = reader.position
             try:
                 # Read frame delta (varint)
-                frame_delta = reader.read_varint()
-                frame += frame_delta
-                
+                frame += reader.read_varint()
                 # Read sender ID (uint16 big-endian)
                 sender = reader.read_uint16_be()
-                
                 # Read action type (byte)
                 type_ = reader.read_byte()
-                
-                if type_ >= len(self.ACTION_TYPES):
-                    print(f"Invalid action type {type_} at position {reader.position - 1}")
-                    print(f"Remaining bytes: {reader.peek_bytes(20).hex()}")
-                    # Stop parsing actions - likely means we're at wrong position or end of actions
-                    break
-                    
-                cls = self.ACTION_TYPES[type_]
-                action = cls.parse(reader)
-                action.set_frame(frame).set_sender(sender)
-                actions.append(action)
+                if skip is not None and type_ < len(skip) and skip[type_]:
+                    self.ACTION_TYPES[type_].skip(reader)
+                    if stats is not None:
+                        stats.skip_action(reader.position - start)
+                    continue
+                action = self._parse_action(reader, frame, sender, type_)
+            except Exception as e:
+                logger.warning(
+                    "Failed to parse action at position %d: %s", reader.position, e
+                )
+                break
+
+            if action is None:
+                break
+            if table is not None and type(action) is PlayerInput:
+                table.append_input(frame, sender, action.input)
+                continue
+            yield action
+
+    def _iter_actions_inline(self, reader, table=None, skip=None, stats=None):
+        """
+        Same stream as _iter_actions_generic, but the action header and the
+        PlayerInput body (~95% of the actions) are unpacked straight from the
+        buffer, without reader calls nor chained setters. Other types, and
+        any truncated or malformed header, go through the generic path.
+        """
+        data = reader.data
+        length = reader.length
+        pos = reader.position
+        frame = 0
+        unpack_short = _SHORT_ACTION_HEADER.unpack_from
+        unpack_header = _ACTION_HEADER.unpack_from
+        unpack_input = _INPUT.unpack_from
+        append_input = table.append_input if table is not None else None
+        new = object.__new__
+        keep_inputs = skip is None or not skip[PLAYER_INPUT]
+
+        while pos < length:
+            start = pos
+            try:
+                # Caso común: delta de un byte, toda la cabecera en un unpack
+                delta, sender, type_ = unpack_short(data, pos)
+                pos += 4
+                if delta & 0x80:
+                    pos = start + 1
+                    delta &= 0x7F
+                    byte = 0x80
+                    shift = 0
+                    while byte & 0x80:
+                        shift += 7
+                        if shift > 35:
+                            raise ValueError
+                        byte = data[pos]
+                        pos += 1
+                        delta |= (byte & 0x7F) << shift
+                    sender, type_ = unpack_header(data, pos)
+                    pos += 3
+                if type_ == PLAYER_INPUT:
+                    if keep_inputs:
+                        (input_,) = unpack_input(data, pos)
+                    elif pos + 4 > length:
+                        raise IndexError
+                    pos += 4
+            except (IndexError, ValueError, struct.error):
+                # Cabecera o cuerpo truncados: el camino genérico lo reporta
+                reader.position = start
+                yield from self._iter_actions_generic(reader, table, skip, stats, frame)
+                return
+
+            frame += delta
+            if type_ == PLAYER_INPUT:
+                if not keep_inputs:
+                    if stats is not None:
+                        stats.skip_action(pos - start)
+                    continue
+                if append_input is not None:
+                    append_input(frame, sender, input_)
+                    continue
+                action = new(PlayerInput)
+                action.type = "PlayerInput"
+                action.frame = frame
+                action.sender = sender
+                action.input = input_
+                reader.position = pos
+                yield action
+                continue
+
+            reader.position = pos
+            try:
+                if skip is not None and type_ < len(skip) and skip[type_]:
+                    self.ACTION_TYPES[type_].skip(reader)
+                    pos = reader.position
+                    if stats is not None:
+                        stats.skip_action(pos - start)
+                    continue
+                action = self._parse_action(reader, frame, sender, type_)
             except Exception as e:
-                print(f"Warning: Failed to parse action at position {reader.position}: {e}")
+                logger.warning(
+                    "Failed to parse action at position %d: %s", reader.position, e
+                )
                 break
-                
-        return actions
+            if action is None:
+                break
+            pos = reader.position
+            yield action
+        else:
+            # Sin break: las últimas acciones pueden no haber movido el lector
+            reader.position = pos
+
+    def _parse_action(self, reader, frame: int, sender: int, type_: int):
+        """Decode the body of one action; None for an unknown type."""
+        if type_ >= len(self.ACTION_TYPES):
+            logger.warning(
+                "Invalid action type %d at position %d (next bytes: %s)",
+                type_,
+                reader.position - 1,
+                reader.peek_bytes(20).hex(),
+            )
+            # Stop parsing actions: likely a wrong position or the end of the actions
+            return None
+
+        cls = self.ACTION_TYPES[type_]
+        action = cls.parse(reader)
+        return action.set_frame(frame).set_sender(sender)
@@ -0,0 +1 @@
+"""Replay simulation: a NumPy port of the HaxBall physics step and game rules."""
@@ -0,0 +1,94 @@
+# haxmetrics/sim/events.py
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("haxmetrics.sim requires numpy") from e
+
+# Tipos de evento
+TOUCH, KICK = 0, 1
+
+EVENT_DTYPE = np.dtype(
+    [
+        ("frame", np.int32),
+        ("kind", np.int8),
+        ("player", np.int32),
+        ("disc", np.int16),
+        ("target", np.int16),
+        ("before", np.float32, (2,)),
+        ("after", np.float32, (2,)),
+    ]
+)
+
+
+class EventLog:
+    """
+    Touch and kick events of a simulation, as one structured array
+    (EVENT_DTYPE, 29 bytes per event) in frame order.
+
+    - ``frame``: tick that produced the event
+    - ``kind``: TOUCH (the player disc overlapped a kickable disc during
+      the disc collisions of that tick, once per tick of contact) or KICK
+    - ``player``: player id
+    - ``disc`` and ``target``: Trajectory columns of the player disc and of
+      the touched or kicked disc (0 is the ball)
+    - ``before`` and ``after``: velocity (x, y) of the target right before
+      and after the collision or kick that produced the event
+
+    Events are written into a buffer that doubles when full, so
+    ``events`` is a view and ``events[n:]`` gives the ones appended since
+    there were ``n``, without copying the log.
+    """
+
+    __slots__ = ("_buffer", "_size")
+
+    def __init__(self) -> None:
+        self._buffer = np.zeros(16, dtype=EVENT_DTYPE)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def events(self):
+        return self._buffer[: self._size]
+
+    @property
+    def touches(self):
+        events = self.events
+        return events[events["kind"] == TOUCH]
+
+    @property
+    def kicks(self):
+        events = self.events
+        return events[events["kind"] == KICK]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.events.nbytes)
+
+    def append(
+        self, frame: int, kind: int, player, disc, target, before, after
+    ) -> None:
+        """One event per entry of the arrays; velocities are complex."""
+        start, end = self._size, self._size + len(player)
+        if end > len(self._buffer):
+            buffer = np.zeros(max(end, 2 * len(self._buffer)), dtype=EVENT_DTYPE)
+            buffer[:start] = self._buffer[:start]
+            self._buffer = buffer
+        block = self._buffer[start:end]
+        block["frame"] = frame
+        block["kind"] = kind
+        block["player"] = player
+        block["disc"] = disc
+        block["target"] = target
+        block["before"] = np.column_stack((before.real, before.imag))
+        block["after"] = np.column_stack((after.real, after.imag))
+        self._size = end
+
+    def truncate(self, frame: int) -> None:
+        """Drop the events after ``frame`` (when the simulation goes back)."""
+        self._size = int(np.searchsorted(self.events["frame"], frame, side="right"))
+
+    def clear(self) -> None:
+        self._size = 0
@@ -0,0 +1,114 @@
+# haxmetrics/sim/keyframes.py
+
+import bisect
+from typing import Any, Dict, List, Optional, Sequence
+
+from haxmetrics.models.action import Action
+from haxmetrics.sim.simulator import Simulator, Snapshot
+
+
+class KeyframeStore:
+    """
+    Snapshots of a simulation every ``interval`` frames, for seeking.
+
+    record() plays the actions through once and keeps a Snapshot every
+    ``interval`` frames (counted from the simulator's frame when the store
+    was created). seek(frame) restores the last keyframe at or before
+    ``frame`` and ticks forward at most ``interval - 1`` frames, so the
+    cost of a seek does not depend on how far into the replay it lands.
+    A larger interval keeps fewer snapshots (see ``nbytes``) at the price
+    of longer seeks.
+
+    The state returned for a frame is the one Simulator.run records for
+    it: after the tick that reaches the frame, before the actions sent
+    on it.
+    """
+
+    __slots__ = (
+        "simulator",
+        "actions",
+        "interval",
+        "start",
+        "end",
+        "frames",
+        "cursors",
+        "snapshots",
+    )
+
+    def __init__(
+        self, simulator: Simulator, actions: Sequence[Action], interval: int = 120
+    ):
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.simulator = simulator
+        self.actions = actions
+        self.interval = interval
+        self.start = simulator.frame
+        self.end = simulator.frame
+        self.frames: List[int] = []
+        self.cursors: List[int] = []  # Índice de la siguiente acción en cada keyframe
+        self.snapshots: List[Snapshot] = []
+
+    @classmethod
+    def from_replay(
+        cls, replay: Dict[str, Any], interval: int = 120
+    ) -> "KeyframeStore":
+        """Store for a parsed replay, recorded up to its last frame."""
+        store = cls(Simulator.from_replay(replay), replay["actions"], interval)
+        store.record(until=replay["duration"])
+        return store
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(snapshot.nbytes for snapshot in self.snapshots)
+
+    def record(self, until: Optional[int] = None) -> "KeyframeStore":
+        """Simulate every action (and up to frame ``until``), keeping keyframes."""
+        simulator, actions, interval = self.simulator, self.actions, self.interval
+        self.frames.clear()
+        self.cursors.clear()
+        self.snapshots.clear()
+
+        last = max(until or 0, (actions[-1].frame or 0) if len(actions) else 0)
+        cursor = 0
+        while True:
+            if (simulator.frame - self.start) % interval == 0:
+                self.frames.append(simulator.frame)
+                self.cursors.append(cursor)
+                self.snapshots.append(simulator.snapshot())
+            while (
+                cursor < len(actions)
+                and (actions[cursor].frame or 0) <= simulator.frame
+            ):
+                simulator.apply(actions[cursor])
+                cursor += 1
+            if simulator.frame >= last:
+                break
+            simulator.tick()
+        self.end = simulator.frame
+        return self
+
+    def seek(self, frame: int) -> Simulator:
+        """The simulator, at ``frame`` (between ``start`` and ``end``)."""
+        if not self.snapshots:
+            raise ValueError("No keyframes: call record() first")
+        if not self.start <= frame <= self.end:
+            raise ValueError(
+                f"Frame {frame} outside the recorded range {self.start}-{self.end}"
+            )
+        index = bisect.bisect_right(self.frames, frame) - 1
+        simulator, actions = self.simulator, self.actions
+        simulator.restore(self.snapshots[index])
+        cursor = self.cursors[index]
+        while simulator.frame < frame:
+            while (
+                cursor < len(actions)
+                and (actions[cursor].frame or 0) <= simulator.frame
+            ):
+                simulator.apply(actions[cursor])
+                cursor += 1
+            simulator.tick()
+        return simulator
@@ -0,0 +1,822 @@
+# haxmetrics/sim/simulator.py
+
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("haxmetrics.sim requires numpy") from e
+
+from haxmetrics.input_timeline import DOWN, KICK, LEFT, RIGHT, UP
+from haxmetrics.models.action import Action
+from haxmetrics.models.actions.change_paused import ChangePaused
+from haxmetrics.models.actions.match_start import MatchStart
+from haxmetrics.models.actions.match_stopped import MatchStopped
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.models.actions.player_joined import PlayerJoined
+from haxmetrics.models.actions.player_left import PlayerLeft
+from haxmetrics.models.actions.player_team_change import PlayerTeamChange
+from haxmetrics.models.room import Room
+from haxmetrics.models.stadium.player_physics import PlayerPhysics
+from haxmetrics.models.stadium.stadium import Stadium
+from haxmetrics.sim.events import KICK as KICK_EVENT
+from haxmetrics.sim.events import TOUCH, EventLog
+from haxmetrics.sim.world import World, as_complex
+
+logger = logging.getLogger(__name__)
+
+SPECTATORS, RED, BLUE = 0, 1, 2
+
+# Por equipo (u.ia / u.Da): lado del campo, máscara de saque y grupo de colisión
+TEAM_SIDE = {RED: -1, BLUE: 1}
+TEAM_KICKOFF_MASK = {RED: 8, BLUE: 16}
+TEAM_GROUP = {RED: 2, BLUE: 4}
+
+PLAYER_MASK = 39  # ball | red | blue | wall
+KICKABLE = 64
+SCORE = 128
+
+KICK_REACH = 4.0  # Distancia entre bordes para patear
+
+# Fases de la partida (Y.Cb)
+KICKOFF, PLAYING, GOAL, ENDED = 0, 1, 2, 3
+GOAL_TICKS = 150
+END_TICKS = 300
+PAUSED = 120  # Y.Ta mientras está en pausa; al reanudar cuenta hacia 0
+
+TICK_SECONDS = 1 / 60
+
+# Dirección de cada combinación de flechas (input & 15), normalizada en diagonal
+DIRECTIONS = np.array(
+    [
+        complex(bool(i & RIGHT) - bool(i & LEFT), bool(i & DOWN) - bool(i & UP))
+        for i in range(16)
+    ]
+)
+DIRECTIONS[(DIRECTIONS.real != 0) & (DIRECTIONS.imag != 0)] *= math.sqrt(0.5)
+
+
+def team_id(team) -> int:
+    """Team number (0 spectators, 1 red, 2 blue) from a name or number."""
+    if isinstance(team, str):
+        return Stadium.TEAMS.index(team) if team in Stadium.TEAMS else SPECTATORS
+    return int(team or 0)
+
+
+def _cross(u, v):
+    # u.x * v.y - u.y * v.x
+    return u.real * v.imag - u.imag * v.real
+
+
+class Trajectory:
+    """
+    Disc positions of a simulation: ``positions`` is (frames, slots, 2)
+    float32, NaN where a slot has no disc. ``owners`` gives the player id of
+    every slot (-1 for the ball and stadium discs; slot 0 is the ball) and
+    ``start`` the replay frame of ``positions[0]``.
+    """
+
+    __slots__ = ("start", "positions", "owners")
+
+    def __init__(self, start: int, positions, owners):
+        self.start = start
+        self.positions = positions
+        self.owners = owners
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def at(self, frame: int):
+        """(slots, 2) positions at replay frame ``frame``."""
+        return self.positions[frame - self.start]
+
+    def of_player(self, player_id: int):
+        """(frames, 2) positions of the disc of ``player_id``."""
+        slots = np.flatnonzero(self.owners == player_id)
+        if not len(slots):
+            raise KeyError(player_id)
+        return self.positions[:, slots[0]]
+
+    @property
+    def ball(self):
+        return self.positions[:, 0]
+
+
+class Snapshot:
+    """
+    Full simulation state at one frame, as a few arrays: ``discs`` and
+    ``masks`` (World.snapshot), ``players`` (one row per player column:
+    id, slot, team, input, kicking, kick timer, kick burst), ``slots`` and
+    ``owners`` (the World slots of the game and the player id of each)
+    and ``game`` (frame, running, phase, phase timer, pause timer, clock,
+    red score, blue score, kickoff team).
+    """
+
+    __slots__ = ("discs", "masks", "players", "slots", "owners", "game")
+
+    def __init__(self, discs, masks, players, slots, owners, game):
+        self.discs = discs
+        self.masks = masks
+        self.players = players
+        self.slots = slots
+        self.owners = owners
+        self.game = game
+
+    @property
+    def frame(self) -> int:
+        return int(self.game[0])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+
+class Simulator:
+    """
+    Plays a replay back tick by tick (Y.A in game-min.js): player movement
+    and kicks from PlayerInput, the World physics step, and the kickoff,
+    goal, clock and end-of-game rules. Touches and kicks of kickable discs
+    are logged to ``events`` (EventLog) as the tick resolves them.
+
+    Roster actions (PlayerJoined, PlayerLeft, PlayerTeamChange) and
+    MatchStart/MatchStopped/ChangePaused are applied as well; other actions
+    do not touch the physics. The ball is the first slot of the game,
+    followed by the stadium discs; every player gets one slot for the
+    whole replay. ``slots`` lists the World slots of the game in that
+    order: all of them unless the World is shared with other games
+    (``world`` and ``batch``, see BatchSimulator).
+    """
+
+    __slots__ = (
+        "stadium",
+        "physics",
+        "world",
+        "batch",
+        "slots",
+        "frame",
+        "running",
+        "phase",
+        "phase_timer",
+        "pause_timer",
+        "clock",
+        "score_red",
+        "score_blue",
+        "kickoff_team",
+        "score_limit",
+        "time_limit",
+        "kick_timeout",
+        "kick_rate_limit",
+        "kick_rate_limit_burst",
+        "players",
+        "player_ids",
+        "player_slot",
+        "player_team",
+        "player_input",
+        "player_kicking",
+        "player_kick_timer",
+        "player_kick_burst",
+        "owners",
+        "events",
+        "_stadium_discs",
+        "_goals",
+        "_field",
+    )
+
+    def __init__(self, room: Room, world: Optional[World] = None, batch: int = 0):
+        self.stadium: Optional[Stadium] = room.stadium
+        self.physics: PlayerPhysics = (
+            room.stadium.player_physics if room.stadium else None
+        ) or PlayerPhysics()
+        self.world = world if world is not None else World.from_stadium(self.stadium)
+        self.batch = batch
+        self.slots: List[int] = []
+        self.frame = 0
+        self.running = False
+        self.phase = KICKOFF
+        self.phase_timer = 0
+        self.pause_timer = 0
+        self.clock = 0.0
+        self.score_red = 0
+        self.score_blue = 0
+        self.kickoff_team = RED
+        self.score_limit = room.score_limit or 0
+        self.time_limit = room.time_limit or 0
+        self.kick_timeout = room.kick_timeout
+        self.kick_rate_limit = room.kick_rate_limit
+        self.kick_rate_limit_burst = room.kick_rate_limit_burst
+
+        # Jugadores en orden de la sala (Ra.K): columnas por índice de jugador
+        self.players: Dict[int, int] = {}
+        self.player_ids = np.zeros(0, dtype=np.int64)
+        self.player_slot = np.zeros(0, dtype=np.intp)
+        self.player_team = np.zeros(0, dtype=np.int8)
+        self.player_input = np.zeros(0, dtype=np.int64)
+        self.player_kicking = np.zeros(0, dtype=bool)
+        self.player_kick_timer = np.zeros(0, dtype=np.int64)
+        self.player_kick_burst = np.zeros(0, dtype=np.int64)
+        self.owners: List[int] = []
+        self.events = EventLog()
+        self._field = None
+
+        self._stadium_discs = self._add_stadium_discs()
+        self._goals = self._goal_arrays()
+        for player in room.players or []:
+            self.add_player(player.id, team_id(player.team), player.input or 0)
+
+        if room.in_progress and room.game is not None:
+            self._restore(room.game, room.players or [])
+
+    @classmethod
+    def from_replay(cls, replay: Dict[str, Any]) -> "Simulator":
+        """Simulator at the initial state of a parsed replay."""
+        return cls(replay["room_info"])
+
+    # Estado inicial
+
+    def _add_stadium_discs(self) -> List[dict]:
+        """
+        Stadium discs in their slots, the ball first (T.H in game-min.js);
+        returns their initial state.
+        """
+        geometry = self.world.geometry
+        columns = (
+            geometry.disc_pos.tolist(),
+            geometry.disc_velocity.tolist(),
+            geometry.disc_gravity.tolist(),
+            geometry.disc_radius.tolist(),
+            geometry.disc_b_coef.tolist(),
+            geometry.disc_inv_mass.tolist(),
+            geometry.disc_damping.tolist(),
+            geometry.disc_c_mask.tolist(),
+            geometry.disc_c_group.tolist(),
+        )
+        discs = [
+            dict(
+                x=x,
+                y=y,
+                vx=vx,
+                vy=vy,
+                gravity=tuple(gravity),
+                radius=radius,
+                b_coef=b_coef,
+                inv_mass=inv_mass,
+                damping=damping,
+                c_mask=c_mask,
+                c_group=c_group,
+            )
+            for (x, y), (
+                vx,
+                vy,
+            ), gravity, radius, b_coef, inv_mass, damping, c_mask, c_group in zip(
+                *columns
+            )
+        ]
+        if not discs:
+            # Estadio sin discos: balón por defecto (q.rg)
+            discs.append(
+                dict(
+                    radius=10.0,
+                    b_coef=0.5,
+                    inv_mass=1.0,
+                    damping=0.99,
+                    c_mask=63,
+                    c_group=193,
+                )
+            )
+        ball = self.stadium.ball_physics if self.stadium is not None else None
+        if ball is not None:
+            # ballPhysics de un .hbs: sustituye la física del disco 0
+            discs[0].update(
+                radius=ball.radius,
+                b_coef=ball.b_coef,
+                inv_mass=ball.inv_mass,
+                damping=ball.damping,
+                c_mask=Stadium.mask_value(ball.c_mask),
+                c_group=Stadium.mask_value(ball.c_group),
+            )
+        for disc in discs:
+            self.slots.append(self.world.add_disc(**disc, batch=self.batch))
+            self.owners.append(-1)
+        # Los índices de los joints cuentan desde el balón (disco 0)
+        first = self.slots[0]
+        for joint in zip(
+            (geometry.joint_a + first).tolist(),
+            (geometry.joint_b + first).tolist(),
+            geometry.joint_min.tolist(),
+            geometry.joint_max.tolist(),
+            geometry.joint_stiffness.tolist(),
+        ):
+            self.world.add_joint(*joint)
+        return discs
+
+    def _goal_arrays(self):
+        geometry = self.world.geometry
+        if not len(geometry.goal_team):
+            return None
+        return (
+            as_complex(geometry.goal_start),
+            as_complex(geometry.goal_end),
+            geometry.goal_team,
+        )
+
+    def _restore(self, game, players) -> None:
+        """Take over a game already in progress (Game state from Room.parse)."""
+        self.running = True
+        self.frame = game.frame or 0
+        self.score_red, self.score_blue = game.score_red, game.score_blue
+        self.clock = game.match_time or 0.0
+        self.phase = PLAYING if game.kick_off_taken else KICKOFF
+        self.kickoff_team = game.kick_off_team or RED
+        self.pause_timer = PAUSED if game.pause_timer else 0
+
+        stadium_slots = len(self._stadium_discs)
+        for player in players:
+            column = self.players[player.id]
+            if self.player_team[column] != SPECTATORS:
+                self._spawn(column)
+        by_disc = {
+            p.disc_id: self.players[p.id] for p in players if p.disc_id is not None
+        }
+        position, velocity = self.world.position, self.world.velocity
+        for index, state in enumerate(game.discs):
+            if index < stadium_slots:
+                slot = self.slots[index]
+            elif index in by_disc:
+                slot = self.player_slot[by_disc[index]]
+            else:
+                continue
+            position[slot] = complex(state["x"], state["y"])
+            velocity[slot] = complex(state["vx"], state["vy"])
+
+    # Jugadores
+
+    def add_player(
+        self, player_id: int, team: int = SPECTATORS, input_: int = 0
+    ) -> int:
+        """Register a player (PlayerJoined); returns its column."""
+        column = len(self.player_ids)
+        self._field = None
+        self.players[player_id] = column
+        self.player_ids = np.append(self.player_ids, player_id)
+        self.player_slot = np.append(self.player_slot, -1)
+        self.player_team = np.append(self.player_team, team)
+        self.player_input = np.append(self.player_input, input_)
+        self.player_kicking = np.append(self.player_kicking, False)
+        self.player_kick_timer = np.append(self.player_kick_timer, 0)
+        self.player_kick_burst = np.append(self.player_kick_burst, 0)
+        return column
+
+    def _slot(self, column: int) -> int:
+        slot = self.player_slot[column]
+        if slot < 0:
+            slot = self.player_slot[column] = self.world.add_disc(
+                x=np.nan, y=np.nan, c_mask=0, c_group=0, batch=self.batch
+            )
+            self.slots.append(int(slot))
+            self.owners.append(int(self.player_ids[column]))
+        return int(slot)
+
+    def _spawn(self, column: int) -> None:
+        """Give a player its disc with the stadium player physics (Y.Wk)."""
+        team = int(self.player_team[column])
+        if team == SPECTATORS:
+            self._despawn(column)
+            return
+        slot = self._slot(column)
+        self._field = None
+        world, physics = self.world, self.physics
+        spawn = self.stadium.spawn_distance if self.stadium is not None else None
+        world.position[slot] = TEAM_SIDE[team] * (spawn or 0.0)
+        world.velocity[slot] = 0.0
+        world.gravity[slot] = complex(physics.gravity_x, physics.gravity_y)
+        world.radius[slot] = physics.radius
+        world.inv_mass[slot] = physics.inv_mass
+        world.damping[slot] = physics.damping
+        world.b_coef[slot] = physics.b_coef
+        world.c_mask[slot] = PLAYER_MASK
+        world.c_group[slot] = TEAM_GROUP[team] | Stadium.mask_value(physics.c_group)
+        self.player_kicking[column] = False
+        self.player_kick_timer[column] = 0
+        self.player_kick_burst[column] = 0
+
+    def _despawn(self, column: int) -> None:
+        slot = self.player_slot[column]
+        if slot >= 0:
+            self.world.remove_disc(slot)
+            self._field = None
+
+    # Partida
+
+    def start(self) -> None:
+        """Start a new game (MatchStart): scores, clock and kickoff reset."""
+        self.running = True
+        self.score_red = self.score_blue = 0
+        self.clock = 0.0
+        self.pause_timer = 0
+        self.kickoff_team = RED
+        self._kickoff()
+
+    def stop(self) -> None:
+        """End the game (MatchStopped): every disc leaves the field."""
+        self.running = False
+        for column in range(len(self.player_ids)):
+            self._despawn(column)
+
+    def _kickoff(self) -> None:
+        """Ball back to its spot and players to kickoff positions (Y.$k)."""
+        self.phase = KICKOFF
+        world = self.world
+        ball = dict(self._stadium_discs[0])
+        world.position[self.slots[0]] = complex(ball.get("x", 0.0), ball.get("y", 0.0))
+        world.velocity[self.slots[0]] = complex(
+            ball.get("vx", 0.0), ball.get("vy", 0.0)
+        )
+
+        spawn = (
+            self.stadium.spawn_distance if self.stadium is not None else None
+        ) or 0.0
+        placed = {RED: 0, BLUE: 0}
+        for column in range(len(self.player_ids)):
+            self._spawn(column)
+            team = int(self.player_team[column])
+            if team == SPECTATORS:
+                continue
+            order = placed[team]
+            row = (order + 1) >> 1
+            if order & 1 == 0:
+                row = -row
+            world.position[self.player_slot[column]] = complex(
+                spawn * TEAM_SIDE[team], 55.0 * row
+            )
+            placed[team] += 1
+
+    # Acciones que cambian la simulación; el resto se ignora
+    ACTIONS = (
+        PlayerInput,
+        PlayerTeamChange,
+        PlayerJoined,
+        PlayerLeft,
+        MatchStart,
+        MatchStopped,
+        ChangePaused,
+    )
+
+    def apply(self, action: Action) -> None:
+        """Apply one action at the current frame (only ACTIONS have an effect)."""
+        if isinstance(action, PlayerInput):
+            column = (
+                self.players.get(action.sender) if action.sender is not None else None
+            )
+            if column is not None:
+                # El pateo empieza al pulsar KICK (La.apply)
+                # y termina al soltarlo (Y.A)
+                if not action.input & KICK:
+                    self.player_kicking[column] = False
+                elif not self.player_input[column] & KICK:
+                    self.player_kicking[column] = True
+                self.player_input[column] = action.input
+        elif isinstance(action, PlayerTeamChange):
+            column = self.players.get(action.player_id)
+            if column is not None and self.player_team[column] != action.team:
+                self.player_team[column] = action.team
+                if self.running:
+                    self._despawn(column)
+                    self._spawn(column)
+        elif isinstance(action, PlayerJoined):
+            if action.player_id not in self.players:
+                self.add_player(action.player_id)
+        elif isinstance(action, PlayerLeft):
+            column = self.players.get(action.player_id)
+            if column is not None:
+                self._despawn(column)
+                self.player_team[column] = SPECTATORS
+        elif isinstance(action, MatchStart):
+            if not self.running:
+                self.start()
+        elif isinstance(action, MatchStopped):
+            if self.running:
+                self.stop()
+        elif isinstance(action, ChangePaused):
+            if self.running:
+                if action.paused:
+                    self.pause_timer = PAUSED
+                elif self.pause_timer == PAUSED:
+                    self.pause_timer = PAUSED - 1
+
+    def tick(self) -> None:
+        """Advance one frame."""
+        state = self._prepare()
+        if state is not None:
+            self.world.step()
+            self._rules(*state)
+
+    def _prepare(self):
+        """
+        Everything before the physics step of a tick; returns the arguments
+        of _rules, or None when the game does not move this frame.
+        """
+        self.frame += 1
+        if not self.running:
+            return None
+        if self.pause_timer > 0:
+            if self.pause_timer < PAUSED:
+                self.pause_timer -= 1
+            return None
+
+        self._move_players()
+        scoring = self._on_field()[2]
+        return scoring, self.world.position[scoring]
+
+    def _on_field(self):
+        """
+        Columns and slots of the players with a disc, the scoring and
+        kickable discs, and the slots of the game with their owners.
+        """
+        if self._field is None:
+            world, slot = self.world, self.player_slot
+            columns = np.flatnonzero(slot >= 0)
+            columns = columns[world.c_group[slot[columns]] != 0]
+            own = np.array(self.slots, dtype=np.intp)
+            self._field = (
+                columns,
+                slot[columns],
+                own[world.c_group[own] & SCORE != 0],
+                own[world.c_group[own] & KICKABLE != 0],
+                own,
+                np.array(self.owners, dtype=np.int64),
+            )
+        return self._field
+
+    def _move_players(self) -> None:
+        """Kicks and input acceleration of every player with a disc, at once."""
+        world, physics = self.world, self.physics
+        columns, slots = self._on_field()[:2]
+        if not len(columns):
+            return
+        inputs = self.player_input[columns]
+        kicking = self.player_kicking[columns]
+
+        timer = self.player_kick_timer[columns]
+        timer[timer > 0] -= 1
+        burst = self.player_kick_burst[columns]
+        burst[burst < self.kick_rate_limit_burst] += 1
+
+        ready = kicking & (timer <= 0) & (burst >= 0)
+        if ready.any():
+            kicked = self._kick(slots[ready])
+            index = np.flatnonzero(ready)[kicked]
+            kicking[index] = False
+            timer[index] = self.kick_timeout
+            burst[index] -= self.kick_rate_limit
+        self.player_kicking[columns] = kicking
+        self.player_kick_timer[columns] = timer
+        self.player_kick_burst[columns] = burst
+
+        acceleration = np.where(
+            kicking, physics.kicking_acceleration, physics.acceleration
+        )
+        world.velocity[slots] += DIRECTIONS[inputs & 15] * acceleration
+        world.damping[slots] = np.where(
+            kicking, physics.kicking_damping, physics.damping
+        )
+
+    def _kick(self, kickers):
+        """Kick the kickable discs in reach of ``kickers``; True per kicker that hit."""
+        world = self.world
+        _, _, _, targets, own, owners = self._on_field()
+        if not len(targets):
+            return np.zeros(len(kickers), dtype=bool)
+        delta = world.position[targets][None, :] - world.position[kickers][:, None]
+        dist = np.abs(delta)
+        gap = dist - world.radius[targets][None, :] - world.radius[kickers][:, None]
+        hit = (gap < KICK_REACH) & (dist > 0) & (targets[None, :] != kickers[:, None])
+        if hit.any():
+            kicker, target = np.nonzero(hit)
+            normal = delta[kicker, target] / dist[kicker, target]
+            strength = self.physics.kick_strength
+            kicked = targets[target]
+            before = world.velocity[kicked]
+            np.add.at(
+                world.velocity, kicked, normal * (strength * world.inv_mass[kicked])
+            )
+            if self.physics.kickback:
+                np.add.at(
+                    world.velocity,
+                    kickers[kicker],
+                    -normal * (self.physics.kickback * world.inv_mass[kickers[kicker]]),
+                )
+            disc = np.searchsorted(own, kickers[kicker])
+            self.events.append(
+                self.frame,
+                KICK_EVENT,
+                owners[disc],
+                disc,
+                np.searchsorted(own, kicked),
+                before,
+                world.velocity[kicked],
+            )
+        return hit.any(axis=1)
+
+    def _rules(self, scoring, before) -> None:
+        """Kickoff, goals, clock and end of game after the physics step."""
+        world = self.world
+        if world.contacts is not None:
+            self._touches(world.contacts)
+        players = self._on_field()[1]
+        if self.phase == KICKOFF:
+            world.c_mask[players] = PLAYER_MASK | TEAM_KICKOFF_MASK[self.kickoff_team]
+            if world.velocity[self.slots[0]] != 0:
+                self.phase = PLAYING
+        elif self.phase == PLAYING:
+            self.clock += TICK_SECONDS
+            world.c_mask[players] = PLAYER_MASK
+            team = self._goal_crossed(before, world.position[scoring])
+            if team != SPECTATORS:
+                self.phase = GOAL
+                self.phase_timer = GOAL_TICKS
+                self.kickoff_team = team
+                if team == RED:
+                    self.score_blue += 1
+                else:
+                    self.score_red += 1
+            elif self._time_over():
+                self._end()
+        elif self.phase == GOAL:
+            self.phase_timer -= 1
+            if self.phase_timer <= 0:
+                limit = self.score_limit
+                if (
+                    limit > 0
+                    and max(self.score_red, self.score_blue) >= limit
+                    or self._time_over()
+                ):
+                    self._end()
+                else:
+                    self._kickoff()
+        elif self.phase == ENDED:
+            self.phase_timer -= 1
+            if self.phase_timer <= 0:
+                self.stop()
+
+    def _touches(self, contacts) -> None:
+        """Log the player discs that touched a kickable disc of this game this step."""
+        first, second, before_first, before_second, after_first, after_second = contacts
+        _, players, _, targets, own, owners = self._on_field()
+        if not len(players) or not len(targets):
+            return
+        # Los pares van en orden de slot: el jugador puede ser cualquiera de los dos
+        player = np.concatenate((first, second))
+        target = np.concatenate((second, first))
+        touch = np.isin(player, players) & np.isin(target, targets)
+        if not touch.any():
+            return
+        before = np.concatenate((before_second, before_first))[touch]
+        after = np.concatenate((after_second, after_first))[touch]
+        disc = np.searchsorted(own, player[touch])
+        self.events.append(
+            self.frame,
+            TOUCH,
+            owners[disc],
+            disc,
+            np.searchsorted(own, target[touch]),
+            before,
+            after,
+        )
+
+    def _time_over(self) -> bool:
+        return (
+            self.time_limit > 0
+            and self.clock >= 60 * self.time_limit
+            and self.score_red != self.score_blue
+        )
+
+    def _end(self) -> None:
+        self.phase = ENDED
+        self.phase_timer = END_TICKS
+
+    def _goal_crossed(self, before, after) -> int:
+        """Team of the goal line a scoring disc crossed this tick (q.ro), 0 if none."""
+        if self._goals is None or not len(before):
+            return SPECTATORS
+        starts, ends, teams = self._goals
+        line = ends - starts
+        for a, b in zip(after, before):
+            # Lado de cada punto respecto a una recta: signo del producto cruzado
+            move = b - a
+            side0 = _cross(starts - a, move) > 0
+            side1 = _cross(ends - a, move) > 0
+            side2 = _cross(a - starts, line) > 0
+            side3 = _cross(b - starts, line) > 0
+            crossed = np.flatnonzero((side0 != side1) & (side2 != side3))
+            if len(crossed):
+                return int(teams[crossed[0]])
+        return SPECTATORS
+
+    # Estado
+
+    GAME_FIELDS = (
+        "frame",
+        "running",
+        "phase",
+        "phase_timer",
+        "pause_timer",
+        "clock",
+        "score_red",
+        "score_blue",
+        "kickoff_team",
+    )
+    PLAYER_FIELDS = (
+        "player_ids",
+        "player_slot",
+        "player_team",
+        "player_input",
+        "player_kicking",
+        "player_kick_timer",
+        "player_kick_burst",
+    )
+
+    def _shares_world(self) -> bool:
+        return bool(np.any(self.world.batch != self.batch))
+
+    def snapshot(self) -> Snapshot:
+        """Copy of the whole simulation state (see restore)."""
+        discs, masks = self.world.snapshot()
+        return Snapshot(
+            discs,
+            masks,
+            np.column_stack(
+                [getattr(self, name) for name in self.PLAYER_FIELDS]
+            ).astype(np.int64),
+            np.array(self.slots, dtype=np.int64),
+            np.array(self.owners, dtype=np.int64),
+            np.array(
+                [getattr(self, name) for name in self.GAME_FIELDS], dtype=np.float64
+            ),
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        Go back to a snapshot() of this simulator (or of one for the same
+        room). The whole World is replaced, so a simulator sharing its World
+        with other games (BatchSimulator) cannot be restored.
+        """
+        if self._shares_world() or np.any(snapshot.masks[:, 2] != self.batch):
+            raise ValueError("Cannot restore a simulator whose World holds other games")
+        self.world.restore(snapshot.discs, snapshot.masks)
+        for name, column in zip(self.PLAYER_FIELDS, snapshot.players.T):
+            setattr(self, name, column.astype(getattr(self, name).dtype))
+        self.players = {
+            player_id: column
+            for column, player_id in enumerate(self.player_ids.tolist())
+        }
+        self.slots = snapshot.slots.tolist()
+        self.owners = snapshot.owners.tolist()
+        frame, running, phase, phase_timer, pause_timer, clock, red, blue, kickoff = (
+            snapshot.game.tolist()
+        )
+        self.frame, self.running, self.phase = int(frame), bool(running), int(phase)
+        self.phase_timer, self.pause_timer, self.clock = (
+            int(phase_timer),
+            int(pause_timer),
+            clock,
+        )
+        self.score_red, self.score_blue, self.kickoff_team = (
+            int(red),
+            int(blue),
+            int(kickoff),
+        )
+        self.events.truncate(self.frame)
+        self._field = None
+
+    # Ejecución
+
+    def run(self, actions: Iterable[Action], until: Optional[int] = None) -> Trajectory:
+        """
+        Apply ``actions`` (in frame order) and tick up to frame ``until``
+        (default: the last action). Returns the positions of every frame,
+        from the current one.
+        """
+        start = self.frame
+        frames = [self.world.position.copy()]
+        for action in actions:
+            while action.frame is not None and self.frame < action.frame:
+                self.tick()
+                frames.append(self.world.position.copy())
+            self.apply(action)
+        while until is not None and self.frame < until:
+            self.tick()
+            frames.append(self.world.position.copy())
+        return self._trajectory(start, frames)
+
+    def _trajectory(self, start: int, frames) -> Trajectory:
+        slots = np.array(self.slots, dtype=np.intp)
+        positions = np.full((len(frames), len(slots), 2), np.nan, dtype=np.float32)
+        for row, position in enumerate(frames):
+            # Los slots crecen con la partida: en cada frame existen los primeros
+            present = slots[: np.searchsorted(slots, len(position))]
+            positions[row, : len(present)] = (
+                position[present].view(np.float64).reshape(-1, 2)
+            )
+        return Trajectory(start, positions, np.array(self.owners, dtype=np.int64))
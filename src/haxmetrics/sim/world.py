@@ -0,0 +1,709 @@
+# haxmetrics/sim/world.py
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("haxmetrics.sim requires numpy") from e
+
+from haxmetrics.models.stadium.compiled import CompiledStadium
+from haxmetrics.models.stadium.stadium import Stadium
+from haxmetrics.sim.grid import Grid
+
+# Iteraciones de joints por tick (Ta.A)
+JOINT_ITERATIONS = 2
+
+# Elementos de un tipo a partir de los cuales se usa la rejilla en vez de probar todos
+GRID_MIN_ELEMENTS = 96
+
+# Joints de un nivel a partir de los cuales se resuelven con NumPy y no uno a uno
+JOINT_VECTOR_MIN = 8
+
+
+def as_complex(points):
+    """(N, 2) float array as N complex numbers x + yj."""
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    return points[:, 0] + 1j * points[:, 1]
+
+
+def dot(u, v):
+    """Element-wise dot product of complex vectors."""
+    return u.real * v.real + u.imag * v.imag
+
+
+def length(u):
+    """Length of complex vectors as the JS takes it: sqrt(x² + y²), not np.abs."""
+    return np.sqrt(dot(u, u))
+
+
+def divide(u, s):
+    """Complex vectors over real numbers component by component, as the JS does."""
+    out = np.empty_like(u)
+    out.real, out.imag = u.real / s, u.imag / s
+    return out
+
+
+class World:
+    """
+    Discs and collision geometry of a running game, stepped with NumPy across
+    every disc at once (Ta.A in game-min.js).
+
+    Discs live in slots, one entry of each array per slot. Positions,
+    velocities and gravity are complex (x + yj), which keeps every vector
+    operation a single NumPy call; ``positions`` gives an (N, 2) float view.
+    Slots are never reused for a different owner: a removed disc keeps its
+    slot with NaN position and no collision masks.
+
+    ``geometry`` is the stadium compiled by Stadium.compile; only its
+    planes, segments and vertexes are used, discs and joints are added
+    by the caller. Element kinds with at least GRID_MIN_ELEMENTS entries
+    are looked up through a uniform Grid (built on the first step, and
+    again when a disc outgrows its margin) instead of testing every disc
+    against every element; disc pairs are pruned by masks and mass once
+    and re-pruned only when those change. Both give the same contacts in
+    the same order as the full scan.
+
+    Contacts are resolved in the JS order: every disc pair i < j in
+    lexicographic order (ra.wo), then, disc by disc, the planes, segments
+    and vertexes in stadium order, then JOINT_ITERATIONS passes over the
+    joints in order (ob.A). Walls only move their own disc and a disc has
+    no pairs left after its own turn, so the pairs can all go first and
+    the walls kind by kind across discs. Each kind is still resolved in
+    vectorized rounds of contacts that cannot see each other: pairs and
+    joints with no disc in common, and one element per disc. After a
+    step ``contacts`` holds the disc pairs that touched, in resolution
+    order: (first, second, velocity of each just before their contact,
+    velocity of each just after it), or None.
+    """
+
+    __slots__ = (
+        "geometry",
+        "position",
+        "velocity",
+        "gravity",
+        "radius",
+        "b_coef",
+        "inv_mass",
+        "damping",
+        "c_mask",
+        "c_group",
+        "batch",
+        "joint_a",
+        "joint_b",
+        "joint_min",
+        "joint_max",
+        "joint_stiffness",
+        "_joint_levels",
+        "_joint_params",
+        "_joint_key",
+        "_joint_mass",
+        "_motion",
+        "contacts",
+        "grid",
+        "_pairs",
+        "_pair_key",
+        "_cells",
+        "_plane_normal",
+        "_vertex_pos",
+        "_segment",
+    )
+
+    def __init__(self, geometry: Optional[CompiledStadium] = None):
+        self.geometry = geometry = (
+            geometry if geometry is not None else CompiledStadium()
+        )
+        # Posición y velocidad son las dos filas de _motion
+        # (una sola copia en add_disc y restore)
+        self._motion = np.zeros((2, 0), dtype=complex)
+        self.position, self.velocity = self._motion
+        self.gravity = np.zeros(0, dtype=complex)
+        self.radius = np.zeros(0)
+        self.b_coef = np.zeros(0)
+        self.inv_mass = np.zeros(0)
+        self.damping = np.zeros(0)
+        self.c_mask = np.zeros(0, dtype=np.int64)
+        self.c_group = np.zeros(0, dtype=np.int64)
+        self.batch = np.zeros(0, dtype=np.int64)
+
+        self.joint_a = np.zeros(0, dtype=np.intp)
+        self.joint_b = np.zeros(0, dtype=np.intp)
+        self.joint_min = np.zeros(0)
+        self.joint_max = np.zeros(0)
+        self.joint_stiffness = np.zeros(0)
+        # Índices por nivel: array (NumPy) o lista (uno a uno)
+        self._joint_levels: List[Any] = []
+        self._joint_params: List[Any] = []
+        self._joint_key = None
+        self._joint_mass = None
+
+        self.contacts: Optional[Tuple[np.ndarray, ...]] = None
+        self.grid: Optional[Grid] = None
+        self._pairs = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp))
+        self._pair_key = None
+        self._cells = None
+
+        # Copias complejas de la geometría
+        self._plane_normal = as_complex(geometry.plane_normal)
+        self._vertex_pos = as_complex(geometry.vertex_pos)
+        self._segment = {
+            name: as_complex(getattr(geometry, "segment_" + name))
+            for name in ("a", "b", "normal", "center", "t0", "t1", "bound_center")
+        }
+
+    @classmethod
+    def from_stadium(cls, stadium: Optional[Stadium]) -> "World":
+        """World with the stadium geometry and no discs."""
+        return cls(CompiledStadium.from_stadium(stadium))
+
+    def __len__(self) -> int:
+        return len(self.radius)
+
+    @property
+    def positions(self):
+        """(N, 2) float view of the positions."""
+        return self.position.view(np.float64).reshape(-1, 2)
+
+    @property
+    def velocities(self):
+        """(N, 2) float view of the velocities."""
+        return self.velocity.view(np.float64).reshape(-1, 2)
+
+    def add_disc(
+        self,
+        x: float = 0.0,
+        y: float = 0.0,
+        radius: float = 10.0,
+        b_coef: float = 0.5,
+        inv_mass: float = 1.0,
+        damping: float = 0.99,
+        c_mask: int = 63,
+        c_group: int = 63,
+        vx: float = 0.0,
+        vy: float = 0.0,
+        gravity=(0.0, 0.0),
+        batch: int = 0,
+    ) -> int:
+        """
+        Append a disc (defaults from ra in game-min.js) and return its slot.
+        Discs only collide with discs of the same ``batch``.
+        """
+        motion = np.empty((2, len(self.position) + 1), dtype=complex)
+        motion[:, :-1] = self._motion
+        motion[:, -1] = complex(x, y), complex(vx, vy)
+        self._motion = motion
+        self.position, self.velocity = motion
+        self.gravity = np.append(self.gravity, complex(*gravity))
+        self.radius = np.append(self.radius, radius)
+        self.b_coef = np.append(self.b_coef, b_coef)
+        self.inv_mass = np.append(self.inv_mass, inv_mass)
+        self.damping = np.append(self.damping, damping)
+        self.c_mask = np.append(self.c_mask, np.int64(c_mask))
+        self.c_group = np.append(self.c_group, np.int64(c_group))
+        self.batch = np.append(self.batch, np.int64(batch))
+        self._pair_key = None
+        return len(self.radius) - 1
+
+    def remove_disc(self, slot: int) -> None:
+        """Take a disc out of the game (its slot stays, with NaN position)."""
+        self.position[slot] = complex(np.nan, np.nan)
+        self.velocity[slot] = 0
+        self.c_mask[slot] = 0
+        self.c_group[slot] = 0
+
+    def add_joint(
+        self, a: int, b: int, min_distance: float, max_distance: float, stiffness: float
+    ) -> None:
+        self.joint_a = np.append(self.joint_a, a)
+        self.joint_b = np.append(self.joint_b, b)
+        self.joint_min = np.append(self.joint_min, min_distance)
+        self.joint_max = np.append(self.joint_max, max_distance)
+        self.joint_stiffness = np.append(self.joint_stiffness, stiffness)
+        self._schedule_joints()
+        self._joint_key = None
+
+    def snapshot(self):
+        """
+        Disc state as two arrays: (N, 10) float64 (x, y, vx, vy, gravity x/y,
+        radius, b_coef, inv_mass, damping) and (N, 3) int64 (c_mask, c_group,
+        batch). Geometry and joints are not included: they never change.
+        """
+        floats = np.column_stack(
+            (
+                self.positions,
+                self.velocities,
+                self.gravity.view(np.float64).reshape(-1, 2),
+                self.radius,
+                self.b_coef,
+                self.inv_mass,
+                self.damping,
+            )
+        )
+        return floats, np.column_stack((self.c_mask, self.c_group, self.batch))
+
+    def restore(self, floats, masks) -> None:
+        """Set the disc state from snapshot() arrays (copied, not shared)."""
+        vectors = np.empty((len(floats), 3), dtype=complex)
+        vectors.real, vectors.imag = floats[:, 0:6:2], floats[:, 1:6:2]
+        self._motion = np.ascontiguousarray(vectors.T[:2])
+        self.position, self.velocity = self._motion
+        self.gravity = np.ascontiguousarray(vectors[:, 2])
+        self.radius, self.b_coef, self.inv_mass, self.damping = (
+            np.ascontiguousarray(column) for column in floats[:, 6:].T
+        )
+        self.c_mask, self.c_group, self.batch = (
+            np.ascontiguousarray(column) for column in masks.T
+        )
+        self._pair_key = None
+        self._cells = None
+
+    def step(self, dt: float = 1.0, frozen=None) -> None:
+        """
+        Advance one tick: integrate, then resolve collisions and joints.
+        ``frozen`` slots (an index array) keep their position and velocity,
+        for games of a batch that are paused or over.
+        """
+        if frozen is not None and len(frozen):
+            saved = self.position[frozen], self.velocity[frozen]
+        else:
+            frozen = None
+        self.position += self.velocity * dt
+        velocity = self.velocity
+        velocity += self.gravity
+        velocity *= self.damping
+
+        self._collide_discs()
+        geometry = self.geometry
+        planes, segments, vertexes = (
+            len(geometry.plane_dist),
+            len(geometry.segment_b_coef),
+            len(geometry.vertex_b_coef),
+        )
+        plane_table = segment_table = vertex_table = None
+        if max(planes, segments, vertexes) >= GRID_MIN_ELEMENTS:
+            grid = self._update_grid()
+            plane_table = grid.planes if planes >= GRID_MIN_ELEMENTS else None
+            segment_table = grid.segments if segments >= GRID_MIN_ELEMENTS else None
+            vertex_table = grid.vertexes if vertexes >= GRID_MIN_ELEMENTS else None
+        self._cells = None
+        if planes:
+            self._collide_walls(
+                plane_table,
+                geometry.plane_c_mask,
+                geometry.plane_c_group,
+                geometry.plane_b_coef,
+                self._plane_contacts,
+            )
+        if segments:
+            self._collide_walls(
+                segment_table,
+                geometry.segment_c_mask,
+                geometry.segment_c_group,
+                geometry.segment_b_coef,
+                self._segment_contacts,
+            )
+        if vertexes:
+            self._collide_walls(
+                vertex_table,
+                geometry.vertex_c_mask,
+                geometry.vertex_c_group,
+                geometry.vertex_b_coef,
+                self._vertex_contacts,
+            )
+        if len(self.joint_a):
+            self._solve_levels()
+        if frozen is not None:
+            self.position[frozen], self.velocity[frozen] = saved
+
+    def _bounce(self, disc, normal, penetration, b_coef) -> None:
+        """Push discs (at most once each) out along ``normal``; reflect their speed."""
+        self.position[disc] += normal * penetration
+        self._cells = None
+        approach = dot(normal, self.velocity[disc])
+        hit = approach < 0
+        if hit.any():
+            disc, normal = disc[hit], normal[hit]
+            impulse = approach[hit] * (self.b_coef[disc] * b_coef[hit] + 1)
+            self.velocity[disc] -= normal * impulse
+
+    def _update_grid(self) -> Grid:
+        margin = float(self.radius.max()) if len(self.radius) else 0.0
+        if self.grid is None or margin > self.grid.margin:
+            self.grid = Grid(self.geometry, margin)
+        return self.grid
+
+    def _near(self, table):
+        """(disc, element) candidates from a grid table, at the current positions."""
+        if self._cells is None:
+            # Celdas de los centros; se recalculan cuando un choque mueve algún disco
+            position = self.position
+            idle = (self.c_group == 0) | (self.inv_mass == 0)
+            self._cells = self.grid.cells(position.real, position.imag, idle)
+        return self.grid.candidates(table, self._cells)
+
+    def _disc_pairs(self):
+        """Pairs i < j that can collide (batch, masks, mass), kept until they change."""
+        key = self.c_mask.tobytes() + self.c_group.tobytes() + self.inv_mass.tobytes()
+        if key != self._pair_key:
+            first, second = np.triu_indices(len(self.radius), 1)
+            c_mask, c_group, inv_mass = self.c_mask, self.c_group, self.inv_mass
+            keep = (
+                (self.batch[first] == self.batch[second])
+                & (inv_mass[first] + inv_mass[second] > 0)
+                & ((c_mask[second] & c_group[first]) != 0)
+                & ((c_group[second] & c_mask[first]) != 0)
+            )
+            self._pairs = first[keep], second[keep]
+            self._pair_key = key
+        return self._pairs
+
+    def _accepts(self, disc, c_mask, c_group):
+        """Mask test between discs and elements (index arrays of equal length)."""
+        return (
+            ((c_mask & self.c_group[disc]) != 0)
+            & ((c_group & self.c_mask[disc]) != 0)
+            & (self.inv_mass[disc] != 0)
+        )
+
+    def _overlap(self, first, second, position_first, position_second):
+        """Disc pairs that touch with their centres at the given positions."""
+        delta = position_first - position_second
+        square = dot(delta, delta)
+        reach = self.radius[first] + self.radius[second]
+        return (square > 0) & (square <= reach * reach)
+
+    def _collide_discs(self) -> None:
+        # ra.wo sobre los pares i < j en orden lexicográfico. Cada ronda
+        # resuelve a la vez el tramo más largo de pares en contacto sin discos
+        # en común, cortado antes del primer par intermedio que un choque
+        # anterior del tramo haya hecho tocarse.
+        self.contacts = None
+        first, second = self._disc_pairs()
+        if not len(first):
+            return
+        position, velocity = self.position, self.velocity
+        close = self._overlap(first, second, position[first], position[second])
+        contacts = []
+        cursor = 0
+        while True:
+            hits = np.flatnonzero(close[cursor:]) + cursor
+            if not len(hits):
+                break
+            ends = np.empty(2 * len(hits), dtype=np.intp)
+            ends[0::2], ends[1::2] = first[hits], second[hits]
+            repeated = np.ones(len(ends), dtype=bool)
+            repeated[np.unique(ends, return_index=True)[1]] = False
+            if repeated.any():
+                hits = hits[: np.argmax(repeated) // 2]
+            a, b = first[hits], second[hits]
+
+            if len(hits) > 1:
+                # Pares sin contacto entre los del tramo con un disco ya movido por él
+                when = np.full(len(self.radius), hits[-1])
+                when[a], when[b] = hits, hits
+                window = np.arange(hits[0] + 1, hits[-1])
+                pair_a, pair_b = first[window], second[window]
+                late = (when[pair_a] < window) | (when[pair_b] < window)
+                if late.any():
+                    window, pair_a, pair_b = window[late], pair_a[late], pair_b[late]
+                    after = position.copy()
+                    after[a], after[b] = self._disc_contacts(a, b)[:2]
+                    now = self._overlap(
+                        pair_a,
+                        pair_b,
+                        np.where(
+                            when[pair_a] < window, after[pair_a], position[pair_a]
+                        ),
+                        np.where(
+                            when[pair_b] < window, after[pair_b], position[pair_b]
+                        ),
+                    )
+                    if now.any():
+                        hits = hits[hits < window[np.argmax(now)]]
+                        a, b = first[hits], second[hits]
+
+            before = velocity[a], velocity[b]
+            position[a], position[b], velocity[a], velocity[b] = self._disc_contacts(
+                a, b
+            )
+            contacts.append((a, b, *before, velocity[a], velocity[b]))
+            # Siguiente ronda: los pares de un disco movido pueden haber cambiado
+            cursor = hits[-1] + 1
+            moved = np.zeros(len(self.radius), dtype=bool)
+            moved[a], moved[b] = True, True
+            later = (
+                np.flatnonzero(moved[first[cursor:]] | moved[second[cursor:]]) + cursor
+            )
+            close[later] = self._overlap(
+                first[later],
+                second[later],
+                position[first[later]],
+                position[second[later]],
+            )
+        if contacts:
+            self.contacts = tuple(np.concatenate(column) for column in zip(*contacts))
+
+    def _disc_contacts(self, a, b):
+        """New positions and velocities of disc pairs (a, b) with no disc in common."""
+        position, velocity = self.position, self.velocity
+        inv_mass = self.inv_mass
+        delta = position[a] - position[b]
+        dist = length(delta)
+        normal = divide(delta, dist)
+        ratio = inv_mass[a] / (inv_mass[a] + inv_mass[b])
+        penetration = self.radius[a] + self.radius[b] - dist
+        moved = penetration * ratio
+        velocity_a, velocity_b = velocity[a], velocity[b]
+        approach = dot(normal, velocity_a - velocity_b)
+        bounce = approach < 0
+        impulse = approach * (self.b_coef[a] * self.b_coef[b] + 1)
+        share = impulse * ratio
+        return (
+            position[a] + normal * moved,
+            position[b] - normal * (penetration - moved),
+            np.where(bounce, velocity_a - normal * share, velocity_a),
+            np.where(bounce, velocity_b + normal * (impulse - share), velocity_b),
+        )
+
+    def _collide_walls(self, table, c_mask, c_group, b_coef, contacts) -> None:
+        """
+        Contacts of one element kind, element by element for each disc as
+        in ra: a round resolves the first element each disc touches, and
+        the next one looks again at the elements after it. ``contacts``
+        maps (disc, element) candidates to the ones that touch, with their
+        normal and penetration.
+        """
+        count = len(b_coef)
+        start = np.zeros(len(self.radius), dtype=np.intp)
+        while True:
+            if table is not None:
+                disc, element = self._near(table)
+                keep = (element >= start[disc]) & self._accepts(
+                    disc, c_mask[element], c_group[element]
+                )
+                disc, element = disc[keep], element[keep]
+            else:
+                keep = self._accepts(
+                    np.arange(len(start))[:, None], c_mask[None, :], c_group[None, :]
+                )
+                keep &= np.arange(count)[None, :] >= start[:, None]
+                disc, element = np.nonzero(keep)
+            disc, element, normal, penetration = contacts(disc, element)
+            if not len(disc):
+                return
+            order = np.lexsort((element, disc))
+            disc = disc[order]
+            head = np.ones(len(disc), dtype=bool)
+            head[1:] = disc[1:] != disc[:-1]
+            order = order[head]
+            disc, element = disc[head], element[order]
+            self._bounce(disc, normal[order], penetration[order], b_coef[element])
+            start[:] = count
+            start[disc] = element + 1
+
+    def _plane_contacts(self, disc, plane):
+        normal = self._plane_normal[plane]
+        penetration = (
+            self.geometry.plane_dist[plane]
+            - dot(normal, self.position[disc])
+            + self.radius[disc]
+        )
+        touch = penetration > 0
+        return disc[touch], plane[touch], normal[touch], penetration[touch]
+
+    def _segment_contacts(self, disc, segment):
+        # ra.xo, descartando antes los discos lejos del círculo que envuelve el segmento
+        geometry, segments = self.geometry, self._segment
+        reach = geometry.segment_bound_radius[segment] + self.radius[disc]
+        close = np.abs(self.position[disc] - segments["bound_center"][segment]) <= reach
+        disc, segment = disc[close], segment[close]
+
+        position = self.position[disc]
+        curved = geometry.segment_curved[segment]
+        a, b = segments["a"][segment], segments["b"][segment]
+
+        # Rectos: proyección dentro del segmento y distancia con signo a la recta
+        direction = b - a
+        from_b = position - b
+        valid = (dot(position - a, direction) > 0) & (dot(from_b, direction) < 0)
+        normal = segments["normal"][segment]
+        gap = dot(normal, from_b)
+
+        if curved.any():
+            # Curvos: dentro del arco y distancia a la circunferencia
+            w = position - segments["center"][segment]
+            inside = (dot(segments["t0"][segment], w) > 0) & (
+                dot(segments["t1"][segment], w) > 0
+            )
+            size = length(w)
+            arc = (inside != (geometry.segment_cot[segment] <= 0)) & (size > 0)
+            valid = np.where(curved, arc, valid)
+            gap = np.where(curved, size - geometry.segment_radius[segment], gap)
+            normal = np.where(curved, divide(w, np.where(size > 0, size, 1.0)), normal)
+
+        # Sin bias se choca por ambos lados; con bias, solo por el lado de su
+        # signo y hasta |bias| por detrás de la recta
+        bias = geometry.segment_bias[segment]
+        flip = np.where(bias == 0, gap < 0, bias < 0)
+        gap = np.where(flip, -gap, gap)
+        normal = np.where(flip, -normal, normal)
+        radius = self.radius[disc]
+        touch = valid & ((bias == 0) | (gap >= -np.abs(bias))) & (gap < radius)
+        return disc[touch], segment[touch], normal[touch], radius[touch] - gap[touch]
+
+    def _vertex_contacts(self, disc, vertex):
+        w = self.position[disc] - self._vertex_pos[vertex]
+        square = dot(w, w)
+        radius = self.radius[disc]
+        touch = (square > 0) & (square <= radius * radius)
+        disc, w, dist = disc[touch], w[touch], np.sqrt(square[touch])
+        return disc, vertex[touch], divide(w, dist), radius[touch] - dist
+
+    def _joint_masses(self):
+        """
+        Inverse masses of the joint ends and the share of the correction
+        taken by a (0.5 between two fixed discs), as arrays and as lists
+        for the joints solved one at a time; kept until inv_mass changes.
+        """
+        key = self.inv_mass.tobytes()
+        if key != self._joint_key:
+            mass_a, mass_b = self.inv_mass[self.joint_a], self.inv_mass[self.joint_b]
+            mass = mass_a + mass_b
+            ratio = np.divide(
+                mass_a, mass, out=np.full(len(mass), 0.5), where=mass != 0
+            )
+            self._joint_mass = (mass_a, mass_b, ratio), list(
+                zip(mass_a.tolist(), mass_b.tolist(), ratio.tolist())
+            )
+            self._joint_key = key
+        return self._joint_mass
+
+    def _schedule_joints(self) -> None:
+        """
+        Levels of the JOINT_ITERATIONS passes over the joints (ob.A in
+        order): a joint goes one level after the last one sharing a disc
+        with it, so the joints of a level are disjoint and solving the
+        levels in turn gives the sequential result.
+        """
+        last: Dict[int, int] = {}
+        levels: List[List[int]] = []
+        ends = list(zip(self.joint_a.tolist(), self.joint_b.tolist()))
+        for _ in range(JOINT_ITERATIONS):
+            for joint, (a, b) in enumerate(ends):
+                level = max(last.get(a, -1), last.get(b, -1)) + 1
+                last[a] = last[b] = level
+                if level == len(levels):
+                    levels.append([])
+                levels[level].append(joint)
+        self._joint_levels = [
+            np.array(level, dtype=np.intp) if len(level) >= JOINT_VECTOR_MIN else level
+            for level in levels
+        ]
+        self._joint_params = list(
+            zip(
+                *(
+                    column.tolist()
+                    for column in (
+                        self.joint_a,
+                        self.joint_b,
+                        self.joint_min,
+                        self.joint_max,
+                        self.joint_stiffness,
+                    )
+                )
+            )
+        )
+
+    def _solve_levels(self) -> None:
+        # Los niveles pequeños van uno a uno sobre listas de Python, que se
+        # vuelcan a los arrays antes de un nivel con NumPy y al terminar
+        arrays, lists = self._joint_masses()
+        state = None
+        for level in self._joint_levels:
+            if isinstance(level, list):
+                if state is None:
+                    state = self.position.tolist(), self.velocity.tolist()
+                for joint in level:
+                    self._solve_joint(joint, lists, *state)
+            else:
+                if state is not None:
+                    self.position[:], self.velocity[:] = state
+                    state = None
+                self._solve_joints(level, arrays)
+        if state is not None:
+            self.position[:], self.velocity[:] = state
+
+    def _solve_joint(self, joint: int, masses, position, velocity) -> None:
+        # ob.A: distancia entre [min, max]; rígido si stiffness es infinita
+        a, b, low, high, stiffness = self._joint_params[joint]
+        delta = position[a] - position[b]
+        dist = math.sqrt(delta.real * delta.real + delta.imag * delta.imag)
+        if not dist > 0:
+            return
+        if low >= high:
+            target, side = low, 0.0
+        elif dist <= low:
+            target, side = low, 1.0
+        elif dist >= high:
+            target, side = high, -1.0
+        else:
+            return
+        stretch = target - dist
+        normal = complex(delta.real / dist, delta.imag / dist)
+        mass_a, mass_b, ratio = masses[joint]
+        if math.isfinite(stiffness):
+            force = normal * (stiffness * stretch * 0.5)
+            velocity[a] += force * mass_a
+            velocity[b] -= force * mass_b
+            return
+        moved = stretch * ratio
+        position[a] += normal * (moved * 0.5)
+        position[b] -= normal * ((stretch - moved) * 0.5)
+        velocity_a, velocity_b = velocity[a], velocity[b]
+        relative = velocity_a - velocity_b
+        approach = normal.real * relative.real + normal.imag * relative.imag
+        if approach * side <= 0:
+            share = approach * ratio
+            velocity[a] = velocity_a - normal * share
+            velocity[b] = velocity_b + normal * (approach - share)
+
+    def _solve_joints(self, joints, masses) -> None:
+        # ob.A para un nivel de joints sin discos en común, a la vez
+        mass_a, mass_b, ratio = masses
+        a, b = self.joint_a[joints], self.joint_b[joints]
+        position, velocity = self.position, self.velocity
+        delta = position[a] - position[b]
+        dist = length(delta)
+        low, high = self.joint_min[joints], self.joint_max[joints]
+        fixed = low >= high
+        active = (dist > 0) & (fixed | (dist <= low) | (dist >= high))
+        if not active.all():
+            joints, a, b, delta, dist, low, high, fixed = (
+                x[active] for x in (joints, a, b, delta, dist, low, high, fixed)
+            )
+        # Lado del límite: 1 en el mínimo, -1 en el máximo, 0 si la longitud es fija
+        side = np.where(fixed, 0.0, np.where(dist <= low, 1.0, -1.0))
+        stretch = np.where(side < 0, high, low) - dist
+        normal = divide(delta, dist)
+        mass_a, mass_b, ratio = mass_a[joints], mass_b[joints], ratio[joints]
+        stiffness = self.joint_stiffness[joints]
+        spring = np.isfinite(stiffness)
+        if spring.any():
+            force = normal[spring] * (stiffness[spring] * stretch[spring] * 0.5)
+            velocity[a[spring]] += force * mass_a[spring]
+            velocity[b[spring]] -= force * mass_b[spring]
+            rigid = ~spring
+            a, b, side, stretch, normal, ratio = (
+                x[rigid] for x in (a, b, side, stretch, normal, ratio)
+            )
+        moved = stretch * ratio
+        position[a] += normal * (moved * 0.5)
+        position[b] -= normal * ((stretch - moved) * 0.5)
+        approach = dot(normal, velocity[a] - velocity[b])
+        fix = approach * side <= 0
+        share = approach * ratio
+        velocity[a] = np.where(fix, velocity[a] - normal * share, velocity[a])
+        velocity[b] = np.where(
+            fix, velocity[b] + normal * (approach - share), velocity[b]
+        )
@@ -0,0 +1,88 @@
+"""
+Tests for the inline PlayerInput fast path of Parser.iter_actions.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import zlib
+
+from benchmarks.synthetic import build_replay, deflate_raw
+from haxmetrics.action_table import ActionTable
+from haxmetrics.instrumentation import ParseStats
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.parser import Parser
+
+
+def fields(action):
+    names = [
+        n for klass in type(action).__mro__ for n in getattr(klass, "__slots__", ())
+    ]
+    return tuple(getattr(action, n, None) for n in names)
+
+
+def rows(actions):
+    return [fields(a) for a in actions]
+
+
+def truncate(data, cut):
+    """Same replay with the last ``cut`` decompressed bytes removed."""
+    body = zlib.decompress(data[12:], wbits=-15)
+    return data[:12] + deflate_raw(body[:-cut])
+
+
+def test_inline_matches_generic():
+    """Whole-buffer (inline) and streaming (generic) decoding agree."""
+    data = build_replay(3000)
+    inline = Parser(data).parse()["actions"]
+    generic = Parser(data).parse(streaming=True)["actions"]
+
+    assert rows(inline) == rows(generic)
+    assert sum(type(a) is PlayerInput for a in inline) > len(inline) // 2
+    first = next(a for a in inline if type(a) is PlayerInput)
+    assert first.json_serialize()["info"] == {"input": first.input}
+    assert first.json_serialize() == generic[inline.index(first)].json_serialize()
+    print("✓ Inline vs generic test passed")
+
+
+def test_truncated_actions():
+    """A replay cut mid-action stops at the same action on both paths."""
+    data = build_replay(50)
+    full = len(Parser(data).parse()["actions"])
+    for cut in range(1, 12):
+        truncated = truncate(data, cut)
+        inline = Parser(truncated).parse()["actions"]
+        generic = Parser(truncated).parse(streaming=True)["actions"]
+        assert rows(inline) == rows(generic)
+        assert len(inline) < full
+    print("✓ Truncated actions test passed")
+
+
+def test_columnar_rows():
+    """Columnar parse appends PlayerInput rows without objects, same table."""
+    data = build_replay(2000)
+    direct = Parser(data).parse(columnar=True)["actions"]
+    from_objects = ActionTable.from_actions(Parser(data).parse()["actions"])
+    with_stats = Parser(data, stats=ParseStats()).parse(columnar=True)["actions"]
+
+    for table in (from_objects, with_stats):
+        assert direct.frames == table.frames
+        assert direct.senders == table.senders
+        assert direct.types == table.types
+        assert direct.payload == table.payload
+        assert direct.inputs == table.inputs
+    assert rows(direct) == rows(from_objects)
+    print("✓ Columnar rows test passed")
+
+
+if __name__ == "__main__":
+    print("Running action fast path tests...")
+    print()
+
+    test_inline_matches_generic()
+    test_truncated_actions()
+    test_columnar_rows()
+
+    print()
+    print("All action fast path tests passed! ✓")
@@ -0,0 +1,144 @@
+"""
+Tests for action type filtering (parse(types=...)) and the skip routines.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+from benchmarks.synthetic import ReplayWriter, build_replay, deflate_raw
+from haxmetrics.binary_reader import BinaryReader
+from haxmetrics.models.action_types import ACTION_TYPES
+from haxmetrics.models.actions.chat_message import ChatMessage
+from haxmetrics.parser import Parser
+
+
+def payloads():
+    """One payload per action class in ACTION_TYPES."""
+    w = ReplayWriter
+    stadium = deflate_raw(b"stadium" * 50)
+    return {
+        "Message": w()
+        .write_string("hola")
+        .write_int32(0xFF0000)
+        .write_byte(1)
+        .write_byte(0),
+        "ToggleChat": w().write_byte(1),
+        "ChangeStadium": w().write_varint(len(stadium)).write_bytes(stadium),
+        "PlayerInput": w().write_uint32(0x10),
+        "ChatMessage": w().write_string("gg"),
+        "PlayerJoined": w()
+        .write_int32(7)
+        .write_nullable_string("pepe")
+        .write_nullable_string(None)
+        .write_nullable_string("ab"),
+        "PlayerLeft": w().write_int32(7).write_nullable_string("bye").write_byte(1),
+        "MatchStart": w(),
+        "MatchStopped": w(),
+        "ChangePaused": w().write_byte(1),
+        "ChangeGameSetting": w().write_int32(1).write_int32(3),
+        "StadiumUpdate": w().write_varint(len(stadium)).write_bytes(stadium),
+        "PlayerTeamChange": w().write_int32(7).write_byte(2),
+        "ChangeTeamsLock": w().write_byte(1),
+        "PlayerAdminChange": w().write_int32(7).write_byte(1),
+        "AutoTeamBalance": w(),
+        "Desynced": w().write_byte(0),
+        "BroadcastPings": w()
+        .write_varint(3)
+        .write_varint(20)
+        .write_varint(300)
+        .write_varint(5),
+        "AvatarChange": w().write_nullable_string("xd"),
+        "TeamColorsChange": w()
+        .write_byte(1)
+        .write_uint32_be(60)
+        .write_uint32_be(0xFFFFFF)
+        .write_byte(3)
+        .write_uint32_be(1)
+        .write_uint32_be(2)
+        .write_uint32_be(3),
+        "PlayerOrderChange": w()
+        .write_byte(1)
+        .write_byte(2)
+        .write_int32(1)
+        .write_int32(2),
+        "KickRateLimit": w().write_int32(2).write_int32(0).write_int32(0),
+        "PlayerAvatarSet": w().write_nullable_string("9").write_int32(7),
+        "DiscUpdate": w()
+        .write_int32(3)
+        .write_byte(1)
+        .write_uint16(0b1010000000101)
+        .write_float_le(1.0)
+        .write_float_le(2.0)
+        .write_float_le(3.0)
+        .write_int32(4),
+    }
+
+
+def test_skip_matches_parse():
+    """Every skip routine consumes exactly the bytes parse() consumes."""
+    data = payloads()
+    assert set(data) == {cls.__name__ for cls in ACTION_TYPES}
+    for cls in ACTION_TYPES:
+        raw = bytes(data[cls.__name__].data) + b"\xAA"
+        parsed = BinaryReader(raw)
+        cls.parse(parsed)
+        skipped = BinaryReader(raw)
+        cls.skip(skipped)
+        assert skipped.position == parsed.position == len(raw) - 1, cls.__name__
+    print("✓ Skip matches parse test passed")
+
+
+def test_skip_truncated():
+    """Skipping past the end raises like parsing does."""
+    reader = BinaryReader(bytes(ReplayWriter().write_string("truncated").data)[:-2])
+    try:
+        ChatMessage.skip(reader)
+    except EOFError:
+        pass
+    else:
+        raise AssertionError("expected EOFError")
+    print("✓ Skip truncated test passed")
+
+
+def test_types_filter():
+    """Only the requested actions are kept, on every parse path."""
+    data = build_replay(3000)
+    full = Parser(data).parse()["actions"]
+    expected = [(a.frame, a.sender, a.message) for a in full if type(a) is ChatMessage]
+    assert expected
+
+    for options in ({}, {"streaming": True}, {"columnar": True}):
+        for types in ({"ChatMessage"}, [ChatMessage], "ChatMessage"):
+            actions = Parser(data).parse(types=types, **options)["actions"]
+            assert [(a.frame, a.sender, a.message) for a in actions] == expected
+
+    kept = Parser(data).parse(types={"PlayerInput", "BroadcastPings"})["actions"]
+    assert [(a.frame, a.type) for a in kept] == [
+        (a.frame, a.type) for a in full if a.type in ("PlayerInput", "BroadcastPings")
+    ]
+    print("✓ Types filter test passed")
+
+
+def test_unknown_type():
+    """Unknown names are rejected before parsing."""
+    try:
+        Parser(build_replay(10)).parse(types={"Chat"})
+    except ValueError as e:
+        assert "Chat" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
+    print("✓ Unknown type test passed")
+
+
+if __name__ == "__main__":
+    print("Running action filter tests...")
+    print()
+
+    test_skip_matches_parse()
+    test_skip_truncated()
+    test_types_filter()
+    test_unknown_type()
+
+    print()
+    print("All action filter tests passed! ✓")
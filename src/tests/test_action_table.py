@@ -0,0 +1,93 @@
+"""
+Tests for the columnar action store.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+from haxmetrics.action_table import ActionTable
+from haxmetrics.models.actions.chat_message import ChatMessage
+from haxmetrics.models.actions.disc_update import DiscUpdate
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.parser import Parser
+
+
+def make_actions():
+    actions = []
+    for frame in range(20):
+        action = PlayerInput()
+        action.input = frame % 32
+        actions.append(action.set_frame(frame).set_sender(frame % 3))
+
+    update = DiscUpdate()
+    update.disc_id = 4
+    update.is_player_disc = True
+    update.ma = [1.5, None, None, None, None, None, 10.0, None, None, None]
+    update.yc = [None, None, 7]
+    actions.append(update.set_frame(25).set_sender(0))
+
+    chat = ChatMessage()
+    chat.message = "gg"
+    actions.append(chat.set_frame(30).set_sender(1))
+    return actions
+
+
+def test_roundtrip():
+    """Rows rebuild the same actions they were stored from."""
+    actions = make_actions()
+    table = ActionTable.from_actions(actions)
+
+    assert len(table) == len(actions)
+    for original, rebuilt in zip(actions, table):
+        assert type(rebuilt) is type(original)
+        assert (rebuilt.frame, rebuilt.sender) == (original.frame, original.sender)
+        if isinstance(original, DiscUpdate):
+            assert (rebuilt.ma, rebuilt.yc) == (original.ma, original.yc)
+        else:
+            assert rebuilt.get_data() == original.get_data()
+    assert table[-1].message == "gg"
+    assert len(table[0:5]) == 5
+    print("✓ ActionTable roundtrip test passed")
+
+
+def test_vectorized_select():
+    """Inputs of one sender are selected without building objects."""
+    table = ActionTable.from_actions(make_actions())
+
+    frames, inputs = table.inputs_of(1)
+    assert list(frames) == [f for f in range(20) if f % 3 == 1]
+    assert list(inputs) == [f % 32 for f in range(20) if f % 3 == 1]
+    assert list(table.select(DiscUpdate)) == [20]
+    columns = table.to_numpy()
+    assert columns["disc_floats"].shape == (1, 10)
+    # Las columnas son copias: la tabla puede crecer con ellas vivas
+    table.append(make_actions()[0])
+    assert len(columns["frames"]) == len(table) - 1
+    print("✓ ActionTable select test passed")
+
+
+def test_columnar_parse():
+    """parse(columnar=True) keeps the same actions as the list result."""
+    with open("src/replays/LIRS/Albania-Poland1.hbr2", "rb") as f:
+        data = f.read()
+
+    listed = Parser(data).parse()["actions"]
+    table = Parser(data).parse(columnar=True)["actions"]
+    assert isinstance(table, ActionTable)
+    assert [(a.type, a.frame, a.sender) for a in table] == [
+        (a.type, a.frame, a.sender) for a in listed
+    ]
+    print("✓ Columnar parse test passed")
+
+
+if __name__ == "__main__":
+    print("Running ActionTable tests...")
+    print()
+
+    test_roundtrip()
+    test_vectorized_select()
+    test_columnar_parse()
+
+    print()
+    print("All ActionTable tests passed! ✓")
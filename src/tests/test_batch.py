@@ -0,0 +1,81 @@
+"""
+Tests for the parse_many batch API.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import os
+import tempfile
+
+from benchmarks.synthetic import build_replay
+from haxmetrics import batch, parse_many
+from haxmetrics.parser import Parser
+
+
+def count_inputs(replay):
+    """Reduce function: runs in the worker, only an int goes back."""
+    return sum(1 for a in replay["actions"] if a.type == "PlayerInput")
+
+
+def write_replays(directory, count):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"replay{i}.hbr2")
+        with open(path, "wb") as f:
+            f.write(build_replay(300 + i, seed=i))
+        paths.append(path)
+    with open(os.path.join(directory, "broken.hbr2"), "wb") as f:
+        f.write(b"HBR2" + bytes(8) + b"not deflate")
+    return paths
+
+
+def test_parse_many_directory():
+    """A directory is expanded; results keep input order, errors are reported."""
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_replays(directory, 5)
+        result = parse_many(directory, jobs=2, stats=True)
+
+        assert [path for path, _ in result.results] == sorted(paths)
+        assert len(result.errors) == 1 and result.errors[0][0].endswith("broken.hbr2")
+        summary = dict(result.results)[paths[0]]
+        assert summary["actions"] == 300
+        assert summary["players"][0][1] == "alpha"
+        assert result.stats.replays == 6
+        assert result.bytes_read == sum(
+            os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory)
+        )
+        assert result.replays_per_second > 0
+    print("✓ parse_many directory test passed")
+
+
+def test_parse_many_reduce():
+    """A custom reduce gives the same values with one or several workers."""
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_replays(directory, 4)
+        serial = parse_many(paths, jobs=1, reduce=count_inputs)
+        parallel = parse_many(paths, jobs=3, reduce=count_inputs, chunksize=1)
+
+        assert serial.results == parallel.results
+        assert all(isinstance(value, int) and value > 0 for _, value in serial)
+
+        # jobs=1 no deja estado de worker en el módulo
+        assert batch._worker_context is None
+        # summarize cuenta las filas de la tabla igual que los objetos de la lista
+        summaries = parse_many(paths, jobs=1)
+        for path, summary in summaries:
+            with open(path, "rb") as f:
+                assert summary == batch.summarize(Parser(f.read()).parse())
+    print("✓ parse_many reduce test passed")
+
+
+if __name__ == "__main__":
+    print("Running batch tests...")
+    print()
+
+    test_parse_many_directory()
+    test_parse_many_reduce()
+
+    print()
+    print("All batch tests passed! ✓")
@@ -0,0 +1,75 @@
+"""
+Tests for BinaryReader primitives.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import struct
+
+from haxmetrics.binary_reader import BinaryReader
+
+
+def test_endianness():
+    """Little-endian by default, big-endian on demand."""
+    data = struct.pack("<HiI", 0x1234, -5, 7) + struct.pack(">HI", 0x1234, 7)
+    reader = BinaryReader(data)
+    assert reader.read_uint16() == 0x1234
+    assert reader.read_int32() == -5
+    assert reader.read_uint32() == 7
+    assert reader.read_uint16_be() == 0x1234
+    assert reader.read_uint32_be() == 7
+    assert reader.eof()
+
+    reader = BinaryReader(struct.pack(">H", 0x1234))
+    reader.little_endian = False
+    assert reader.read_uint16() == 0x1234
+    print("✓ Endianness test passed")
+
+
+def test_bulk_doubles():
+    """read_position and read_doubles_be decode several doubles at once."""
+    data = struct.pack("<dd", 1.5, -2.5) + struct.pack(">3d", 1.0, 2.0, 3.0)
+    reader = BinaryReader(data)
+    assert reader.read_position() == (1.5, -2.5)
+    assert reader.read_doubles_be(3) == (1.0, 2.0, 3.0)
+    print("✓ Bulk doubles test passed")
+
+
+def test_strings_and_bytes():
+    """Strings fall back to latin-1; bytes are returned as bytes."""
+    data = bytes([4]) + b"abc" + bytes([3]) + b"\xe9\xff" + bytes([0]) + b"\x01\x02"
+    reader = BinaryReader(data)
+    assert reader.read_string() == "abc"
+    assert reader.read_string() == "\xe9\xff"
+    assert reader.read_string() is None
+    raw = reader.read_bytes(2)
+    assert raw == b"\x01\x02" and isinstance(raw, bytes)
+    print("✓ Strings and bytes test passed")
+
+
+def test_eof():
+    """Reading past the end raises EOFError without moving the position."""
+    reader = BinaryReader(b"\x01\x02\x03")
+    reader.read_byte()
+    try:
+        reader.read_uint32()
+        assert False, "EOFError expected"
+    except EOFError:
+        pass
+    assert reader.get_position() == 1
+    print("✓ EOF test passed")
+
+
+if __name__ == "__main__":
+    print("Running BinaryReader tests...")
+    print()
+
+    test_endianness()
+    test_bulk_doubles()
+    test_strings_and_bytes()
+    test_eof()
+
+    print()
+    print("All BinaryReader tests passed! ✓")
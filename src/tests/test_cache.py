@@ -0,0 +1,147 @@
+"""
+Tests for the on-disk parse cache.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic import build_replay
+from haxmetrics import cache as cache_module
+from haxmetrics.action_table import ActionTable
+from haxmetrics.cache import ParseCache, decoder_fingerprint
+from haxmetrics.parser import Parser
+
+
+def write_replay(directory, name, data):
+    path = Path(directory) / name
+    path.write_bytes(data)
+    return path
+
+
+def test_from_path_hit():
+    """A second parse of the same bytes is served from the cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_replay(tmp, "a.hbr2", build_replay(1000))
+        cache = ParseCache(Path(tmp) / "cache")
+
+        first = Parser.from_path(path, cache=cache).parse()
+        assert (cache.hits, cache.misses) == (0, 1)
+        second = Parser.from_path(path, cache=cache).parse()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        assert second is not first
+        assert second["duration"] == first["duration"]
+        assert len(second["actions"]) == len(first["actions"])
+        assert [p.name for p in second["players"]] == [p.name for p in first["players"]]
+        assert second["room_info"].stadium.name == first["room_info"].stadium.name
+        for a, b in zip(first["actions"], second["actions"]):
+            assert (a.type, a.frame, a.sender) == (b.type, b.frame, b.sender)
+
+        # El directorio también sirve como caché
+        Parser.from_path(path, cache=Path(tmp) / "cache").parse()
+    print("✓ Cache hit test passed")
+
+
+def test_options_in_key():
+    """Columnar and list results are cached separately."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_replay(tmp, "a.hbr2", build_replay(300))
+        cache = ParseCache(Path(tmp) / "cache")
+
+        listed = Parser.from_path(path, cache=cache).parse()
+        table = Parser.from_path(path, cache=cache).parse(columnar=True)
+        assert cache.misses == 2
+        assert isinstance(table["actions"], ActionTable)
+        assert isinstance(listed["actions"], list)
+
+        cached = Parser.from_path(path, cache=cache).parse(columnar=True)
+        assert cache.hits == 1
+        assert isinstance(cached["actions"], ActionTable)
+        assert len(cached["actions"]) == len(listed["actions"])
+    print("✓ Options in key test passed")
+
+
+def test_lru_eviction():
+    """Past max_bytes the least recently used entries are removed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(tmp, max_bytes=2500)
+        blob = b"x" * 1000
+        # El directorio solo se recorre para desalojar, no en cada put
+        scans = []
+        evict = cache.evict
+        cache.evict = lambda: (scans.append(1), evict())
+        for i, key in enumerate("abc"):
+            cache.put(key, blob)
+            # mtime explícito: no depender de la resolución del reloj
+            os.utime(cache.path(key), (i, i))
+            if key == "b":
+                assert cache.get("a") == blob  # "a" pasa a ser la más reciente
+                os.utime(cache.path("a"), (10, 10))
+
+        assert cache.path("a").exists()
+        assert not cache.path("b").exists()
+        assert cache.path("c").exists()
+        assert cache.size() <= 2500
+        assert len(scans) == 1
+
+        # Reescribir una entrada no cuenta sus bytes dos veces
+        cache.put("c", blob)
+        assert len(scans) == 1 and cache._total == cache.size()
+    print("✓ LRU eviction test passed")
+
+
+def test_corrupt_entry():
+    """An unreadable entry is a miss and gets removed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(tmp)
+        cache.path("bad").write_bytes(b"not a pickle")
+        assert cache.get("bad") is None
+        assert not cache.path("bad").exists()
+    print("✓ Corrupt entry test passed")
+
+
+def test_fingerprint_tracks_decoders():
+    """Editing models/action_types.py changes every cache key."""
+    data = build_replay(10)
+    cache = ParseCache(tempfile.mkdtemp())
+    before = cache.key(data)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        package = Path(tmp) / "haxmetrics"
+        shutil.copytree(cache_module.PACKAGE_DIR, package)
+        with open(package / "models" / "action_types.py", "a") as f:
+            f.write("\n# decoder change\n")
+
+        original = cache_module.PACKAGE_DIR
+        try:
+            cache_module.PACKAGE_DIR = package
+            decoder_fingerprint.cache_clear()
+            after = cache.key(data)
+        finally:
+            cache_module.PACKAGE_DIR = original
+            decoder_fingerprint.cache_clear()
+
+    assert after != before
+    assert cache.key(data) == before
+    shutil.rmtree(cache.directory)
+    print("✓ Fingerprint test passed")
+
+
+if __name__ == "__main__":
+    print("Running cache tests...")
+    print()
+
+    test_from_path_hit()
+    test_options_in_key()
+    test_lru_eviction()
+    test_corrupt_entry()
+    test_fingerprint_tracks_decoders()
+
+    print()
+    print("All cache tests passed! ✓")
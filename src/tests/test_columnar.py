@@ -0,0 +1,140 @@
+"""
+Tests for the columnar (.npz / Arrow / Parquet) exporter.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import glob
+import json
+import math
+import os
+import tempfile
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.io.columnar import _pyarrow, export_columns, read_tables, replay_tables
+from haxmetrics.models.action_types import ACTION_TYPES
+from haxmetrics.models.stadium.stadium import Stadium
+from haxmetrics.parser import Parser
+
+
+def test_actions_roundtrip():
+    """Action rows and payload tables rebuild every action."""
+    data = build_replay(3000)
+    replay = Parser(data).parse()
+    with tempfile.TemporaryDirectory() as tmp:
+        tables = read_tables(export_columns(data, os.path.join(tmp, "replay.npz")))
+
+    rows = tables["actions"]
+    names = dict(
+        zip(
+            tables["action_types"]["id"].tolist(),
+            tables["action_types"]["name"].tolist(),
+        )
+    )
+    assert len(rows["frames"]) == len(replay["actions"])
+    for row, action in enumerate(replay["actions"]):
+        assert (rows["frames"][row], rows["senders"][row]) == (
+            action.frame,
+            action.sender,
+        )
+        assert names[rows["types"][row]] == type(action).__name__
+        index = rows["payload"][row]
+        if action.type == "PlayerInput":
+            assert tables["inputs"]["input"][index] == action.input
+        elif action.type == "DiscUpdate":
+            assert tables["disc_updates"]["mask"][index] == action.flags
+            for name, value in zip(("x", "y"), action.ma):
+                column = tables["disc_updates"][name][index]
+                assert math.isnan(column) if value is None else column == value
+        else:
+            assert tables["events"]["type"][index] == action.type
+            assert json.loads(tables["events"]["data"][index]) == json.loads(
+                json.dumps(action.get_data())
+            )
+    print("✓ Actions roundtrip test passed")
+
+
+def test_state_tables():
+    """Header, players and stadium geometry columns."""
+    replay = Parser(build_replay(100)).parse()
+    tables = replay_tables(replay)
+    stadium = replay["room_info"].stadium
+
+    assert tables["replay"]["duration"][0] == replay["duration"]
+    assert tables["players"]["name"].tolist() == [p.name for p in replay["players"]]
+    assert tables["vertexes"]["x"].tolist() == [v.x for v in stadium.vertexes]
+    assert tables["segments"]["v1"].tolist() == [int(s.v1) for s in stadium.segments]
+    assert tables["discs"]["c_mask"].tolist() == [
+        Stadium.mask_value(d.c_mask) for d in stadium.discs
+    ]
+    assert len(tables["action_types"]["name"]) == len(ACTION_TYPES)
+    assert Stadium.mask_value(Stadium.parse_mask(1 | 4 | 32)) == 37
+    assert Stadium.mask_value(["all"]) == 63
+
+    # Campos ausentes: texto vacío y disco -1, no "None"
+    player = replay["players"][0]
+    player.avatar = player.country = player.disc_id = None
+    players = replay_tables(replay)["players"]
+    assert players["avatar"][0] == "" and players["country"][0] == ""
+    assert players["disc_id"][0] == -1
+    print("✓ State tables test passed")
+
+
+def test_formats():
+    """npz archives round-trip without pickle; Arrow needs pyarrow."""
+    replay = Parser(build_replay(500)).parse(columnar=True)
+    expected = replay_tables(replay)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_columns(replay, os.path.join(tmp, "out"), "npz", compress=True)
+        assert path.endswith(".npz")
+        loaded = read_tables(path)
+        if _pyarrow(required=False) is not None:
+            for format in ("arrow", "parquet"):
+                tables = read_tables(
+                    export_columns(replay, os.path.join(tmp, format), format)
+                )
+                assert (
+                    tables["inputs"]["input"].tolist()
+                    == expected["inputs"]["input"].tolist()
+                )
+        else:
+            try:
+                export_columns(replay, os.path.join(tmp, "arrow"), "arrow")
+            except ImportError:
+                pass
+            else:
+                raise AssertionError("expected ImportError")
+
+    assert loaded.keys() == expected.keys()
+    for table, columns in expected.items():
+        for column, values in columns.items():
+            assert loaded[table][column].dtype == values.dtype, (table, column)
+            assert loaded[table][column].tobytes() == values.tobytes(), (table, column)
+    print("✓ Formats test passed")
+
+
+def test_real_replays():
+    """Real replays export their header and room."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in sorted(glob.glob("src/replays/LIRS/*.hbr2"))[:2]:
+            tables = read_tables(export_columns(path, os.path.join(tmp, "r.npz")))
+            assert (
+                tables["replay"]["stadium"][0]
+                == Parser.from_path(path).parse()["room_info"].stadium.name
+            )
+    print("✓ Real replays test passed")
+
+
+if __name__ == "__main__":
+    print("Running columnar exporter tests...")
+    print()
+
+    test_actions_roundtrip()
+    test_state_tables()
+    test_formats()
+    test_real_replays()
+
+    print()
+    print("All columnar exporter tests passed! ✓")
@@ -0,0 +1,128 @@
+"""
+Tests for the fixed-width DiscUpdate record.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import random
+import zlib
+
+from benchmarks.synthetic import ReplayWriter
+from haxmetrics.action_table import ActionTable
+from haxmetrics.binary_reader import BinaryReader, InflateReader
+from haxmetrics.models.actions.disc_update import DiscUpdate
+
+
+def write_update(rng, flags):
+    """Payload for ``flags`` and the 13 nullable fields it carries."""
+    w = (
+        ReplayWriter()
+        .write_int32(rng.randrange(-5, 50))
+        .write_byte(rng.randrange(2))
+        .write_uint16(flags)
+    )
+    fields = []
+    for i in range(13):
+        if not flags & (1 << i):
+            fields.append(None)
+        elif i < 10:
+            w.write_float_le(0.25 * rng.randrange(-4000, 4000))
+            fields.append(BinaryReader(w.data[-4:]).read_float_le())
+        else:
+            w.write_int32(rng.randrange(-(2**31), 2**31))
+            fields.append(BinaryReader(w.data[-4:]).read_int32())
+    return bytes(w.data), fields
+
+
+def test_record_matches_fields():
+    """One-unpack records hold the same fields as the bit-by-bit layout."""
+    rng = random.Random(7)
+    for flags in [0, 0x1FFF, 0b11, 1 << 12] + [
+        rng.randrange(1 << 16) for _ in range(300)
+    ]:
+        payload, fields = write_update(rng, flags)
+        reader = BinaryReader(payload + b"\x00")
+        update = DiscUpdate.parse(reader)
+
+        assert reader.position == len(payload)
+        assert update.flags == flags
+        # Se guardan los bytes del replay tal cual y se decodifican al leer
+        assert update.record == payload[7:]
+        assert update.fields() == fields
+        assert update.ma == tuple(fields[:10]) and update.yc == tuple(fields[10:])
+        assert update.get_data()["ma"] == fields[:10]
+    print("✓ Record vs fields test passed")
+
+
+def test_streaming_and_truncated():
+    """Works on the streaming reader; truncated records raise EOFError."""
+    payload, fields = write_update(random.Random(1), 0b1000000000111)
+    reader = InflateReader(zlib.compress(payload)[2:-4], chunk_size=3)
+    assert DiscUpdate.parse(reader).fields() == fields
+
+    try:
+        DiscUpdate.parse(BinaryReader(payload[:-1]))
+    except EOFError:
+        pass
+    else:
+        raise AssertionError("expected EOFError")
+    print("✓ Streaming and truncated test passed")
+
+
+def test_table_roundtrip():
+    """ActionTable stores and rebuilds records without loss."""
+    rng = random.Random(3)
+    updates = []
+    for frame in range(50):
+        payload, _ = write_update(rng, rng.randrange(1 << 13))
+        updates.append(
+            DiscUpdate.parse(BinaryReader(payload)).set_frame(frame).set_sender(0)
+        )
+
+    table = ActionTable.from_actions(updates)
+    for original, rebuilt in zip(updates, table):
+        assert (rebuilt.disc_id, rebuilt.is_player_disc) == (
+            original.disc_id,
+            original.is_player_disc,
+        )
+        assert (rebuilt.flags, rebuilt.record) == (original.flags, original.record)
+    print("✓ Table roundtrip test passed")
+
+
+def test_setters():
+    """ma / yc are assigned as whole lists and read back; items are read-only."""
+    update = DiscUpdate()
+    update.ma = [1.0, None, 2.0] + [None] * 7
+    update.yc = [None, 5, None]
+    assert update.flags == (1 << 11) | 0b101
+    assert update.values == (1.0, 2.0, 5)
+    assert len(update.record) == 12
+    assert update.ma == (1.0, None, 2.0) + (None,) * 7
+    assert update.yc == (None, 5, None)
+
+    ma = list(update.ma)
+    ma[0] = 3.0
+    update.ma = ma
+    assert update.ma[0] == 3.0 and update.yc == (None, 5, None)
+    try:
+        update.ma[0] = 4.0
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("item assignment on ma should fail, not be lost")
+    print("✓ Setters test passed")
+
+
+if __name__ == "__main__":
+    print("Running DiscUpdate tests...")
+    print()
+
+    test_record_matches_fields()
+    test_streaming_and_truncated()
+    test_table_roundtrip()
+    test_setters()
+
+    print()
+    print("All DiscUpdate tests passed! ✓")
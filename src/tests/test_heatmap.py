@@ -0,0 +1,123 @@
+"""
+Tests for the mergeable position heatmaps.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.binary_reader import BinaryReader
+from haxmetrics.metrics import MetricEngine
+from haxmetrics.metrics.heatmap import (
+    BALL,
+    Heatmaps,
+    player_key,
+    replay_heatmaps,
+    team_key,
+)
+from haxmetrics.models.actions.match_start import MatchStart
+from haxmetrics.models.stadium.stadium import Stadium
+from haxmetrics.parser import Parser
+
+
+def _replay(actions, seed=1234):
+    replay = Parser(build_replay(actions, seed=seed)).parse()
+    replay["actions"].insert(0, MatchStart().set_frame(0))
+    return replay
+
+
+def test_binning():
+    """Counts match np.histogram2d; edges clip and NaN is skipped."""
+    heatmaps = Heatmaps((-100, -50, 100, 50), (20, 10))
+    rng = np.random.default_rng(7)
+    x, y = rng.uniform(-100, 100, 5000), rng.uniform(-50, 50, 5000)
+    heatmaps.add("a", x, y)
+    expected, _, _ = np.histogram2d(y, x, bins=(10, 20), range=((-50, 50), (-100, 100)))
+    assert np.array_equal(heatmaps["a"], expected)
+
+    heatmaps.add("b", [-1000, 1000, np.nan], [0, 1000, 0])
+    assert heatmaps["b"].sum() == 2
+    assert heatmaps["b"][5, 0] == 1 and heatmaps["b"][9, 19] == 1
+    print("✓ Binning test passed")
+
+
+def test_stadium_grid():
+    """The grid covers the stadium background and vertexes, or the default size."""
+    replay = Parser(build_replay(10)).parse()
+    stadium = replay["room_info"].stadium
+    heatmaps = Heatmaps.for_stadium(stadium, cell_size=20)
+    background = stadium.background
+    assert heatmaps.extent == (
+        -background.width,
+        -background.height,
+        background.width,
+        background.height,
+    )
+    assert heatmaps.shape == (42, 20)
+
+    # Vértices fuera del fondo (porterías) amplían la rejilla
+    stadium.vertexes[0].x = 450.0
+    assert Heatmaps.for_stadium(stadium, cell_size=20).extent == (-450, -200, 450, 200)
+    assert Heatmaps.for_stadium(None).extent == (-420, -200, 420, 200)
+    big = Stadium.parse(BinaryReader(bytes([3])))
+    assert Heatmaps.for_stadium(big).extent == (-600, -270, 600, 270)
+    print("✓ Stadium grid test passed")
+
+
+def test_simulated_heatmaps():
+    """Every running frame is counted once per player, team and ball."""
+    replay = _replay(1500)
+    heatmaps = MetricEngine(["heatmaps"]).run(replay)["heatmaps"]
+    frames = replay["duration"]
+    names = [player.name for player in replay["players"]]
+    assert heatmaps[BALL].sum() == frames
+    for name in names:
+        assert heatmaps[player_key(name)].sum() == frames
+    assert heatmaps[team_key(1)].sum() == heatmaps[team_key(2)].sum() == 2 * frames
+    # Los jugadores se mueven: su mapa no es un solo punto
+    assert np.count_nonzero(heatmaps[player_key(names[0])]) > 10
+    print("✓ Simulated heatmaps test passed")
+
+
+def test_merge_and_save():
+    """Merging per-replay maps equals counting everything; save keeps it compact."""
+    parts = [replay_heatmaps(_replay(600, seed)) for seed in (1, 2, 3)]
+    # Los mapas viajan entre procesos con pickle
+    parts = [pickle.loads(pickle.dumps(part)) for part in parts]
+    total = Heatmaps.merged(parts)
+    assert total.keys == parts[0].keys
+    assert np.array_equal(total.counts, sum(part.counts for part in parts))
+    assert Heatmaps.merged([]) is None
+
+    other = Heatmaps((-1, -1, 1, 1), (2, 2))
+    try:
+        total.merge(other)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("different grids should not merge")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = total.save(os.path.join(tmp, "maps"))
+        assert path.endswith(".npz")
+        assert Heatmaps.load(path) == total
+        with np.load(path) as data:
+            assert data["counts"].dtype.itemsize < 8
+        assert os.path.getsize(path) < total.nbytes // 4
+    print("✓ Merge and save test passed")
+
+
+if __name__ == "__main__":
+    print("Running heatmap tests...")
+    test_binning()
+    test_stadium_grid()
+    test_simulated_heatmaps()
+    test_merge_and_save()
+    print("All heatmap tests passed! ✓")
@@ -0,0 +1,117 @@
+"""
+Tests for per-player input timelines (InputTimeline).
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.input_timeline import INPUT_BITS, KICK, UP, InputTimelineBuilder
+from haxmetrics.instrumentation import ParseStats
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.parser import Parser
+
+
+def naive_states(actions, sender, duration):
+    """Input held by ``sender`` at every frame, replaying the actions."""
+    states = [0] * (duration + 1)
+    for action in actions:
+        if type(action) is PlayerInput and action.sender == sender:
+            for frame in range(action.frame, duration + 1):
+                states[frame] = action.input
+    return states
+
+
+def test_matches_actions():
+    """state_at agrees with replaying every PlayerInput."""
+    data = build_replay(800)
+    actions = Parser(data).parse()["actions"]
+    parser = Parser(data)
+    timelines = parser.parse_input_timelines()
+
+    assert parser.replay["actions"] == []
+    assert parser.replay["input_timelines"] is timelines
+    assert sorted(timelines) == [1, 2, 3, 4]
+    for sender, timeline in timelines.items():
+        states = naive_states(actions, sender, parser.duration)
+        assert [timeline.state_at(f) for f in range(parser.duration + 1)] == states
+        # RLE: runs consecutivos nunca repiten entrada
+        assert all(a != b for a, b in zip(timeline.inputs, timeline.inputs[1:]))
+        # Un entero de 32 bits por run: frame y los 5 bits de teclas
+        assert timeline.packed.format == "I" and timeline.shift == INPUT_BITS
+        assert timeline.nbytes() == 4 * len(timeline)
+    print("✓ Timeline matches actions test passed")
+
+
+def test_paths_agree():
+    """Streaming and stats paths build the same timelines."""
+    data = build_replay(500)
+    expected = Parser(data).parse_input_timelines()
+    for parser, options in (
+        (Parser(data), {"streaming": True, "chunk_size": 128}),
+        (Parser(data, stats=ParseStats()), {}),
+    ):
+        timelines = parser.parse_input_timelines(**options)
+        assert {s: t.json_serialize() for s, t in timelines.items()} == {
+            s: t.json_serialize() for s, t in expected.items()
+        }
+    print("✓ Parse paths test passed")
+
+
+def test_run_length_encoding():
+    """Repeated inputs collapse; the last input of a frame wins."""
+    builder = InputTimelineBuilder()
+    for frame, input_ in (
+        (0, 0),
+        (5, UP),
+        (7, UP),
+        (9, UP | KICK),
+        (9, UP),
+        (12, 0),
+        (12, 0),
+        (20, 300),
+    ):
+        builder.append_input(frame, 1, input_)
+    timeline = builder.build()[1]
+
+    assert list(timeline.frames) == [5, 12, 20]
+    assert list(timeline.inputs) == [UP, 0, 300]
+    # 300 no cabe en los bits de teclas: runs de 64 bits
+    assert timeline.packed.format == "Q" and timeline.shift == 32
+    assert timeline.state_at(4) == 0
+    assert timeline.state_at(9) == UP
+    assert timeline.is_pressed(11, UP) and not timeline.is_pressed(12, UP)
+    assert list(timeline.runs(25)) == [(5, 12, UP), (12, 20, 0), (20, 25, 300)]
+    assert timeline.held_frames(UP, 10) == 5
+    print("✓ Run-length encoding test passed")
+
+
+def test_between_zero_copy():
+    """Frame-range slices share the buffers and keep the held state."""
+    timelines = Parser(build_replay(2000)).parse_input_timelines()
+    timeline = timelines[1]
+    start, stop = timeline.frames[10] + 1, timeline.frames[40]
+    window = timeline.between(start, stop)
+
+    assert window.packed.obj is timeline.packed.obj
+    assert window.frames[0] <= start
+    for frame in range(start, stop):
+        assert window.state_at(frame) == timeline.state_at(frame)
+
+    frames, inputs = window.to_numpy()
+    assert list(frames) == window.frames and list(inputs) == window.inputs
+    print("✓ Zero-copy slice test passed")
+
+
+if __name__ == "__main__":
+    print("Running input timeline tests...")
+    print()
+
+    test_matches_actions()
+    test_paths_agree()
+    test_run_length_encoding()
+    test_between_zero_copy()
+
+    print()
+    print("All input timeline tests passed! ✓")
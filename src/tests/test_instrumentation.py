@@ -0,0 +1,93 @@
+"""
+Tests for parse instrumentation (ParseStats and logging).
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import contextlib
+import io
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.instrumentation import ParseStats
+from haxmetrics.parser import Parser
+
+
+def test_parse_stats_counts():
+    """Stats count every action and the bytes of every section."""
+    data = build_replay(2000)
+    stats = ParseStats()
+    replay = Parser(data, stats=stats).parse()
+
+    assert stats.replays == 1
+    assert sum(stats.action_counts.values()) == len(replay["actions"])
+    assert stats.action_counts["PlayerInput"] == sum(
+        1 for a in replay["actions"] if a.type == "PlayerInput"
+    )
+    assert stats.section_bytes["inflate"] == (
+        stats.section_bytes["messages"]
+        + stats.section_bytes["room"]
+        + stats.section_bytes["actions"]
+    )
+    assert 0 < stats.section_bytes["stadium"] < stats.section_bytes["room"]
+    assert sum(stats.action_bytes.values()) == stats.section_bytes["actions"]
+    print("✓ ParseStats counts test passed")
+
+
+def test_streaming_stats_merge():
+    """Streaming parse fills the same counters; stats can be merged."""
+    data = build_replay(500)
+    full = ParseStats()
+    Parser(data, stats=full).parse()
+    streamed = ParseStats()
+    Parser(data, stats=streamed).parse(streaming=True, chunk_size=256)
+
+    assert streamed.section_bytes == full.section_bytes
+    assert streamed.compressed_bytes == full.compressed_bytes == len(data) - 12
+    assert streamed.action_counts == full.action_counts
+
+    total = ParseStats().merge(full).merge(streamed)
+    assert total.replays == 2
+    assert total.action_counts["PlayerInput"] == 2 * full.action_counts["PlayerInput"]
+    print("✓ Streaming stats and merge test passed")
+
+
+def test_stats_with_types():
+    """Skipped actions are not credited to the kept ones, even at the end."""
+    data = build_replay(300)
+    full = ParseStats()
+    Parser(data, stats=full).parse()
+    for streaming in (False, True):
+        for kept in ("ChatMessage", "PlayerInput"):
+            stats = ParseStats()
+            Parser(data, stats=stats).parse(streaming=streaming, types={kept})
+            assert stats.action_counts == {kept: full.action_counts[kept]}
+            assert stats.action_bytes == {kept: full.action_bytes[kept]}
+            assert stats.section_bytes == full.section_bytes
+            assert stats.skipped_bytes == (
+                full.section_bytes["actions"] - full.action_bytes[kept]
+            )
+    print("✓ Stats with types test passed")
+
+
+def test_parse_is_silent():
+    """Parsing does not print to stdout."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        Parser(build_replay(100)).parse()
+    assert out.getvalue() == ""
+    print("✓ Silent parse test passed")
+
+
+if __name__ == "__main__":
+    print("Running instrumentation tests...")
+    print()
+
+    test_parse_stats_counts()
+    test_streaming_stats_merge()
+    test_stats_with_types()
+    test_parse_is_silent()
+
+    print()
+    print("All instrumentation tests passed! ✓")
@@ -0,0 +1,167 @@
+"""
+Tests for the metric registry and the single-pass MetricEngine.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.input_timeline import KICK
+from haxmetrics.metrics import REGISTRY, Metric, MetricEngine, register
+from haxmetrics.models.actions.change_paused import ChangePaused
+from haxmetrics.models.actions.match_start import MatchStart
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.models.actions.player_team_change import PlayerTeamChange
+from haxmetrics.models.replay_messages import MessageType, ReplayMessage
+from haxmetrics.parser import Parser
+
+
+def _replay(actions=2000):
+    """Synthetic replay with a MatchStart on frame 0, so the game runs."""
+    replay = Parser(build_replay(actions)).parse()
+    replay["actions"].insert(0, MatchStart().set_frame(0))
+    return replay
+
+
+def test_registry():
+    """Metrics register by name; clashes and unknown inputs are rejected."""
+    assert {
+        "minutes_played",
+        "team_time",
+        "kick_presses",
+        "goals",
+        "ball_contacts",
+    } <= set(REGISTRY)
+
+    class Unnamed(Metric):
+        pass
+
+    class Clash(Metric):
+        name = "goals"
+
+    class Unknown(Metric):
+        name = "unknown_input"
+        actions = (str,)
+
+    for cls in (Unnamed, Clash, Unknown):
+        try:
+            register(cls)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{cls.__name__} should not register")
+    try:
+        MetricEngine(["no_such_metric"])
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("unknown metric names should fail")
+    print("✓ Registry test passed")
+
+
+def test_single_pass_matches_separate_runs():
+    """Every metric gives the same result alone as together with the rest."""
+    replay = _replay()
+    together = MetricEngine().run(replay)
+    assert set(together) == set(REGISTRY)
+    for name in REGISTRY:
+        assert MetricEngine([name]).run(replay) == {name: together[name]}, name
+
+    presses = {}
+    previous = {}
+    for action in replay["actions"]:
+        if isinstance(action, PlayerInput):
+            if action.input & KICK and not previous.get(action.sender, 0) & KICK:
+                presses[action.sender] = presses.get(action.sender, 0) + 1
+            previous[action.sender] = action.input
+    assert together["kick_presses"] == presses
+    assert sum(player["kicks"] for player in together["ball_contacts"].values()) > 0
+    print("✓ Single pass test passed")
+
+
+def test_inputs_are_dispatched():
+    """Metrics see only their declared actions and messages; frames track the replay."""
+
+    class Seen(Metric):
+        name = "seen"
+        actions = (PlayerTeamChange,)
+        messages = (MessageType.GOAL,)
+        frames = True
+
+        __slots__ = ("actions_seen", "messages_seen", "frames_seen")
+
+        def start(self, replay):
+            self.actions_seen, self.messages_seen, self.frames_seen = set(), 0, []
+
+        def on_action(self, action):
+            self.actions_seen.add(type(action))
+
+        def on_message(self, message):
+            self.messages_seen += 1
+
+        def on_frame(self, simulator):
+            self.frames_seen.append(simulator.frame)
+
+        def result(self):
+            return self.actions_seen, self.messages_seen, self.frames_seen
+
+    replay = _replay(300)
+    replay["messages"] = [
+        ReplayMessage(index=i, delta_time=0, type=type_)
+        for i, type_ in enumerate(
+            (MessageType.GOAL, MessageType.CHAT, MessageType.GOAL)
+        )
+    ]
+    change = PlayerTeamChange().set_frame(10)
+    change.player_id, change.team = 1, 2
+    replay["actions"].insert(1, change)
+
+    actions, messages, frames = MetricEngine([Seen]).run(replay)["seen"]
+    assert actions == {PlayerTeamChange}
+    assert messages == 2
+    assert frames == list(range(replay["duration"] + 1))
+    print("✓ Input dispatch test passed")
+
+
+def test_minutes_played():
+    """Team time counts running, unpaused frames per team."""
+    replay = Parser(build_replay(10)).parse()
+    actions = [MatchStart().set_frame(600)]
+    change = PlayerTeamChange().set_frame(1800)
+    change.player_id, change.team = 1, 2
+    actions.append(change)
+    for frame, paused in ((2400, True), (3000, False)):
+        pause = ChangePaused().set_frame(frame)
+        pause.paused = paused
+        actions.append(pause)
+    replay["actions"] = actions
+    replay["duration"] = 4200
+
+    result = MetricEngine(["team_time", "minutes_played"]).run(replay)
+    # 600-1800 en rojo; 1800-2400 y 3000-4200 en azul
+    assert result["team_time"][1] == {"Red": 20.0, "Blue": 30.0}
+    assert result["team_time"][3] == {"Red": 0.0, "Blue": 50.0}
+    assert result["minutes_played"][1] == round(50 / 60, 2)
+    print("✓ Minutes played test passed")
+
+
+def test_parse_in_one_pass():
+    """parse() decodes only the needed actions and agrees with run()."""
+    data = build_replay(2000)
+    engine = MetricEngine(["kick_presses", "chat_messages", "minutes_played"])
+    assert engine.parse(data) == engine.run(Parser(data).parse())
+    assert engine.parse(data, streaming=False) == engine.parse(data)
+    assert not engine.simulates and PlayerInput in engine.action_types
+    assert MetricEngine(["goals"]).action_types >= {PlayerInput, MatchStart}
+    print("✓ One pass parse test passed")
+
+
+if __name__ == "__main__":
+    print("Running metrics tests...")
+    test_registry()
+    test_single_pass_matches_separate_runs()
+    test_inputs_are_dispatched()
+    test_minutes_played()
+    test_parse_in_one_pass()
+    print("All metrics tests passed! ✓")
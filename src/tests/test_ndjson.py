@@ -0,0 +1,113 @@
+"""
+Tests for the streaming NDJSON exporter.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import glob
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.io.ndjson import export_ndjson, to_json
+from haxmetrics.parser import Parser
+
+
+def read_records(raw):
+    return [json.loads(line) for line in raw.splitlines()]
+
+
+def test_records_match_models():
+    """Every record matches the json_serialize of its model."""
+    data = build_replay(2000)
+    out = io.BytesIO()
+    count = export_ndjson(data, out)
+    records = read_records(out.getvalue())
+    replay = Parser(data).parse()
+
+    assert count == len(records)
+    kinds = [r["record"] for r in records]
+    assert kinds[:2] == ["header", "room"]
+    assert kinds.count("player") == len(replay["players"])
+    assert kinds.count("action") == len(replay["actions"])
+
+    header = records[0]
+    assert (header["version"], header["duration"]) == (
+        replay["version"],
+        replay["duration"],
+    )
+    room = records[1]
+    assert room["name"] == replay["room_info"].name
+    assert room["stadium"]["name"] == replay["room_info"].stadium.name
+    assert len(room["stadium"]["vertexes"]) == len(replay["room_info"].stadium.vertexes)
+
+    actions = [r for r in records if r["record"] == "action"]
+    for record, action in zip(actions, replay["actions"]):
+        expected = json.loads(json.dumps(action.json_serialize(), default=to_json))
+        assert record == {"record": "action", **expected}
+    print("✓ Records match models test passed")
+
+
+def test_outputs_and_filter():
+    """Paths, text streams and types= work."""
+    data = build_replay(300)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "a.hbr2")
+        target = os.path.join(tmp, "a.ndjson")
+        with open(source, "wb") as f:
+            f.write(data)
+        export_ndjson(source, target)
+        with open(target, "rb") as f:
+            from_path = f.read()
+
+    text = io.StringIO()
+    export_ndjson(data, text, streaming=False)
+    assert text.getvalue().encode() == from_path
+
+    chat = io.BytesIO()
+    export_ndjson(data, chat, types={"ChatMessage"})
+    actions = [r for r in read_records(chat.getvalue()) if r["record"] == "action"]
+    assert actions and all(r["type"] == "ChatMessage" for r in actions)
+    print("✓ Outputs and filter test passed")
+
+
+def test_constant_memory():
+    """Peak memory does not grow with the number of actions."""
+    peaks = []
+    for actions in (5_000, 50_000):
+        data = build_replay(actions)
+        tracemalloc.start()
+        export_ndjson(data, io.BufferedWriter(io.FileIO(os.devnull, "w")))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    assert peaks[1] < 2 * peaks[0] + len(data), peaks
+    print("✓ Constant memory test passed")
+
+
+def test_real_replays():
+    """Real replays export to valid JSON lines."""
+    for path in sorted(glob.glob("src/replays/LIRS/*.hbr2"))[:3]:
+        out = io.BytesIO()
+        export_ndjson(path, out)
+        records = read_records(out.getvalue())
+        assert records[0]["record"] == "header"
+        assert any(r["record"] == "room" for r in records)
+    print("✓ Real replays test passed")
+
+
+if __name__ == "__main__":
+    print("Running NDJSON exporter tests...")
+    print()
+
+    test_records_match_models()
+    test_outputs_and_filter()
+    test_constant_memory()
+    test_real_replays()
+
+    print()
+    print("All NDJSON exporter tests passed! ✓")
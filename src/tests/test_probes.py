@@ -0,0 +1,59 @@
+"""
+Tests for the header-only replay probe (haxprobe).
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import json
+import os
+import tempfile
+
+from click.testing import CliRunner
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.io.probes import main_cli, probe
+from haxmetrics.parser import Parser
+
+
+def test_probe_matches_parse():
+    """The probe reads the same room as a full parse, inflating much less."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "synthetic.hbr2")
+        data = build_replay(50_000)
+        with open(path, "wb") as f:
+            f.write(data)
+
+        info = probe(path)
+        replay = Parser(data).parse()
+
+        assert (info.version, info.duration) == (replay["version"], replay["duration"])
+        assert info.room == replay["room_info"].name
+        assert info.stadium == replay["room_info"].stadium.name
+        assert info.players == [(p.id, p.name, p.team) for p in replay["players"]]
+        assert info.inflated_bytes < 64 * 1024
+    print("✓ Probe test passed")
+
+
+def test_probe_cli():
+    """haxprobe prints one JSON object per replay in a directory."""
+    runner = CliRunner()
+    result = runner.invoke(main_cli, ["--json", "src/replays/LIRS"])
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert len(lines) == 7
+    assert all(line["stadium"] == "LIRS RS 4v4" for line in lines)
+    print("✓ Probe CLI test passed")
+
+
+if __name__ == "__main__":
+    print("Running probe tests...")
+    print()
+
+    test_probe_matches_parse()
+    test_probe_cli()
+
+    print()
+    print("All probe tests passed! ✓")
@@ -0,0 +1,542 @@
+"""
+Tests for the NumPy physics engine and replay simulator.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import math
+
+import numpy as np
+
+from benchmarks.synthetic import build_replay
+from haxmetrics.binary_reader import BinaryReader
+from haxmetrics.models.actions.change_paused import ChangePaused
+from haxmetrics.models.actions.player_input import PlayerInput
+from haxmetrics.models.stadium.compiled import CompiledStadium
+from haxmetrics.models.stadium.goal import Goal
+from haxmetrics.models.stadium.plane import Plane
+from haxmetrics.models.stadium.segment import Segment
+from haxmetrics.models.stadium.stadium import Stadium
+from haxmetrics.models.stadium.vertex import Vertex
+from haxmetrics.parser import Parser
+from haxmetrics.sim import world as world_module
+from haxmetrics.sim.batch import BatchSimulator
+from haxmetrics.sim.grid import Grid
+from haxmetrics.sim.keyframes import KeyframeStore
+from haxmetrics.sim.simulator import GOAL, KICKOFF, PLAYING, RED, Simulator
+from haxmetrics.sim.world import World
+
+ALL = ["all"]
+
+
+def _stadium(vertexes=(), segments=(), planes=()):
+    stadium = Stadium()
+    stadium.set_custom(True)
+    stadium.set_vertexes([Vertex(x, y, 1.0, ALL, ALL) for x, y in vertexes])
+    stadium.set_segments(
+        [Segment(v0, v1, 1.0, ALL, ALL, curve) for v0, v1, curve in segments]
+    )
+    stadium.set_planes([Plane(nx, ny, dist, 1.0, ALL, ALL) for nx, ny, dist in planes])
+    return stadium
+
+
+class Ref:
+    """Scalar port of ra (discs) from game-min.js, to compare against."""
+
+    def __init__(
+        self, x, y, vx, vy, radius=10.0, b_coef=0.5, inv_mass=1.0, damping=0.99
+    ):
+        self.p, self.v = [x, y], [vx, vy]
+        self.r, self.b, self.m, self.damping = radius, b_coef, inv_mass, damping
+
+    def move(self):
+        self.p = [self.p[0] + self.v[0], self.p[1] + self.v[1]]
+        self.v = [self.v[0] * self.damping, self.v[1] * self.damping]
+
+    def push(self, nx, ny, depth, b_coef):
+        self.p = [self.p[0] + nx * depth, self.p[1] + ny * depth]
+        approach = nx * self.v[0] + ny * self.v[1]
+        if approach < 0:
+            approach *= self.b * b_coef + 1
+            self.v = [self.v[0] - nx * approach, self.v[1] - ny * approach]
+
+
+def _world(geometry, *refs):
+    world = World(geometry)
+    for ref in refs:
+        world.add_disc(
+            *ref.p, ref.r, ref.b, ref.m, ref.damping, vx=ref.v[0], vy=ref.v[1]
+        )
+    return world
+
+
+def _close(world, *refs):
+    for slot, ref in enumerate(refs):
+        assert np.allclose(world.positions[slot], ref.p), (world.positions[slot], ref.p)
+        assert np.allclose(world.velocities[slot], ref.v), (
+            world.velocities[slot],
+            ref.v,
+        )
+
+
+def test_plane_and_vertex():
+    """A disc crossing a plane or touching a vertex bounces as in the JS step."""
+    world = _world(
+        _stadium(planes=[(0.0, 1.0, 0.0)]).compile(), Ref(0.0, 12.0, 1.0, -4.0)
+    )
+    world.step()
+    ref = Ref(0.0, 12.0, 1.0, -4.0)
+    ref.move()
+    ref.push(0.0, 1.0, 0.0 - ref.p[1] + ref.r, 1.0)
+    _close(world, ref)
+
+    world = _world(_stadium(vertexes=[(0.0, 0.0)]).compile(), Ref(6.0, 8.0, -1.0, -1.0))
+    world.step()
+    ref = Ref(6.0, 8.0, -1.0, -1.0)
+    ref.move()
+    dist = math.hypot(*ref.p)
+    ref.push(ref.p[0] / dist, ref.p[1] / dist, ref.r - dist, 1.0)
+    _close(world, ref)
+    print("✓ Plane and vertex test passed")
+
+
+def test_segments():
+    """Straight and curved segments (I.qe geometry, ra.xo contact)."""
+    stadium = _stadium(vertexes=[(-100.0, 0.0), (100.0, 0.0)], segments=[(0, 1, 0.0)])
+    geometry = stadium.compile()
+    assert not geometry.segment_curved[0]
+    assert np.allclose(geometry.segment_normal[0], (0.0, -1.0))
+
+    world = _world(geometry, Ref(30.0, -15.0, 0.0, 8.0))
+    world.step()
+    ref = Ref(30.0, -15.0, 0.0, 8.0)
+    ref.move()
+    gap = -ref.p[1]  # Lado de la normal, hacia y negativo
+    ref.push(0.0, -1.0, ref.r - gap, 1.0)
+    _close(world, ref)
+
+    # Arco de 90°: centro en (0, 100), radio 100·√2
+    stadium = _stadium(vertexes=[(-100.0, 0.0), (100.0, 0.0)], segments=[(0, 1, 90.0)])
+    geometry = stadium.compile()
+    assert geometry.segment_curved[0]
+    assert np.allclose(geometry.segment_center[0], (0.0, 100.0))
+    assert math.isclose(geometry.segment_radius[0], 100 * math.sqrt(2))
+
+    world = _world(geometry, Ref(0.0, -50.0, 0.0, 5.0))
+    world.step()
+    ref = Ref(0.0, -50.0, 0.0, 5.0)
+    ref.move()
+    length = math.hypot(ref.p[0], ref.p[1] - 100.0)
+    gap = length - 100 * math.sqrt(2)
+    ref.push(0.0, -1.0, ref.r - gap, 1.0)  # Por debajo del arco, fuera del círculo
+    _close(world, ref)
+    print("✓ Segments test passed")
+
+
+def test_discs_and_joints():
+    """Disc-disc contact (ra.wo) and a rigid joint (ob.A)."""
+    first, second = Ref(0.0, 0.0, 2.0, 0.0, inv_mass=1.0), Ref(
+        18.0, 0.0, 0.0, 0.0, inv_mass=0.5
+    )
+    world = _world(CompiledStadium(), first, second)
+    world.step()
+    for ref in (first, second):
+        ref.move()
+    dx = first.p[0] - second.p[0]
+    dist = abs(dx)
+    nx = dx / dist
+    ratio = first.m / (first.m + second.m)
+    depth = first.r + second.r - dist
+    first.p[0] += nx * depth * ratio
+    second.p[0] -= nx * depth * (1 - ratio)
+    approach = nx * (first.v[0] - second.v[0])
+    impulse = approach * (first.b * second.b + 1)
+    first.v[0] -= nx * impulse * ratio
+    second.v[0] += nx * impulse * (1 - ratio)
+    _close(world, first, second)
+
+    first, second = Ref(0.0, 0.0, -1.0, 0.0), Ref(40.0, 0.0, 1.0, 0.0)
+    world = _world(CompiledStadium(), first, second)
+    world.add_joint(0, 1, 50.0, 50.0, math.inf)
+    world.step()
+    for ref in (first, second):
+        ref.move()
+    for _ in range(2):
+        dist = second.p[0] - first.p[0]
+        stretch = 50.0 - dist
+        nx = -1.0
+        first.p[0] += nx * stretch * 0.5 * 0.5
+        second.p[0] -= nx * stretch * 0.5 * 0.5
+        approach = nx * (first.v[0] - second.v[0])
+        first.v[0] -= nx * approach * 0.5
+        second.v[0] += nx * approach * 0.5
+    _close(world, first, second)
+    # Cada iteración corrige la mitad del estiramiento
+    # (42 tras moverse: 8 -> 4 -> 2)
+    assert math.isclose(world.positions[1, 0] - world.positions[0, 0], 48.0)
+    print("✓ Discs and joints test passed")
+
+
+def _wo(first, second):
+    """ra.wo from game-min.js, between two Ref discs."""
+    dx, dy = first.p[0] - second.p[0], first.p[1] - second.p[1]
+    dist = math.hypot(dx, dy)
+    reach = first.r + second.r
+    if not 0 < dist <= reach:
+        return
+    nx, ny = dx / dist, dy / dist
+    ratio = first.m / (first.m + second.m)
+    depth = reach - dist
+    moved = depth * ratio
+    first.p = [first.p[0] + nx * moved, first.p[1] + ny * moved]
+    depth -= moved
+    second.p = [second.p[0] - nx * depth, second.p[1] - ny * depth]
+    approach = nx * (first.v[0] - second.v[0]) + ny * (first.v[1] - second.v[1])
+    if approach < 0:
+        impulse = approach * (first.b * second.b + 1)
+        share = impulse * ratio
+        first.v = [first.v[0] - nx * share, first.v[1] - ny * share]
+        impulse -= share
+        second.v = [second.v[0] + nx * impulse, second.v[1] + ny * impulse]
+
+
+def test_contact_order():
+    """Discs touching several discs or planes resolve them one by one, in JS order."""
+    # 0 (fijo) empuja a 1 contra 2, que solo toca a 1 después: antes que el par (2, 3)
+    refs = [
+        Ref(0.0, 0.0, 0.0, 0.0, inv_mass=0.0),
+        Ref(15.0, 0.0, 0.5, 0.3),
+        Ref(38.0, 0.0, -0.5, 0.0, inv_mass=0.5),
+        Ref(55.0, 0.0, 0.0, 0.0),
+        Ref(200.0, 3.0, -1.0, -2.0),
+    ]
+    slope = 1 / math.sqrt(2)
+    planes = [(0.0, 1.0, 0.0), (slope, slope, 140.0)]
+    world = _world(_stadium(planes=planes).compile(), *refs)
+    world.step()
+    for ref in refs:
+        ref.move()
+    for i, ref in enumerate(refs):
+        for other in refs[i + 1 :]:
+            _wo(ref, other)
+        if ref.m:
+            for nx, ny, dist in planes:
+                depth = dist - (nx * ref.p[0] + ny * ref.p[1]) + ref.r
+                if depth > 0:
+                    ref.push(nx, ny, depth, 1.0)
+    _close(world, *refs)
+    first, second = world.contacts[:2]
+    assert list(zip(first.tolist(), second.tolist())) == [(0, 1), (1, 2), (2, 3)]
+    print("✓ Contact order test passed")
+
+
+def test_joint_levels():
+    """Joints solved one by one and in NumPy levels give the same run."""
+    replay = Parser(build_replay(1500)).parse()
+    trajectories = []
+    default = world_module.JOINT_VECTOR_MIN
+    try:
+        for threshold in (default, 1):
+            world_module.JOINT_VECTOR_MIN = threshold
+            _, trajectory = _simulate(replay)
+            trajectories.append(trajectory.positions)
+    finally:
+        world_module.JOINT_VECTOR_MIN = default
+    assert np.array_equal(*trajectories, equal_nan=True)
+    print("✓ Joint levels test passed")
+
+
+def _simulate(replay):
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    return simulator, simulator.run(replay["actions"], until=replay["duration"])
+
+
+def test_deterministic_run():
+    """Same replay, same trajectory; discs stay inside the field."""
+    replay = Parser(build_replay(1500)).parse()
+    simulator, first = _simulate(replay)
+    _, second = _simulate(replay)
+    assert len(first) == replay["duration"] + 1
+    assert np.array_equal(first.positions, second.positions, equal_nan=True)
+    assert np.nanmax(np.abs(first.positions[..., 0])) <= 420
+    assert np.nanmax(np.abs(first.positions[..., 1])) <= 200
+    assert sorted(set(first.owners.tolist()) - {-1}) == [1, 2, 3, 4]
+    assert simulator.phase == PLAYING
+    print("✓ Deterministic run test passed")
+
+
+def test_kickoff_and_kick():
+    """Kickoff positions (Y.$k) and a kick moving the ball."""
+    replay = Parser(build_replay(10)).parse()
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    assert simulator.phase == KICKOFF
+    trajectory = simulator.run([])
+    spawn = replay["room_info"].stadium.spawn_distance
+    assert np.allclose(
+        trajectory.at(0)[simulator.player_slot],
+        [(-spawn, 0), (-spawn, 55), (spawn, 0), (spawn, 55)],
+    )
+
+    # Jugador 1 pegado al balón, pateando hacia la derecha
+    world = simulator.world
+    slot = simulator.player_slot[simulator.players[1]]
+    world.position[slot] = -26.0
+    kick = PlayerInput().set_frame(0).set_sender(1)
+    kick.input = 16
+    simulator.apply(kick)
+    simulator.tick()
+    assert world.velocity[0].real > 4.0 and world.velocity[0].imag == 0
+    assert simulator.phase == PLAYING
+    assert not simulator.player_kicking[simulator.players[1]]
+    assert simulator.player_kick_timer[simulator.players[1]] == simulator.kick_timeout
+    print("✓ Kickoff and kick test passed")
+
+
+def test_player_physics():
+    """Player discs take radius, gravity, cGroup and kickback from the stadium (cc)."""
+    replay = Parser(build_replay(10)).parse()
+    physics = replay["room_info"].stadium.player_physics
+    physics.radius, physics.kickback, physics.gravity_y, physics.c_group = (
+        20.0,
+        2.0,
+        0.5,
+        ["c0"],
+    )
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    world = simulator.world
+    slot = simulator.player_slot[simulator.players[1]]
+    assert world.radius[slot] == 20.0 and world.gravity[slot] == 0.5j
+    assert world.c_group[slot] == 2 | 1 << 28
+
+    world.position[slot] = -31.0
+    kick = PlayerInput().set_frame(0).set_sender(1)
+    kick.input = 16
+    simulator.apply(kick)
+    simulator.tick()
+    assert world.velocity[0].real > 4.0
+    assert world.velocity[slot].real < 0 and world.velocity[slot].imag > 0
+    print("✓ Player physics test passed")
+
+
+def test_goal():
+    """The ball crossing the red goal line scores for blue."""
+    replay = Parser(build_replay(10)).parse()
+    replay["room_info"].stadium.goals.append(
+        Goal([-300.0, -50.0], [-300.0, 50.0], "Red")
+    )
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    simulator.phase = PLAYING
+    simulator.world.position[0] = -295.0
+    simulator.world.velocity[0] = -10.0
+    simulator.tick()
+    assert (simulator.score_red, simulator.score_blue) == (0, 1)
+    assert simulator.phase == GOAL and simulator.kickoff_team == RED
+
+    for _ in range(150):
+        simulator.tick()
+    assert simulator.phase == KICKOFF
+    assert simulator.world.position[0] == 0
+    print("✓ Goal test passed")
+
+
+def test_builtin_stadium():
+    """Built-in stadiums (q.Vh) get their geometry: a goal on Big scores."""
+    replay = Parser(build_replay(10)).parse()
+    replay["room_info"].stadium = Stadium.parse(BinaryReader(bytes([3])))
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    spawn = simulator.world.position[simulator.player_slot]
+    assert np.allclose(np.abs(spawn.real), 400.0)
+    simulator.phase = PLAYING
+    simulator.world.position[0] = 545.0
+    simulator.world.velocity[0] = 10.0
+    simulator.tick()
+    assert (simulator.score_red, simulator.score_blue) == (1, 0)
+    print("✓ Built-in stadium test passed")
+
+
+def test_grid_broad_phase():
+    """Grid candidates cover every contact; simulating with or without it is equal."""
+    replay = Parser(build_replay(1500, elements=255)).parse()
+    geometry = replay["room_info"].stadium.compile()
+    grid = Grid(geometry, margin=15.0)
+    rng = np.random.default_rng(7)
+    points = rng.uniform((-420, -200), (420, 200), size=(500, 2))
+    cells = grid.cells(points[:, 0], points[:, 1])
+    disc, vertex = Grid.candidates(grid.vertexes, cells)
+    near = set(zip(disc.tolist(), vertex.tolist()))
+    dist = np.hypot(
+        *(points[:, None, :] - geometry.vertex_pos[None, :, :]).transpose(2, 0, 1)
+    )
+    assert set(zip(*np.nonzero(dist <= 15.0))) <= near
+    assert len(near) < dist.size // 10
+
+    trajectories = []
+    default = world_module.GRID_MIN_ELEMENTS
+    try:
+        for threshold in (default, 10**9):
+            world_module.GRID_MIN_ELEMENTS = threshold
+            simulator, trajectory = _simulate(replay)
+            assert (simulator.world.grid is not None) == (threshold == default)
+            trajectories.append(trajectory.positions)
+    finally:
+        world_module.GRID_MIN_ELEMENTS = default
+    assert np.array_equal(*trajectories, equal_nan=True)
+    print("✓ Grid broad phase test passed")
+
+
+def test_keyframe_seek():
+    """Seeking through keyframes gives the same state as simulating from the start."""
+    replay = Parser(build_replay(1500)).parse()
+    _, trajectory = _simulate(replay)
+
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    store = KeyframeStore(simulator, replay["actions"], interval=60).record(
+        until=replay["duration"]
+    )
+    assert store.end == replay["duration"]
+    assert len(store) == replay["duration"] // 60 + 1
+    for frame in (replay["duration"], 0, 1234, 59, 60, 61, 777, 1234):
+        positions = store.seek(frame).world.positions
+        # Trajectory guarda float32 y todos los slots de la partida
+        expected = trajectory.at(frame)[: len(positions)]
+        assert np.array_equal(positions.astype(np.float32), expected, equal_nan=True)
+        assert store.simulator.frame == frame
+
+    # Tras un seek la simulación sigue igual que la original
+    store.seek(300)
+    rest = store.simulator.run(
+        [a for a in replay["actions"] if a.frame >= 300], until=replay["duration"]
+    )
+    assert np.array_equal(rest.positions, trajectory.positions[300:], equal_nan=True)
+
+    sparse = KeyframeStore(
+        Simulator.from_replay(replay), replay["actions"], interval=600
+    ).record()
+    assert sparse.nbytes < store.nbytes
+    try:
+        store.seek(replay["duration"] + 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("seek past the end should fail")
+    print("✓ Keyframe seek test passed")
+
+
+def test_batch_lockstep():
+    """Replays simulated together in one World match their individual runs."""
+    replays = [
+        Parser(build_replay(actions, seed=seed)).parse()
+        for actions, seed in ((600, 1), (900, 2), (300, 3))
+    ]
+    batch = BatchSimulator.from_replays(replays)
+    for simulator in batch.simulators:
+        simulator.start()
+    # La tercera partida se pausa un rato: sus discos quedan quietos en el paso común
+    actions = [list(replay["actions"]) for replay in replays]
+    pauses = []
+    for frame, paused in ((100, True), (160, False)):
+        action = ChangePaused().set_frame(frame)
+        action.paused = paused
+        pauses.append(action)
+    actions[2] = sorted(actions[2] + pauses, key=lambda action: action.frame)
+    trajectories = batch.run(actions, until=[replay["duration"] for replay in replays])
+
+    for replay, moves, trajectory in zip(replays, actions, trajectories):
+        simulator = Simulator.from_replay(replay)
+        simulator.start()
+        expected = simulator.run(moves, until=replay["duration"])
+        assert len(trajectory) == replay["duration"] + 1
+        assert np.array_equal(trajectory.positions, expected.positions, equal_nan=True)
+        assert np.array_equal(trajectory.owners, expected.owners)
+    # Cada partida sólo choca con sus propios discos
+    assert set(np.unique(batch.world.batch).tolist()) == {0, 1, 2}
+
+    # restore() sustituye el World entero: en lote pisaría las otras partidas
+    member = batch.simulators[1]
+    snapshot = member.snapshot()
+    positions = batch.world.position.copy()
+    try:
+        member.restore(snapshot)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("restoring a batched simulator should fail")
+    assert np.array_equal(batch.world.position, positions, equal_nan=True)
+    print("✓ Batch lockstep test passed")
+
+
+def test_touch_and_kick_events():
+    """Kicks and touches are logged with the ball velocity around them."""
+    replay = Parser(build_replay(10)).parse()
+    simulator = Simulator.from_replay(replay)
+    simulator.start()
+    simulator.run([])
+    world = simulator.world
+    column = simulator.players[1]
+    slot = simulator.player_slot[column]
+    world.position[slot] = -26.0
+    kick = PlayerInput().set_frame(0).set_sender(1)
+    kick.input = 16
+    simulator.apply(kick)
+    simulator.tick()
+
+    (event,) = simulator.events.kicks
+    assert (event["frame"], event["player"], event["target"]) == (1, 1, 0)
+    assert simulator.owners[event["disc"]] == 1
+    assert np.array_equal(event["before"], [0, 0])
+    assert np.allclose(event["after"], [simulator.physics.kick_strength, 0])
+
+    # Jugador 3 encima del balón, que ya va hacia la derecha
+    snapshot = simulator.snapshot()
+    world.position[simulator.player_slot[simulator.players[3]]] = world.position[0] + 20
+    simulator.tick()
+    (event,) = simulator.events.touches
+    assert (event["frame"], event["player"], event["target"]) == (2, 3, 0)
+    assert event["before"][0] > event["after"][0] > 0
+
+    # Volver atrás descarta los eventos posteriores
+    simulator.restore(snapshot)
+    assert len(simulator.events) == 1 and not len(simulator.events.touches)
+
+    # En lote, cada partida registra los mismos eventos que sola
+    replays = [Parser(build_replay(2000, seed=seed)).parse() for seed in (5, 6)]
+    batch = BatchSimulator.from_replays(replays)
+    for member in batch.simulators:
+        member.start()
+    batch.run(
+        [replay["actions"] for replay in replays],
+        until=[replay["duration"] for replay in replays],
+    )
+    for replay, member in zip(replays, batch.simulators):
+        alone, _ = _simulate(replay)
+        assert len(alone.events) and np.array_equal(
+            member.events.events, alone.events.events
+        )
+    print("✓ Touch and kick events test passed")
+
+
+if __name__ == "__main__":
+    print("Running simulation tests...")
+    test_plane_and_vertex()
+    test_segments()
+    test_discs_and_joints()
+    test_contact_order()
+    test_joint_levels()
+    test_deterministic_run()
+    test_kickoff_and_kick()
+    test_player_physics()
+    test_goal()
+    test_builtin_stadium()
+    test_grid_broad_phase()
+    test_keyframe_seek()
+    test_batch_lockstep()
+    test_touch_and_kick_events()
+    print("All simulation tests passed! ✓")
@@ -1,6 +1,7 @@
 """
 Tests for Stadium parsing functionality.
 """
+import struct
 import sys
 sys.path.insert(0, 'src')
 
@@ -48,19 +49,21 @@ def test_custom_stadium_basic():
     data.extend(int.from_bytes(struct.pack('>d', 0.0), 'big').to_bytes(8, 'big'))    # goal_line
     data.extend((0).to_bytes(4, 'big'))  # color
     
-    # Max view width, height
+    # Width, height
     data.extend(int.from_bytes(struct.pack('>d', 250.0), 'big').to_bytes(8, 'big'))
     data.extend(int.from_bytes(struct.pack('>d', 200.0), 'big').to_bytes(8, 'big'))
     
     # Spawn distance
     data.extend(int.from_bytes(struct.pack('>d', 150.0), 'big').to_bytes(8, 'big'))
     
-    # Player physics (7 doubles)
-    for val in [0.5, 0.5, 0.96, 0.1, 0.07, 0.96, 5.0]:
-        data.extend(int.from_bytes(struct.pack('>d', val), 'big').to_bytes(8, 'big'))
+    # Player physics (7 doubles, gravity, cGroup int32, radius, kickback)
+    for val in [0.5, 0.5, 0.96, 0.1, 0.07, 0.96, 5.0, 0.0, 0.0]:
+        data.extend(struct.pack('>d', val))
+    data.extend(struct.pack('>i', 0))
+    data.extend(struct.pack('>dd', 15.0, 0.0))
     
-    # Nullable int32 (max view width override)
-    data.append(0)  # False = no value
+    # uint16 (max view width override)
+    data.extend((0).to_bytes(2, 'big'))
     
     # Camera follow, can store, full reset
     data.extend([0, 1, 0])
@@ -80,6 +83,9 @@ def test_custom_stadium_basic():
     assert stadium.background is not None
     assert stadium.background.width == 200.0
     assert stadium.background.height == 150.0
+    assert stadium.width == 250.0 and stadium.spawn_distance == 150.0
+    assert stadium.player_physics.radius == 15.0
+    assert reader.position == len(data)
     print("✓ Custom stadium basic test passed")
 
 
@@ -123,6 +129,77 @@ def test_stadium_with_replay():
         print("⚠ Replay file not found, skipping test")
 
 
+def test_replay_stadium_compile():
+    """A bundled custom stadium (I.ma segments, cc.ma physics) compiles to geometry."""
+    with open('src/replays/prueba_custom.hbr2', 'rb') as f:
+        reader = BinaryReader(f.read())
+    reader.read_fixed_string(4)
+    reader.skip(4 + 4)
+    reader = BinaryReader(zlib.decompress(reader.read_remaining(), wbits=-15))
+    reader.read_uint16()
+    reader.read_string()
+    reader.skip(1 + 4 + 4 + 2 + 1 + 1)
+    stadium = Stadium.parse(reader)
+
+    assert stadium.width == 300.0 and stadium.height == 200.0
+    assert stadium.player_physics.radius == 15.0
+    assert len(stadium.vertexes) == 27 and len(stadium.segments) == 16
+    assert len(stadium.planes) == 6 and len(stadium.discs) == 3
+    assert [goal.team for goal in stadium.goals] == ["Red"]
+    # El juego aún sigue: lo siguiente es el flag de partida en curso
+    assert reader.read_byte() in (0, 1)
+
+    compiled = stadium.compile()
+    assert len(compiled.segment_a) == 16 and len(compiled.plane_dist) == 6
+    assert compiled.segment_curved.any()
+    assert compiled.disc_radius[0] > 0
+    print("✓ Replay stadium compile test passed")
+
+
+def test_compile():
+    """Stadium.compile: integer masks, curved segment bounds, built-in geometry."""
+    from haxmetrics.models.stadium.segment import Segment
+
+    assert Stadium.parse_mask(64 | 128 | 1) == ["score", "kick", "ball"]
+    assert Stadium.mask_value(["score", "kick", "ball"]) == 193
+    assert Stadium.mask_value(["all", "kick"]) == 63 | 64
+
+    stadium = Stadium().set_custom(True)
+    stadium.set_vertexes([
+        Vertex(-100.0, 0.0, 1.0, ["all"], ["wall"]),
+        Vertex(100.0, 0.0, 1.0, ["all"], ["wall"]),
+    ])
+    stadium.set_segments([
+        Segment(0.0, 1.0, 1.0, ["ball"], ["wall", "c0"]),
+        Segment(0.0, 1.0, 0.5, ["ball"], ["wall"], curve=90.0),
+        Segment(0.0, 1.0, 0.5, ["ball"], ["wall"], curve=-90.0),
+    ])
+    compiled = stadium.compile()
+
+    assert compiled.vertex_pos.shape == (2, 2)
+    assert compiled.vertex_c_mask.tolist() == [63, 63]
+    assert compiled.segment_c_group.tolist() == [32 | 1 << 28, 32, 32]
+    assert compiled.segment_curved.tolist() == [False, True, True]
+    # Curva negativa: extremos invertidos
+    assert compiled.segment_v0.tolist() == [0, 0, 1]
+    # Arco de 90° por debajo de y = 0 (centro en (0, 100)) y su simétrico
+    radius = 100 * 2 ** 0.5
+    assert abs(compiled.segment_min[1, 1] - (100 - radius)) < 1e-9
+    assert compiled.segment_max[1].tolist() == [100.0, 0.0]
+    assert abs(compiled.segment_max[2, 1] - (radius - 100)) < 1e-9
+    assert compiled.segment_min[0].tolist() == [-100.0, 0.0]
+
+    # Estadios predefinidos: geometría de q.Vh (Classic: q.jd)
+    classic = Stadium.parse(BinaryReader(bytes([0])))
+    assert classic.spawn_distance == 277.5 and classic.background.width == 370
+    compiled = classic.compile()
+    assert compiled.segment_a.shape == (14, 2) and len(compiled.plane_dist) == 6
+    assert compiled.goal_team.tolist() == [2, 1]
+    assert compiled.disc_inv_mass.tolist() == [1, 0, 0, 0, 0]
+    assert compiled.disc_c_group[0] == 193
+    print("✓ Stadium compile test passed")
+
+
 if __name__ == "__main__":
     import struct
     
@@ -132,6 +209,8 @@ if __name__ == "__main__":
     test_predefined_stadium()
     test_custom_stadium_basic()
     test_stadium_with_replay()
+    test_replay_stadium_compile()
+    test_compile()
     
     print()
     print("All Stadium tests passed! ✓")
@@ -0,0 +1,103 @@
+"""
+Tests for lazy, deduplicated stadium decoding (StadiumHandle).
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import pickle
+import struct
+
+from benchmarks.synthetic import (
+    ReplayWriter,
+    deflate_raw,
+    stadium_geometry,
+    write_action,
+    write_room,
+    write_stadium,
+)
+from haxmetrics.models.actions.change_stadium import ChangeStadium
+from haxmetrics.models.actions.stadium_update import StadiumUpdate
+from haxmetrics.models.stadium.handle import (
+    StadiumHandle,
+    clear_stadium_cache,
+    stadium_cache_info,
+)
+from haxmetrics.parser import Parser
+
+
+def compressed_stadium(name, elements=16):
+    w = ReplayWriter()
+    write_stadium(w, name=name, **stadium_geometry(elements))
+    return deflate_raw(bytes(w.data))
+
+
+def replay_with_maps(maps):
+    """Replay whose actions are StadiumUpdate / ChangeStadium of ``maps``."""
+    w = ReplayWriter()
+    w.write_uint16_be(0)
+    write_room(w, players=[(1, "host", 1)], **stadium_geometry(8))
+    for i, raw in enumerate(maps):
+        write_action(w, 10, 0, 11 if i % 2 == 0 else 2)
+        w.write_varint(len(raw)).write_bytes(raw)
+    header = b"HBR2" + struct.pack(">II", 3, 10 * len(maps))
+    return header + deflate_raw(bytes(w.data))
+
+
+def test_lazy_and_deduplicated():
+    """Each distinct map is decoded once, on first access."""
+    clear_stadium_cache()
+    big, small = compressed_stadium("Big"), compressed_stadium("Small", 8)
+    actions = Parser(replay_with_maps([big, small, big, big, small])).parse()["actions"]
+
+    expected = [StadiumUpdate, ChangeStadium] * 2 + [StadiumUpdate]
+    assert [type(a) for a in actions] == expected
+    # Parsear no toca la memoria de estadios: ni aciertos ni fallos
+    assert stadium_cache_info() == {
+        "entries": 0,
+        "hits": 0,
+        "misses": 0,
+        "inflated": 0,
+        "decoded": 0,
+    }
+
+    names = [a.get_stadium().name for a in actions]
+    assert names == ["Big", "Small", "Big", "Big", "Small"]
+    assert stadium_cache_info()["decoded"] == 2
+    assert actions[0].get_stadium() is actions[3].get_stadium()
+    assert actions[0].handle.raw is actions[2].handle.raw
+    assert len(actions[1].get_stadium().vertexes) == 8
+
+    assert actions[1].stadium == small
+    assert actions[0].get_data() == {"stadium_data_size": len(actions[0].stadium_data)}
+    print("✓ Lazy and deduplicated test passed")
+
+
+def test_raw_fallback():
+    """Bytes that are not raw deflate are returned as they are."""
+    clear_stadium_cache()
+    handle = StadiumHandle(b"\xff\xff not deflate")
+    assert handle.data == b"\xff\xff not deflate"
+    print("✓ Raw fallback test passed")
+
+
+def test_handle_pickles():
+    """Handles survive the parse cache / worker pickling."""
+    clear_stadium_cache()
+    handle = pickle.loads(pickle.dumps(StadiumHandle(compressed_stadium("Huge"))))
+    assert handle.stadium.name == "Huge"
+    assert stadium_cache_info()["decoded"] == 1
+    print("✓ Handle pickling test passed")
+
+
+if __name__ == "__main__":
+    print("Running stadium handle tests...")
+    print()
+
+    test_lazy_and_deduplicated()
+    test_raw_fallback()
+    test_handle_pickles()
+
+    print()
+    print("All stadium handle tests passed! ✓")
@@ -0,0 +1,109 @@
+"""
+Tests for streaming (chunked) inflate of replays.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import glob
+import io
+import zlib
+
+from haxmetrics.binary_reader import InflateReader
+from haxmetrics.parser import Parser
+
+
+def summarize(replay):
+    room = replay["room_info"]
+    return (
+        replay["version"],
+        replay["duration"],
+        [(m.delta_time, m.type) for m in replay["messages"]],
+        room.name,
+        room.stadium.name,
+        [(p.id, p.name, p.team) for p in replay["players"]],
+        [(a.type, a.frame, a.sender, a.get_data()) for a in replay["actions"]],
+    )
+
+
+def test_inflate_reader_small_chunks():
+    """Reads spanning chunk boundaries return the same values."""
+    payload = bytes(range(256)) * 64
+    compressed = zlib.compress(payload)[2:-4]  # raw deflate
+
+    reader = InflateReader(compressed, chunk_size=7)
+    assert reader.read_byte() == 0
+    assert reader.read_uint16_be() == 0x0102
+    assert reader.read_bytes(300) == payload[3:303]
+    reader.skip(1000)
+    assert reader.get_position() == 1303
+    assert reader.read_uint32_be() == int.from_bytes(payload[1303:1307], "big")
+    assert len(reader.data) < 64  # Only a window is kept
+    assert reader.read_remaining() == payload[1307:]
+    assert reader.eof()
+    print("✓ InflateReader small chunks test passed")
+
+
+def test_inflate_reader_file_source():
+    """A binary file object can be used as compressed source."""
+    payload = b"HaxMetrics" * 1000
+    compressed = zlib.compress(payload)[2:-4]
+
+    reader = InflateReader(io.BytesIO(compressed), chunk_size=16)
+    assert reader.read_fixed_string(10) == "HaxMetrics"
+    assert reader.read_remaining() == payload[10:]
+    print("✓ InflateReader file source test passed")
+
+
+def test_streaming_matches_full_parse():
+    """Streaming and whole-buffer parsing produce the same replay."""
+    for path in sorted(glob.glob("src/replays/LIRS/*.hbr2")):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        full = Parser(data).parse()
+        streamed = Parser(data).parse(streaming=True, chunk_size=512)
+        assert summarize(streamed) == summarize(full), path
+
+        with open(path, "rb") as f:
+            from_file = Parser(f).parse(streaming=True)
+        assert summarize(from_file) == summarize(full), path
+    print("✓ Streaming parse test passed")
+
+
+def test_iter_parse_yields_actions():
+    """iter_parse yields the same actions as parse and can stop early."""
+    with open("src/replays/LIRS/Chile-Uganda.hbr2", "rb") as f:
+        data = f.read()
+
+    full = Parser(data).parse()
+
+    parser = Parser(data)
+    actions = parser.iter_parse(streaming=True)
+    first = next(actions)
+    assert parser.replay["room_info"].name == full["room_info"].name
+    assert (first.type, first.frame, first.sender) == (
+        full["actions"][0].type,
+        full["actions"][0].frame,
+        full["actions"][0].sender,
+    )
+    actions.close()
+    assert parser.replay["actions"] == []
+
+    streamed = [(a.type, a.frame, a.sender) for a in Parser(data).iter_parse()]
+    assert streamed == [(a.type, a.frame, a.sender) for a in full["actions"]]
+    print("✓ iter_parse test passed")
+
+
+if __name__ == "__main__":
+    print("Running streaming tests...")
+    print()
+
+    test_inflate_reader_small_chunks()
+    test_inflate_reader_file_source()
+    test_streaming_matches_full_parse()
+    test_iter_parse_yields_actions()
+
+    print()
+    print("All streaming tests passed! ✓")
@@ -0,0 +1,98 @@
+"""
+Tests for string interning (StringPool) in the readers and parser.
+"""
+
+import sys
+
+sys.path.insert(0, "src")
+
+import os
+import tempfile
+import zlib
+
+from benchmarks.synthetic import ReplayWriter, build_replay
+from haxmetrics.batch import parse_many
+from haxmetrics.binary_reader import BinaryReader, InflateReader, StringPool
+from haxmetrics.parser import Parser
+
+
+def strings(*values):
+    w = ReplayWriter()
+    for value in values:
+        w.write_string(value)
+    return bytes(w.data)
+
+
+def test_reader_interns():
+    """Identical byte slices decode to the same str object."""
+    reader = BinaryReader(strings("alpha", "beta", "alpha", None, "alpha"))
+    first = reader.read_string()
+    assert reader.read_string() == "beta"
+    assert reader.read_string() is first
+    assert reader.read_string() is None
+    assert reader.read_string() is first
+    assert (reader.strings.hits, reader.strings.misses) == (2, 2)
+    assert all(type(key) is bytes for key in reader.strings.strings)
+    print("✓ Reader interning test passed")
+
+
+def test_latin1_fallback():
+    """Invalid UTF-8 still falls back to latin-1."""
+    raw = b"\x05caf\xe9"
+    assert BinaryReader(raw).read_string() == "café"
+    assert BinaryReader(bytearray(raw)).read_string() == "café"
+    print("✓ Latin-1 fallback test passed")
+
+
+def test_inflate_reader_interns():
+    """Streaming reader (mutable window) interns too."""
+    data = strings(*(["pepe", "juan"] * 50))
+    reader = InflateReader(zlib.compress(data)[2:-4], chunk_size=8)
+    values = [reader.read_string() for _ in range(100)]
+    assert values[0] is values[2] is values[98]
+    assert len(reader.strings) == 2
+    print("✓ InflateReader interning test passed")
+
+
+def test_bounded_pool():
+    """A bounded pool is emptied when it fills up."""
+    pool = StringPool(max_size=2)
+    for value in (b"a", b"b", b"c"):
+        pool.decode(value)
+    assert len(pool) == 1
+    assert pool.decode(memoryview(b"c")) == "c"
+    assert pool.hits == 1
+    print("✓ Bounded pool test passed")
+
+
+def test_shared_pool_across_replays():
+    """A pool shared by two parses reuses player names."""
+    pool = StringPool(1000)
+    data = build_replay(500)
+    first = Parser(data, strings=pool).parse()
+    second = Parser(data, strings=pool).parse(streaming=True)
+    for a, b in zip(first["players"], second["players"]):
+        assert a.name is b.name
+    assert second["room_info"].name is first["room_info"].name
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(3):
+            with open(os.path.join(tmp, f"{i}.hbr2"), "wb") as f:
+                f.write(data)
+        result = parse_many(tmp, jobs=1, string_pool=100)
+    assert len(result) == 3 and not result.errors
+    print("✓ Shared pool test passed")
+
+
+if __name__ == "__main__":
+    print("Running string pool tests...")
+    print()
+
+    test_reader_interns()
+    test_latin1_fallback()
+    test_inflate_reader_interns()
+    test_bounded_pool()
+    test_shared_pool_across_replays()
+
+    print()
+    print("All string pool tests passed! ✓")